@@ -2,7 +2,7 @@
 API v1 Router - Main router that includes all endpoint routers
 """
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, brands, influencers, campaigns, tasks, content
+from app.api.v1.endpoints import auth, brands, influencers, campaigns, applications, tasks, content, notifications, messages, events, exports, internal
 
 api_router = APIRouter()
 
@@ -11,6 +11,11 @@ api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(brands.router, prefix="/brands", tags=["Brands"])
 api_router.include_router(influencers.router, prefix="/influencers", tags=["Influencers"])
 api_router.include_router(campaigns.router, prefix="/campaigns", tags=["Campaigns"])
+api_router.include_router(applications.router, prefix="/applications", tags=["Applications"])
 api_router.include_router(tasks.router, prefix="/tasks", tags=["Tasks"])
 api_router.include_router(content.router, prefix="/content", tags=["Content"])
-
+api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
+api_router.include_router(messages.router, prefix="/messages", tags=["Messages"])
+api_router.include_router(events.router, prefix="/events", tags=["Events"])
+api_router.include_router(exports.router, prefix="/exports", tags=["Exports"])
+api_router.include_router(internal.router, prefix="/internal", tags=["Internal"])
@@ -1,21 +1,27 @@
 """
 API Dependencies
 """
+from dataclasses import replace
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
 from app.core.security import decode_access_token
+from app.core.principal import Principal, get_cached_principal, cache_principal
 from app.models.user import User
+from app.models.brand import Brand
+from app.models.influencer import Influencer
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """Dependency to get current authenticated user"""
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """Dependency to get current authenticated user (served from the principal cache when possible)"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -30,22 +36,31 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise credentials_exception
+    principal = await get_cached_principal(user_id)
+    if principal is None:
+        user = await db.get(User, user_id)
+        if user is None:
+            raise credentials_exception
+        principal = Principal.from_user(user)
+        await cache_principal(principal)
     
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is inactive"
         )
     
-    return user
+    # Profile ids never change once created, so the token claims can be trusted
+    return replace(
+        principal,
+        brand_id=payload.get("brand_id"),
+        influencer_id=payload.get("influencer_id")
+    )
 
 
-def get_current_brand_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+async def get_current_brand_user(
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """Dependency to ensure user is a brand"""
     if current_user.role.value != "brand":
         raise HTTPException(
@@ -55,9 +70,9 @@ def get_current_brand_user(
     return current_user
 
 
-def get_current_influencer_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+async def get_current_influencer_user(
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """Dependency to ensure user is an influencer"""
     if current_user.role.value != "influencer":
         raise HTTPException(
@@ -66,3 +81,64 @@ def get_current_influencer_user(
         )
     return current_user
 
+
+async def get_current_admin_user(
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
+    """Dependency to ensure user is an admin"""
+    if current_user.role.value != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This endpoint is only accessible to admins"
+        )
+    return current_user
+
+
+async def resolve_brand_id(principal: Principal, db: AsyncSession) -> Optional[int]:
+    """
+    Get the caller's brand profile id from the token claims
+    Falls back to a lookup for tokens issued before the profile existed
+    """
+    if principal.brand_id is not None:
+        return principal.brand_id
+    result = await db.execute(select(Brand.id).where(Brand.user_id == principal.id))
+    return result.scalar()
+
+
+async def resolve_influencer_id(principal: Principal, db: AsyncSession) -> Optional[int]:
+    """
+    Get the caller's influencer profile id from the token claims
+    Falls back to a lookup for tokens issued before the profile existed
+    """
+    if principal.influencer_id is not None:
+        return principal.influencer_id
+    result = await db.execute(select(Influencer.id).where(Influencer.user_id == principal.id))
+    return result.scalar()
+
+
+async def get_current_brand(
+    current_user: Principal = Depends(get_current_brand_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> int:
+    """Dependency to get the current brand user's brand profile id"""
+    brand_id = await resolve_brand_id(current_user, db)
+    if brand_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Brand profile not found. Please create your brand profile first."
+        )
+    return brand_id
+
+
+async def get_current_influencer(
+    current_user: Principal = Depends(get_current_influencer_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> int:
+    """Dependency to get the current influencer user's influencer profile id"""
+    influencer_id = await resolve_influencer_id(current_user, db)
+    if influencer_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Influencer profile not found. Please create your influencer profile first."
+        )
+    return influencer_id
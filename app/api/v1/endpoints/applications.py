@@ -0,0 +1,138 @@
+"""
+Deal Application Endpoints - Apply, withdraw and list applications
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.core.database import get_async_db
+from app.core.principal import Principal
+from app.models.campaign import Campaign
+from app.models.deal_application import ApplicationStatus, DealApplication
+from app.schemas.application import ApplicationCreate, ApplicationResponse
+from app.services.applications import apply_to_campaign, withdraw_application
+from app.services.ranking import trending_refresher
+from app.api.v1.http_cache import PRIVATE_CACHE_CONTROL, set_cache_headers
+from app.api.v1.pagination import PageParams, get_page_params, paginate, set_next_cursor
+from app.api.v1.dependencies import (
+    get_current_user,
+    get_current_influencer,
+    resolve_brand_id,
+    resolve_influencer_id,
+)
+
+router = APIRouter()
+
+
+@router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
+async def create_application(
+    application_data: ApplicationCreate,
+    influencer_id: int = Depends(get_current_influencer),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Apply to an open deal (influencer only); re-applying revives a withdrawn application"""
+    application = await apply_to_campaign(db, influencer_id, application_data)
+    if application is None:
+        # Nothing written: work out why, off the hot path
+        result = await db.execute(
+            select(DealApplication.id).where(
+                DealApplication.campaign_id == application_data.campaign_id,
+                DealApplication.influencer_id == influencer_id,
+            )
+        )
+        if result.scalar() is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="You have already applied to this deal"
+            )
+        result = await db.execute(select(Campaign.id).where(Campaign.id == application_data.campaign_id))
+        if result.scalar() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Campaign not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This deal is not open for applications"
+        )
+    await db.commit()
+    
+    trending_refresher.mark_dirty([application.campaign_id])
+    return application
+
+
+@router.post("/{application_id}/withdraw", response_model=ApplicationResponse)
+async def withdraw(
+    application_id: int,
+    influencer_id: int = Depends(get_current_influencer),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Withdraw a pending or negotiating application (influencer only)"""
+    application = await withdraw_application(db, application_id, influencer_id)
+    if application is None:
+        result = await db.execute(
+            select(DealApplication.status).where(
+                DealApplication.id == application_id,
+                DealApplication.influencer_id == influencer_id,
+            )
+        )
+        current_status = result.scalar()
+        if current_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Application not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A {current_status.value} application can't be withdrawn"
+        )
+    await db.commit()
+    
+    trending_refresher.mark_dirty([application.campaign_id])
+    return application
+
+
+@router.get("", response_model=List[ApplicationResponse])
+async def list_applications(
+    response: Response,
+    campaign_id: Optional[int] = None,
+    application_status: Optional[ApplicationStatus] = Query(None, alias="status"),
+    page: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    List applications, oldest first, cursor-paginated via X-Next-Cursor
+    Influencers see their own; brands see one of their campaigns' (campaign_id required)
+    """
+    query = select(DealApplication)
+    if current_user.role.value == "influencer":
+        query = query.where(DealApplication.influencer_id == await resolve_influencer_id(current_user, db))
+        if campaign_id is not None:
+            query = query.where(DealApplication.campaign_id == campaign_id)
+    else:
+        if campaign_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="campaign_id is required"
+            )
+        result = await db.execute(select(Campaign.brand_id).where(Campaign.id == campaign_id))
+        owner_id = result.scalar()
+        if owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Campaign not found"
+            )
+        if current_user.role.value != "admin" and owner_id != await resolve_brand_id(current_user, db):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to view this campaign's applications"
+            )
+        query = query.where(DealApplication.campaign_id == campaign_id)
+    if application_status is not None:
+        query = query.where(DealApplication.status == application_status)
+    
+    result = await db.execute(paginate(query, DealApplication.id, page))
+    applications = result.scalars().all()
+    set_cache_headers(response, None, PRIVATE_CACHE_CONTROL)
+    return set_next_cursor(response, applications, page)
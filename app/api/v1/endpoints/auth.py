@@ -3,26 +3,49 @@ Authentication Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
-from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token, decode_access_token
+from app.core.database import get_async_db
+from app.core.principal import Principal
+from app.core.security import (
+    verify_password_async,
+    get_password_hash_async,
+    create_access_token,
+    create_user_access_token,
+    decode_access_token,
+    PasswordHashPoolSaturated,
+)
 from app.core.config import settings
 from app.models.user import User
+from app.models.brand import Brand
+from app.models.influencer import Influencer
 from app.schemas.user import UserCreate, UserResponse, Token
-from app.api.v1.dependencies import get_current_user
+from app.api.v1.dependencies import get_current_user, resolve_brand_id, resolve_influencer_id
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+def _hashing_busy_exception() -> HTTPException:
+    """503 returned when the password hashing pool is saturated"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user"""
     # Check if user already exists
-    existing_user = db.query(User).filter(
-        (User.email == user_data.email) | (User.username == user_data.username)
-    ).first()
+    result = await db.execute(
+        select(User).where(
+            (User.email == user_data.email) | (User.username == user_data.username)
+        )
+    )
+    existing_user = result.scalars().first()
     
     if existing_user:
         raise HTTPException(
@@ -31,7 +54,10 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    try:
+        hashed_password = await get_password_hash_async(user_data.password)
+    except PasswordHashPoolSaturated:
+        raise _hashing_busy_exception()
     new_user = User(
         email=user_data.email,
         username=user_data.username,
@@ -40,8 +66,8 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
 
@@ -49,13 +75,27 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Login and get access token"""
-    # Find user by email
-    user = db.query(User).filter(User.email == form_data.username).first()
+    # Find user by email, along with their profile ids for the token claims
+    result = await db.execute(
+        select(User, Brand.id, Influencer.id)
+        .outerjoin(Brand, Brand.user_id == User.id)
+        .outerjoin(Influencer, Influencer.user_id == User.id)
+        .where(User.email == form_data.username)
+    )
+    row = result.first()
+    user, brand_id, influencer_id = row if row else (None, None, None)
+    
+    try:
+        password_ok = user is not None and await verify_password_async(
+            form_data.password, user.hashed_password
+        )
+    except PasswordHashPoolSaturated:
+        raise _hashing_busy_exception()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -72,14 +112,42 @@ async def login(
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.email, "user_id": user.id, "role": user.role.value},
-        expires_delta=access_token_expires
+        expires_delta=access_token_expires,
+        brand_id=brand_id,
+        influencer_id=influencer_id
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
 
 
+@router.post("/refresh", response_model=Token)
+async def refresh_token(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Issue a fresh access token (picks up profiles created since login)"""
+    brand_id = None
+    influencer_id = None
+    if current_user.role.value == "brand":
+        brand_id = await resolve_brand_id(current_user, db)
+    elif current_user.role.value == "influencer":
+        influencer_id = await resolve_influencer_id(current_user, db)
+    
+    access_token = create_user_access_token(
+        user_id=current_user.id,
+        email=current_user.email,
+        role=current_user.role.value,
+        brand_id=brand_id,
+        influencer_id=influencer_id
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get current authenticated user information"""
-    return current_user
+    return await db.get(User, current_user.id)
 
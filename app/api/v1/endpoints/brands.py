@@ -1,14 +1,26 @@
 """
 Brand Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.principal import Principal
+from app.core.security import create_user_access_token
 from app.models.brand import Brand
-from app.models.user import User
 from app.schemas.brand import BrandCreate, BrandResponse, BrandUpdate
-from app.api.v1.dependencies import get_current_brand_user
+from app.api.v1.http_cache import (
+    entity_etag,
+    etag_matches,
+    not_modified,
+    probe_etag,
+    public_cache_control,
+    set_cache_headers,
+)
+from app.api.v1.pagination import PageParams, get_page_params, paginate, set_next_cursor
+from app.api.v1.serialization import fast_list_response, fast_serialization_enabled, fetch_rows
+from app.api.v1.dependencies import get_current_brand_user, get_current_brand, resolve_brand_id
 
 router = APIRouter()
 
@@ -16,13 +28,17 @@ router = APIRouter()
 @router.post("", response_model=BrandResponse, status_code=status.HTTP_201_CREATED)
 async def create_brand(
     brand_data: BrandCreate,
-    current_user: User = Depends(get_current_brand_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    current_user: Principal = Depends(get_current_brand_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Create a brand profile"""
+    """
+    Create a brand profile
+    A refreshed access token carrying the new brand_id is returned in the X-Access-Token header
+    """
     # Check if brand profile already exists
-    existing_brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
-    if existing_brand:
+    existing_brand_id = await resolve_brand_id(current_user, db)
+    if existing_brand_id is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Brand profile already exists for this user"
@@ -30,19 +46,26 @@ async def create_brand(
     
     new_brand = Brand(**brand_data.dict(), user_id=current_user.id)
     db.add(new_brand)
-    db.commit()
-    db.refresh(new_brand)
+    await db.commit()
+    await db.refresh(new_brand)
+    
+    response.headers["X-Access-Token"] = create_user_access_token(
+        user_id=current_user.id,
+        email=current_user.email,
+        role=current_user.role.value,
+        brand_id=new_brand.id
+    )
     
     return new_brand
 
 
 @router.get("/me", response_model=BrandResponse)
 async def get_my_brand(
-    current_user: User = Depends(get_current_brand_user),
-    db: Session = Depends(get_db)
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's brand profile"""
-    brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
+    brand = await db.get(Brand, brand_id)
     if not brand:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,11 +77,11 @@ async def get_my_brand(
 @router.put("/me", response_model=BrandResponse)
 async def update_my_brand(
     brand_data: BrandUpdate,
-    current_user: User = Depends(get_current_brand_user),
-    db: Session = Depends(get_db)
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update current user's brand profile"""
-    brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
+    brand = await db.get(Brand, brand_id)
     if not brand:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,31 +92,48 @@ async def update_my_brand(
     for field, value in update_data.items():
         setattr(brand, field, value)
     
-    db.commit()
-    db.refresh(brand)
+    await db.commit()
+    await db.refresh(brand)
     
     return brand
 
 
 @router.get("", response_model=List[BrandResponse])
 async def list_brands(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all brands (for discovery)"""
-    brands = db.query(Brand).offset(skip).limit(limit).all()
-    return brands
+    """List all brands (for discovery), cursor-paginated via X-Next-Cursor"""
+    query = paginate(select(Brand), Brand.id, page)
+    set_cache_headers(response, None, public_cache_control())
+    if fast_serialization_enabled():
+        rows = await fetch_rows(db, query, Brand, BrandResponse)
+        return fast_list_response(response, set_next_cursor(response, rows, page))
+    result = await db.execute(query)
+    brands = result.scalars().all()
+    return set_next_cursor(response, brands, page)
 
 
 @router.get("/{brand_id}", response_model=BrandResponse)
-async def get_brand(brand_id: int, db: Session = Depends(get_db)):
-    """Get a specific brand by ID"""
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+async def get_brand(
+    brand_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific brand by ID (conditional GET via If-None-Match)"""
+    if request.headers.get("if-none-match"):
+        etag = await probe_etag(db, Brand, brand_id)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag, public_cache_control())
+    
+    result = await db.execute(select(Brand).where(Brand.id == brand_id))
+    brand = result.scalars().first()
     if not brand:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Brand not found"
         )
+    set_cache_headers(response, entity_etag(brand), public_cache_control())
     return brand
-
@@ -1,15 +1,49 @@
 """
 Campaign Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.models.campaign import Campaign
-from app.models.brand import Brand
-from app.models.user import User
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List, Optional
+from datetime import datetime, timezone
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.principal import Principal
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.content import Content
+from app.models.influencer import Influencer
+from app.models.task import Task, TaskStatus
 from app.schemas.campaign import CampaignCreate, CampaignResponse, CampaignUpdate
-from app.api.v1.dependencies import get_current_user, get_current_brand_user
+from app.schemas.influencer import InfluencerMatch
+from app.schemas.task import BoardCard, BoardColumn, CampaignBoardResponse
+from app.services.counters import counter_buffer
+from app.services.matching import matching_engine
+from app.services.notifications import announces_deal, fan_out_deal_posted_background
+from app.services.ranking import trending_score
+from app.api.v1.http_cache import (
+    PRIVATE_CACHE_CONTROL,
+    entity_etag,
+    etag_matches,
+    not_modified,
+    probe_etag,
+    set_cache_headers,
+)
+from app.api.v1.pagination import (
+    PageParams,
+    get_page_params,
+    paginate,
+    paginate_by_score,
+    set_next_cursor,
+    set_next_score_cursor,
+)
+from app.api.v1.serialization import fast_list_response, fast_serialization_enabled, fetch_rows
+from app.api.v1.dependencies import (
+    get_current_user,
+    get_current_brand,
+    resolve_brand_id,
+    resolve_influencer_id,
+)
 
 router = APIRouter()
 
@@ -17,81 +51,244 @@ router = APIRouter()
 @router.post("", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 async def create_campaign(
     campaign_data: CampaignCreate,
-    current_user: User = Depends(get_current_brand_user),
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Create a new campaign (brand only)"""
-    # Get brand profile
-    brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
-    if not brand:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Brand profile not found. Please create your brand profile first."
-        )
-    
-    campaign_dict = campaign_data.dict()
-    campaign_dict["brand_id"] = brand.id
+    """
+    Create a new campaign (brand only)
+    An active open deal (no influencer assigned) with targeting notifies
+    matching influencers after the response is sent
+    """
+    campaign_dict = campaign_data.dict(exclude_none=True)
+    campaign_dict["brand_id"] = brand_id
+    # Starts on recency alone; views and applications lift it later
+    campaign_dict["trending_score"] = trending_score(0, 0, datetime.now(timezone.utc))
     
     new_campaign = Campaign(**campaign_dict)
     db.add(new_campaign)
-    db.commit()
-    db.refresh(new_campaign)
+    await db.commit()
+    await db.refresh(new_campaign)
+    matching_engine.update_campaign(new_campaign)
+    
+    if announces_deal(new_campaign):
+        background_tasks.add_task(fan_out_deal_posted_background, new_campaign.id)
     
     return new_campaign
 
 
 @router.get("", response_model=List[CampaignResponse])
 async def list_campaigns(
-    skip: int = 0,
-    limit: int = 100,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List campaigns (filtered by user role)"""
+    """List campaigns (filtered by user role), cursor-paginated via X-Next-Cursor"""
     if current_user.role.value == "brand":
-        brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
-        if brand:
-            campaigns = db.query(Campaign).filter(Campaign.brand_id == brand.id).offset(skip).limit(limit).all()
-        else:
-            campaigns = []
+        brand_id = await resolve_brand_id(current_user, db)
+        if not brand_id:
+            return []
+        query = select(Campaign).where(Campaign.brand_id == brand_id)
     elif current_user.role.value == "influencer":
-        from app.models.influencer import Influencer
-        influencer = db.query(Influencer).filter(Influencer.user_id == current_user.id).first()
-        if influencer:
-            campaigns = db.query(Campaign).filter(Campaign.influencer_id == influencer.id).offset(skip).limit(limit).all()
-        else:
-            campaigns = []
+        influencer_id = await resolve_influencer_id(current_user, db)
+        if not influencer_id:
+            return []
+        query = select(Campaign).where(Campaign.influencer_id == influencer_id)
     else:
-        campaigns = db.query(Campaign).offset(skip).limit(limit).all()
+        query = select(Campaign)
+    query = paginate(query, Campaign.id, page)
     
+    if fast_serialization_enabled():
+        rows = await fetch_rows(db, query, Campaign, CampaignResponse)
+        return fast_list_response(response, set_next_cursor(response, rows, page))
+    result = await db.execute(query)
+    campaigns = result.scalars().all()
+    return set_next_cursor(response, campaigns, page)
+
+
+@router.get("/discover", response_model=List[CampaignResponse])
+async def discover_campaigns(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Open deals, trending first, cursor-paginated via X-Next-Cursor
+    Reads the top of ix_campaigns_status_trending_score; scores are kept
+    up to date in the background (app/services/ranking.py)
+    Not shared-cacheable: every page served counts impressions
+    """
+    set_cache_headers(response, None, PRIVATE_CACHE_CONTROL)
+    query = select(Campaign).where(
+        Campaign.status == CampaignStatus.ACTIVE,
+        Campaign.influencer_id.is_(None),
+        Campaign.deadline > datetime.now(timezone.utc),
+    )
+    query = paginate_by_score(query, Campaign.trending_score, Campaign.id, page)
+    
+    if fast_serialization_enabled():
+        rows = set_next_score_cursor(response, await fetch_rows(db, query, Campaign, CampaignResponse), page, "trending_score")
+        counter_buffer.increment_many((row["id"] for row in rows), "impressions")
+        return fast_list_response(response, rows)
+    result = await db.execute(query)
+    campaigns = set_next_score_cursor(response, result.scalars().all(), page, "trending_score")
+    counter_buffer.increment_many((campaign.id for campaign in campaigns), "impressions")
     return campaigns
 
 
+def _count_view(campaign_id: int, current_user: Principal, ref: Optional[str]) -> None:
+    """Buffer a deal view by an influencer (and a click-through when it came from the feed)"""
+    if current_user.role.value != "influencer":
+        return
+    counter_buffer.increment(campaign_id, "view_count")
+    if ref == "discover":
+        counter_buffer.increment(campaign_id, "clicks")
+
+
 @router.get("/{campaign_id}", response_model=CampaignResponse)
 async def get_campaign(
     campaign_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    ref: Optional[str] = None,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get a specific campaign by ID"""
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    """
+    Get a specific campaign by ID (conditional GET via If-None-Match)
+    Influencer views are counted; pass ?ref=discover when opened from the discover feed
+    """
+    if request.headers.get("if-none-match"):
+        etag = await probe_etag(db, Campaign, campaign_id)
+        if etag and etag_matches(request, etag):
+            _count_view(campaign_id, current_user, ref)
+            return not_modified(etag, PRIVATE_CACHE_CONTROL)
+    
+    result = await db.execute(select(Campaign).where(Campaign.id == campaign_id))
+    campaign = result.scalars().first()
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Campaign not found"
         )
+    _count_view(campaign_id, current_user, ref)
+    set_cache_headers(response, entity_etag(campaign), PRIVATE_CACHE_CONTROL)
     return campaign
 
 
+@router.get("/{campaign_id}/board", response_model=CampaignBoardResponse)
+async def get_campaign_board(
+    campaign_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full Kanban board for a campaign: every status column with its cards
+    in rank order, each with its influencer's name and content summary.
+    Loaded in a fixed number of queries regardless of board size.
+    Influencers see only their own cards.
+    """
+    result = await db.execute(select(Campaign.brand_id).where(Campaign.id == campaign_id))
+    owner_id = result.scalar()
+    if owner_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    
+    query = select(Task).where(Task.campaign_id == campaign_id)
+    if current_user.role.value == "brand":
+        if owner_id != await resolve_brand_id(current_user, db):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to view this board"
+            )
+    elif current_user.role.value == "influencer":
+        query = query.where(Task.influencer_id == await resolve_influencer_id(current_user, db))
+    
+    result = await db.execute(
+        query.options(
+            # Many-to-one and one-to-one: both joined into the task query, so
+            # rows aren't multiplied and the board is a single SELECT (a
+            # selectinload would add one query per 500 cards)
+            joinedload(Task.influencer).load_only(Influencer.full_name),
+            joinedload(Task.content).load_only(
+                Content.title, Content.content_type, Content.status,
+                Content.thumbnail_url, Content.platform, Content.updated_at
+            ),
+        ).order_by(Task.position, Task.id)
+    )
+    columns = {task_status: [] for task_status in TaskStatus}
+    for task in result.scalars().all():
+        columns[task.status].append(BoardCard(
+            id=task.id,
+            title=task.title,
+            status=task.status,
+            priority=task.priority,
+            position=task.position,
+            due_date=task.due_date,
+            deliverable_type=task.deliverable_type,
+            influencer_id=task.influencer_id,
+            influencer_name=task.influencer.full_name if task.influencer else None,
+            content=task.content,
+        ))
+    
+    return CampaignBoardResponse(
+        campaign_id=campaign_id,
+        columns=[BoardColumn(status=task_status, tasks=cards) for task_status, cards in columns.items()]
+    )
+
+
+@router.get("/{campaign_id}/matches", response_model=List[InfluencerMatch])
+async def get_campaign_matches(
+    campaign_id: int,
+    limit: int = Query(20, ge=1, le=settings.MAX_MATCH_RESULTS),
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Influencers that best fit a campaign's requirements and targeting, best first (brand only)"""
+    campaign = await db.get(Campaign, campaign_id)
+    if not campaign:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    if campaign.brand_id != brand_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view this campaign's matches"
+        )
+    
+    matches = await matching_engine.influencers_for_campaign(campaign, limit)
+    if not matches:
+        return []
+    result = await db.execute(
+        select(Influencer).where(Influencer.id.in_([influencer_id for influencer_id, _ in matches]))
+    )
+    influencers = {influencer.id: influencer for influencer in result.scalars().all()}
+    # Keep ranking order; skip profiles deleted since the snapshot was taken
+    return [
+        InfluencerMatch(influencer=influencers[influencer_id], score=score)
+        for influencer_id, score in matches if influencer_id in influencers
+    ]
+
+
 @router.put("/{campaign_id}", response_model=CampaignResponse)
 async def update_campaign(
     campaign_id: int,
     campaign_data: CampaignUpdate,
-    current_user: User = Depends(get_current_brand_user),
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Update a campaign (brand only)"""
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    """
+    Update a campaign (brand only)
+    The first time an open deal with targeting becomes active, matching
+    influencers are notified after the response is sent
+    """
+    result = await db.execute(select(Campaign).where(Campaign.id == campaign_id))
+    campaign = result.scalars().first()
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -99,8 +296,7 @@ async def update_campaign(
         )
     
     # Verify ownership
-    brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
-    if campaign.brand_id != brand.id:
+    if campaign.brand_id != brand_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to update this campaign"
@@ -110,8 +306,11 @@ async def update_campaign(
     for field, value in update_data.items():
         setattr(campaign, field, value)
     
-    db.commit()
-    db.refresh(campaign)
+    await db.commit()
+    await db.refresh(campaign)
+    matching_engine.update_campaign(campaign)
+    
+    if announces_deal(campaign):
+        background_tasks.add_task(fan_out_deal_posted_background, campaign.id)
     
     return campaign
-
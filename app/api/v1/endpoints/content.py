@@ -1,16 +1,27 @@
 """
 Content Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.events import publish_events
+from app.core.principal import Principal
+from app.models.campaign import Campaign
 from app.models.content import Content
 from app.models.task import Task
-from app.models.influencer import Influencer
-from app.models.user import User
 from app.schemas.content import ContentCreate, ContentResponse, ContentUpdate
-from app.api.v1.dependencies import get_current_user, get_current_influencer_user
+from app.services.realtime import content_events
+from app.api.v1.http_cache import (
+    PRIVATE_CACHE_CONTROL,
+    entity_etag,
+    etag_matches,
+    not_modified,
+    probe_etag,
+    set_cache_headers,
+)
+from app.api.v1.dependencies import get_current_user, get_current_influencer
 
 router = APIRouter()
 
@@ -19,53 +30,59 @@ router = APIRouter()
 async def create_content(
     task_id: int,
     content_data: ContentCreate,
-    current_user: User = Depends(get_current_influencer_user),
-    db: Session = Depends(get_db)
+    influencer_id: int = Depends(get_current_influencer),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create content submission for a task (influencer only)"""
-    # Verify task exists
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
+    # Verify task exists (with its campaign's brand, for the push event)
+    result = await db.execute(
+        select(Task, Campaign.brand_id).join(Campaign, Campaign.id == Task.campaign_id).where(Task.id == task_id)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    task, brand_id = row
     
     # Verify influencer owns the task
-    influencer = db.query(Influencer).filter(Influencer.user_id == current_user.id).first()
-    if task.influencer_id != influencer.id:
+    if task.influencer_id != influencer_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to submit content for this task"
         )
     
     # Check if content already exists
-    existing_content = db.query(Content).filter(Content.task_id == task_id).first()
+    result = await db.execute(select(Content).where(Content.task_id == task_id))
+    existing_content = result.scalars().first()
     if existing_content:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Content already exists for this task. Use update endpoint instead."
         )
     
-    content_dict = content_data.dict()
+    content_dict = content_data.dict(exclude_none=True)
     content_dict["task_id"] = task_id
     
     new_content = Content(**content_dict)
     db.add(new_content)
-    db.commit()
-    db.refresh(new_content)
+    await db.commit()
+    await db.refresh(new_content)
     
+    await publish_events(content_events("content.created", new_content, brand_id, influencer_id))
     return new_content
 
 
 @router.get("/task/{task_id}", response_model=ContentResponse)
 async def get_content_by_task(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get content for a specific task"""
-    content = db.query(Content).filter(Content.task_id == task_id).first()
+    result = await db.execute(select(Content).where(Content.task_id == task_id))
+    content = result.scalars().first()
     if not content:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,16 +94,25 @@ async def get_content_by_task(
 @router.get("/{content_id}", response_model=ContentResponse)
 async def get_content(
     content_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get a specific content by ID"""
-    content = db.query(Content).filter(Content.id == content_id).first()
+    """Get a specific content by ID (conditional GET via If-None-Match)"""
+    if request.headers.get("if-none-match"):
+        etag = await probe_etag(db, Content, content_id)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag, PRIVATE_CACHE_CONTROL)
+    
+    result = await db.execute(select(Content).where(Content.id == content_id))
+    content = result.scalars().first()
     if not content:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Content not found"
         )
+    set_cache_headers(response, entity_etag(content), PRIVATE_CACHE_CONTROL)
     return content
 
 
@@ -94,16 +120,23 @@ async def get_content(
 async def update_content(
     content_id: int,
     content_data: ContentUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update content (influencer can update, brand can review)"""
-    content = db.query(Content).filter(Content.id == content_id).first()
-    if not content:
+    result = await db.execute(
+        select(Content, Task.influencer_id, Campaign.brand_id)
+        .join(Task, Task.id == Content.task_id)
+        .join(Campaign, Campaign.id == Task.campaign_id)
+        .where(Content.id == content_id)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Content not found"
         )
+    content, influencer_id, brand_id = row
     
     update_data = content_data.dict(exclude_unset=True)
     
@@ -116,8 +149,8 @@ async def update_content(
     for field, value in update_data.items():
         setattr(content, field, value)
     
-    db.commit()
-    db.refresh(content)
+    await db.commit()
+    await db.refresh(content)
     
+    await publish_events(content_events("content.updated", content, brand_id, influencer_id))
     return content
-
@@ -0,0 +1,86 @@
+"""
+Event Endpoints - Real-time push over Server-Sent Events
+"""
+import asyncio
+import time
+from dataclasses import replace
+from typing import Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.events import Subscription, event_broker
+from app.core.security import decode_access_token
+from app.services.realtime import subscriber_channels
+from app.api.v1.dependencies import get_current_user, resolve_brand_id, resolve_influencer_id
+
+router = APIRouter()
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
+
+# Client reconnect delay suggested in the stream
+RETRY_MS = 3000
+
+
+def _frame(event_type: str, data) -> str:
+    return f"event: {event_type}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+async def _event_stream(subscription: Subscription, expires_at: float):
+    yield f"retry: {RETRY_MS}\n\n"
+    async with subscription:
+        while True:
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                # The client reconnects with a fresh token
+                yield _frame("token.expired", {})
+                return
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=min(settings.EVENTS_KEEPALIVE_SECONDS, remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                # Broker closing (server shutdown)
+                return
+            yield _frame(event["type"], event["data"])
+
+
+@router.get("/stream")
+async def stream_events(
+    access_token: Optional[str] = None,
+    bearer_token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Server-Sent Events stream of the caller's task, content and notification updates
+    Authenticate with the usual Bearer header, or ?access_token= for EventSource,
+    which cannot send headers. The stream ends when the token expires.
+    """
+    token = bearer_token or access_token
+    payload = decode_access_token(token) if token else None
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    principal = await get_current_user(token, db)
+    # Tokens issued before the profile existed carry no profile id claim
+    if principal.role.value == "brand" and principal.brand_id is None:
+        principal = replace(principal, brand_id=await resolve_brand_id(principal, db))
+    elif principal.role.value == "influencer" and principal.influencer_id is None:
+        principal = replace(principal, influencer_id=await resolve_influencer_id(principal, db))
+    # The stream never touches the database: don't hold a pooled connection for its lifetime
+    await db.close()
+    
+    subscription = event_broker.subscribe(subscriber_channels(principal))
+    return StreamingResponse(
+        _event_stream(subscription, float(payload["exp"])),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,77 @@
+"""
+Export Endpoints - Streaming NDJSON/CSV exports for brands
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.core.database import get_async_db
+from app.models.campaign import Campaign
+from app.services.export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    campaigns_export_query,
+    roster_export_query,
+    stream_export,
+    tasks_export_query,
+)
+from app.api.v1.dependencies import get_current_brand
+
+router = APIRouter()
+
+
+def _export_response(query, name: str, fmt: ExportFormat) -> StreamingResponse:
+    return StreamingResponse(
+        stream_export(query, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{fmt.value}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+@router.get("/campaigns")
+async def export_campaigns(
+    format: ExportFormat = ExportFormat.NDJSON,
+    brand_id: int = Depends(get_current_brand)
+):
+    """Stream all of the brand's campaigns"""
+    query = campaigns_export_query(brand_id)
+    return _export_response(query, "campaigns", format)
+
+
+@router.get("/tasks")
+async def export_tasks(
+    campaign_id: Optional[int] = None,
+    format: ExportFormat = ExportFormat.NDJSON,
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Stream the brand's tasks (optionally one campaign's) with their content status"""
+    if campaign_id is not None:
+        result = await db.execute(select(Campaign.brand_id).where(Campaign.id == campaign_id))
+        owner_id = result.scalar()
+        if owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Campaign not found"
+            )
+        if owner_id != brand_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to export this campaign"
+            )
+    query = tasks_export_query(brand_id, campaign_id)
+    return _export_response(query, f"tasks-{campaign_id}" if campaign_id else "tasks", format)
+
+
+@router.get("/roster")
+async def export_roster(
+    format: ExportFormat = ExportFormat.NDJSON,
+    brand_id: int = Depends(get_current_brand)
+):
+    """Stream the influencers the brand has worked with, with per-influencer task counts"""
+    query = roster_export_query(brand_id)
+    return _export_response(query, "roster", format)
@@ -1,14 +1,42 @@
 """
 Influencer Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.principal import Principal
+from app.core.security import create_user_access_token
+from app.models.campaign import Campaign
 from app.models.influencer import Influencer
-from app.models.user import User
+from app.schemas.campaign import CampaignMatch
 from app.schemas.influencer import InfluencerCreate, InfluencerResponse, InfluencerUpdate
-from app.api.v1.dependencies import get_current_influencer_user
+from app.services.matching import matching_engine
+from app.services.search import build_influencer_search
+from app.api.v1.http_cache import (
+    entity_etag,
+    etag_matches,
+    not_modified,
+    probe_etag,
+    public_cache_control,
+    set_cache_headers,
+)
+from app.api.v1.pagination import (
+    PageParams,
+    get_page_params,
+    paginate,
+    paginate_ranked,
+    set_next_cursor,
+    set_next_ranked_cursor,
+)
+from app.api.v1.serialization import fast_list_response, fast_serialization_enabled, fetch_rows
+from app.api.v1.dependencies import (
+    get_current_influencer_user,
+    get_current_influencer,
+    resolve_influencer_id,
+)
 
 router = APIRouter()
 
@@ -16,13 +44,17 @@ router = APIRouter()
 @router.post("", response_model=InfluencerResponse, status_code=status.HTTP_201_CREATED)
 async def create_influencer(
     influencer_data: InfluencerCreate,
-    current_user: User = Depends(get_current_influencer_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    current_user: Principal = Depends(get_current_influencer_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Create an influencer profile"""
+    """
+    Create an influencer profile
+    A refreshed access token carrying the new influencer_id is returned in the X-Access-Token header
+    """
     # Check if influencer profile already exists
-    existing_influencer = db.query(Influencer).filter(Influencer.user_id == current_user.id).first()
-    if existing_influencer:
+    existing_influencer_id = await resolve_influencer_id(current_user, db)
+    if existing_influencer_id is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Influencer profile already exists for this user"
@@ -30,19 +62,27 @@ async def create_influencer(
     
     new_influencer = Influencer(**influencer_data.dict(), user_id=current_user.id)
     db.add(new_influencer)
-    db.commit()
-    db.refresh(new_influencer)
+    await db.commit()
+    await db.refresh(new_influencer)
+    matching_engine.update_influencer(new_influencer)
+    
+    response.headers["X-Access-Token"] = create_user_access_token(
+        user_id=current_user.id,
+        email=current_user.email,
+        role=current_user.role.value,
+        influencer_id=new_influencer.id
+    )
     
     return new_influencer
 
 
 @router.get("/me", response_model=InfluencerResponse)
 async def get_my_influencer(
-    current_user: User = Depends(get_current_influencer_user),
-    db: Session = Depends(get_db)
+    influencer_id: int = Depends(get_current_influencer),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's influencer profile"""
-    influencer = db.query(Influencer).filter(Influencer.user_id == current_user.id).first()
+    influencer = await db.get(Influencer, influencer_id)
     if not influencer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,11 +94,11 @@ async def get_my_influencer(
 @router.put("/me", response_model=InfluencerResponse)
 async def update_my_influencer(
     influencer_data: InfluencerUpdate,
-    current_user: User = Depends(get_current_influencer_user),
-    db: Session = Depends(get_db)
+    influencer_id: int = Depends(get_current_influencer),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update current user's influencer profile"""
-    influencer = db.query(Influencer).filter(Influencer.user_id == current_user.id).first()
+    influencer = await db.get(Influencer, influencer_id)
     if not influencer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,43 +109,99 @@ async def update_my_influencer(
     for field, value in update_data.items():
         setattr(influencer, field, value)
     
-    db.commit()
-    db.refresh(influencer)
+    await db.commit()
+    await db.refresh(influencer)
+    matching_engine.update_influencer(influencer)
     
     return influencer
 
 
+@router.get("/me/matches", response_model=List[CampaignMatch])
+async def get_my_matches(
+    limit: int = Query(20, ge=1, le=settings.MAX_MATCH_RESULTS),
+    influencer_id: int = Depends(get_current_influencer),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Open deals that best fit the current influencer's profile, best first"""
+    influencer = await db.get(Influencer, influencer_id)
+    if not influencer:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Influencer profile not found"
+        )
+    
+    matches = await matching_engine.campaigns_for_influencer(influencer, limit)
+    if not matches:
+        return []
+    result = await db.execute(select(Campaign).where(Campaign.id.in_([campaign_id for campaign_id, _ in matches])))
+    campaigns = {campaign.id: campaign for campaign in result.scalars().all()}
+    # Keep ranking order; skip deals deleted since the snapshot was taken
+    return [
+        CampaignMatch(campaign=campaigns[campaign_id], score=score)
+        for campaign_id, score in matches if campaign_id in campaigns
+    ]
+
+
 @router.get("", response_model=List[InfluencerResponse])
 async def list_influencers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    q: Optional[str] = None,
     niche: Optional[str] = None,
     min_followers: Optional[int] = None,
     location: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all influencers with optional filters (for brand discovery)"""
-    query = db.query(Influencer)
+    """
+    List all influencers with optional filters (for brand discovery), cursor-paginated via X-Next-Cursor
+    q searches name, niche, location and bio; text filters match word prefixes and
+    results are ordered by relevance
+    """
+    set_cache_headers(response, None, public_cache_control())
+    search_query = await build_influencer_search(
+        db, q=q, niche=niche, location=location, min_followers=min_followers
+    )
+    if search_query is not None:
+        query = paginate_ranked(search_query, page)
+        if fast_serialization_enabled():
+            rows = await fetch_rows(db, query, Influencer, InfluencerResponse)
+            return fast_list_response(response, set_next_ranked_cursor(response, rows, page))
+        result = await db.execute(query)
+        influencers = result.scalars().all()
+        return set_next_ranked_cursor(response, influencers, page)
     
-    if niche:
-        query = query.filter(Influencer.niche.ilike(f"%{niche}%"))
+    query = select(Influencer)
     if min_followers:
-        query = query.filter(Influencer.total_followers >= min_followers)
-    if location:
-        query = query.filter(Influencer.location.ilike(f"%{location}%"))
+        query = query.where(Influencer.total_followers >= min_followers)
+    query = paginate(query, Influencer.id, page)
     
-    influencers = query.offset(skip).limit(limit).all()
-    return influencers
+    if fast_serialization_enabled():
+        rows = await fetch_rows(db, query, Influencer, InfluencerResponse)
+        return fast_list_response(response, set_next_cursor(response, rows, page))
+    result = await db.execute(query)
+    influencers = result.scalars().all()
+    return set_next_cursor(response, influencers, page)
 
 
 @router.get("/{influencer_id}", response_model=InfluencerResponse)
-async def get_influencer(influencer_id: int, db: Session = Depends(get_db)):
-    """Get a specific influencer by ID"""
-    influencer = db.query(Influencer).filter(Influencer.id == influencer_id).first()
+async def get_influencer(
+    influencer_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific influencer by ID (conditional GET via If-None-Match)"""
+    if request.headers.get("if-none-match"):
+        etag = await probe_etag(db, Influencer, influencer_id)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag, public_cache_control())
+    
+    result = await db.execute(select(Influencer).where(Influencer.id == influencer_id))
+    influencer = result.scalars().first()
     if not influencer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Influencer not found"
         )
+    set_cache_headers(response, entity_etag(influencer), public_cache_control())
     return influencer
-
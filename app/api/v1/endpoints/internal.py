@@ -0,0 +1,22 @@
+"""
+Internal Endpoints - Operational metrics (admin only)
+"""
+from fastapi import APIRouter, Depends
+from app.core.database import get_pool_status
+from app.core.security import password_hash_pool
+from app.core.principal import Principal
+from app.api.v1.dependencies import get_current_admin_user
+
+router = APIRouter()
+
+
+@router.get("/password-hashing")
+async def get_password_hashing_stats(current_user: Principal = Depends(get_current_admin_user)):
+    """Password hashing pool counters, queue wait and hash time"""
+    return password_hash_pool.stats()
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(current_user: Principal = Depends(get_current_admin_user)):
+    """Database connection pool gauges, connection wait time and timeouts"""
+    return get_pool_status()
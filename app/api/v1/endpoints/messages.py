@@ -0,0 +1,125 @@
+"""
+Message Endpoints - Direct and campaign conversations
+"""
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from app.core.database import get_async_db
+from app.core.events import publish_events
+from app.core.principal import Principal
+from app.models.campaign import Campaign
+from app.models.conversation import ConversationParticipant
+from app.models.message import Message
+from app.models.user import User
+from app.schemas.message import ConversationReadResponse, ConversationResponse, MessageCreate, MessageResponse
+from app.services.messaging import (
+    conversation_key,
+    find_conversation,
+    inbox_query,
+    mark_conversation_read,
+    send_message,
+    start_conversation,
+)
+from app.services.realtime import message_events
+from app.api.v1.http_cache import PRIVATE_CACHE_CONTROL, set_cache_headers
+from app.api.v1.pagination import PageParams, get_page_params, paginate, set_next_cursor
+from app.api.v1.dependencies import get_current_user
+
+router = APIRouter()
+
+
+@router.post("", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
+async def create_message(
+    message_data: MessageCreate,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Send a message, starting the conversation with the recipient if needed"""
+    if message_data.recipient_id == current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You can't message yourself"
+        )
+    
+    key = conversation_key(message_data.campaign_id, current_user.id, message_data.recipient_id)
+    conversation_id = await find_conversation(db, key)
+    if conversation_id is None:
+        # First message of the thread: an existing thread already vouches for both
+        result = await db.execute(
+            select(User.id).where(User.id == message_data.recipient_id, User.is_active == True)  # noqa: E712
+        )
+        if result.scalar() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Recipient not found"
+            )
+        if message_data.campaign_id is not None:
+            result = await db.execute(select(Campaign.id).where(Campaign.id == message_data.campaign_id))
+            if result.scalar() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Campaign not found"
+                )
+        conversation_id = await start_conversation(
+            db, key, message_data.campaign_id, (current_user.id, message_data.recipient_id)
+        )
+    
+    message = await send_message(db, conversation_id, current_user.id, message_data)
+    await db.commit()
+    
+    await publish_events(message_events(message))
+    return message
+
+
+@router.get("/conversations", response_model=List[ConversationResponse])
+async def list_conversations(
+    response: Response,
+    unread_only: bool = False,
+    page: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """The caller's conversations, most recently active first, cursor-paginated via X-Next-Cursor"""
+    query = inbox_query(current_user.id, unread_only)
+    result = await db.execute(paginate(query, ConversationParticipant.last_message_id, page, descending=True))
+    conversations = [ConversationResponse(**row._mapping) for row in result.all()]
+    set_cache_headers(response, None, PRIVATE_CACHE_CONTROL)
+    return set_next_cursor(response, conversations, page, key="last_message_id")
+
+
+@router.get("/conversations/{conversation_id}", response_model=List[MessageResponse])
+async def list_conversation_messages(
+    conversation_id: int,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """A conversation's messages, newest first, cursor-paginated via X-Next-Cursor"""
+    if await db.get(ConversationParticipant, (conversation_id, current_user.id)) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    query = select(Message).where(Message.conversation_id == conversation_id)
+    result = await db.execute(paginate(query, Message.id, page, descending=True))
+    messages = result.scalars().all()
+    set_cache_headers(response, None, PRIVATE_CACHE_CONTROL)
+    return set_next_cursor(response, messages, page)
+
+
+@router.post("/conversations/{conversation_id}/read", response_model=ConversationReadResponse)
+async def read_conversation(
+    conversation_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Mark the messages you received in a conversation read"""
+    marked = await mark_conversation_read(db, conversation_id, current_user.id)
+    if marked is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    return ConversationReadResponse(marked_read=marked)
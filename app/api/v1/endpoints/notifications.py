@@ -0,0 +1,68 @@
+"""
+Notification Endpoints - Inbox, unread badge and mark-read
+"""
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from app.core.database import get_async_db
+from app.core.events import publish_events
+from app.core.principal import Principal
+from app.models.notification import Notification
+from app.models.user import User
+from app.schemas.notification import (
+    NotificationMarkRead,
+    NotificationMarkReadResponse,
+    NotificationResponse,
+    UnreadCountResponse,
+)
+from app.services.notifications import mark_read
+from app.services.realtime import unread_count_event
+from app.api.v1.http_cache import PRIVATE_CACHE_CONTROL, set_cache_headers
+from app.api.v1.pagination import PageParams, get_page_params, paginate, set_next_cursor
+from app.api.v1.dependencies import get_current_user
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[NotificationResponse])
+async def list_notifications(
+    response: Response,
+    unread_only: bool = False,
+    page: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """The caller's inbox, newest first, cursor-paginated via X-Next-Cursor"""
+    query = select(Notification).where(Notification.user_id == current_user.id)
+    if unread_only:
+        query = query.where(Notification.is_read == False)  # noqa: E712
+    result = await db.execute(paginate(query, Notification.id, page, descending=True))
+    notifications = result.scalars().all()
+    set_cache_headers(response, None, PRIVATE_CACHE_CONTROL)
+    return set_next_cursor(response, notifications, page)
+
+
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def get_unread_count(
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Unread badge: reads the caller's denormalized counter, no COUNT over the inbox"""
+    result = await db.execute(select(User.unread_notification_count).where(User.id == current_user.id))
+    set_cache_headers(response, None, PRIVATE_CACHE_CONTROL)
+    return UnreadCountResponse(unread=result.scalar() or 0)
+
+
+@router.post("/read", response_model=NotificationMarkReadResponse)
+async def mark_notifications_read(
+    read_data: NotificationMarkRead,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Mark the given notifications (or all with all=true) read in a single UPDATE"""
+    marked, unread = await mark_read(db, current_user.id, None if read_data.all else read_data.ids)
+    if marked:
+        await publish_events(unread_count_event(current_user.id, unread))
+    return NotificationMarkReadResponse(marked_read=marked, unread=unread)
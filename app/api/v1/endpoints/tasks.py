@@ -1,17 +1,52 @@
 """
 Task Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.events import publish_events
+from app.core.principal import Principal
 from app.models.task import Task
 from app.models.campaign import Campaign
-from app.models.brand import Brand
 from app.models.influencer import Influencer
-from app.models.user import User
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
-from app.api.v1.dependencies import get_current_user, get_current_brand_user
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkItemResult,
+    TaskBulkResponse,
+    TaskCreate,
+    TaskMoveRequest,
+    TaskResponse,
+    TaskUpdate,
+)
+from app.services.kanban import (
+    POSITION_STEP,
+    RANK_MIN_GAP,
+    RANK_REBALANCE_GAP,
+    gap_between,
+    next_position_query,
+    position_between,
+    rebalance_column,
+    rebalance_column_background,
+)
+from app.services.realtime import task_events
+from app.api.v1.http_cache import (
+    PRIVATE_CACHE_CONTROL,
+    entity_etag,
+    etag_matches,
+    not_modified,
+    probe_etag,
+    set_cache_headers,
+)
+from app.api.v1.pagination import PageParams, get_page_params, paginate, set_next_cursor
+from app.api.v1.serialization import fast_list_response, fast_serialization_enabled, fetch_rows
+from app.api.v1.dependencies import (
+    get_current_user,
+    get_current_brand,
+    resolve_brand_id,
+    resolve_influencer_id,
+)
 
 router = APIRouter()
 
@@ -19,28 +54,28 @@ router = APIRouter()
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_brand_user),
-    db: Session = Depends(get_db)
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new task (brand only)"""
     # Verify campaign exists and belongs to brand
-    campaign = db.query(Campaign).filter(Campaign.id == task_data.campaign_id).first()
+    result = await db.execute(select(Campaign).where(Campaign.id == task_data.campaign_id))
+    campaign = result.scalars().first()
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Campaign not found"
         )
     
-    brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
-    if campaign.brand_id != brand.id:
+    if campaign.brand_id != brand_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to create tasks for this campaign"
         )
     
     # Verify influencer exists
-    influencer = db.query(Influencer).filter(Influencer.id == task_data.influencer_id).first()
-    if not influencer:
+    result = await db.execute(select(Influencer.id).where(Influencer.id == task_data.influencer_id))
+    if result.scalar() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Influencer not found"
@@ -50,49 +85,272 @@ async def create_task(
     # campaign_id is already in task_dict from TaskCreate schema
     
     new_task = Task(**task_dict)
+    # Bottom of the To Do column, computed in the INSERT itself
+    new_task.position = next_position_query(task_data.campaign_id)
     db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
+    await db.commit()
+    await db.refresh(new_task)
     
+    await publish_events(task_events("task.created", [new_task], brand_id))
     return new_task
 
 
+@router.post("/bulk", response_model=TaskBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    bulk_data: TaskBulkCreate,
+    brand_id: int = Depends(get_current_brand),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create many tasks for one campaign (brand only)
+    Ownership is checked once and all influencers with a single IN query;
+    valid items are inserted in one transaction, unknown influencers are
+    reported per item
+    """
+    result = await db.execute(select(Campaign.brand_id).where(Campaign.id == bulk_data.campaign_id))
+    owner_id = result.scalar()
+    if owner_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    
+    if owner_id != brand_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to create tasks for this campaign"
+        )
+    
+    influencer_ids = {item.influencer_id for item in bulk_data.tasks}
+    result = await db.execute(select(Influencer.id).where(Influencer.id.in_(influencer_ids)))
+    existing_ids = set(result.scalars().all())
+    
+    # New cards go below the existing To Do column, in request order
+    result = await db.execute(select(next_position_query(bulk_data.campaign_id)))
+    position = result.scalar()
+    
+    results = []
+    rows = []
+    for index, item in enumerate(bulk_data.tasks):
+        if item.influencer_id not in existing_ids:
+            results.append(TaskBulkItemResult(index=index, created=False, error="Influencer not found"))
+            continue
+        rows.append({**item.dict(), "campaign_id": bulk_data.campaign_id, "position": position})
+        position += POSITION_STEP
+        results.append(None)  # filled from RETURNING below
+    
+    if rows:
+        # One multi-row INSERT ... RETURNING. Ids are assigned in VALUES order,
+        # so sorting by id lines rows up with the request (asking SQLAlchemy for
+        # sort_by_parameter_order degrades to one INSERT per row on SQLite)
+        result = await db.execute(insert(Task).returning(Task), rows)
+        created_tasks = sorted(result.scalars().all(), key=lambda task: task.id)
+        await db.commit()
+        remaining = iter(created_tasks)
+        results = [
+            item if item is not None
+            else TaskBulkItemResult(index=index, created=True, task=TaskResponse.model_validate(next(remaining)))
+            for index, item in enumerate(results)
+        ]
+        await publish_events(task_events("task.created", created_tasks, brand_id))
+    
+    return TaskBulkResponse(
+        campaign_id=bulk_data.campaign_id,
+        created=len(rows),
+        failed=len(bulk_data.tasks) - len(rows),
+        results=results
+    )
+
+
+@router.post("/move", response_model=List[TaskResponse])
+async def move_tasks(
+    move_data: TaskMoveRequest,
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Move one or more cards on a campaign board in one request
+    Each moved card gets a rank between its new neighbours, so only the
+    moved rows are written. Moves are applied in order and may reference
+    cards moved earlier in the same request.
+    """
+    result = await db.execute(select(Campaign.brand_id).where(Campaign.id == move_data.campaign_id))
+    owner_id = result.scalar()
+    if owner_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    
+    influencer_id = None
+    if current_user.role.value == "brand":
+        if owner_id != await resolve_brand_id(current_user, db):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to move tasks on this board"
+            )
+    elif current_user.role.value == "influencer":
+        influencer_id = await resolve_influencer_id(current_user, db)
+        if influencer_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Influencer profile not found. Please create your influencer profile first."
+            )
+    
+    # Moved cards and their neighbours in one query
+    referenced_ids = set()
+    for move in move_data.moves:
+        referenced_ids.update(i for i in (move.task_id, move.after_id, move.before_id) if i is not None)
+    result = await db.execute(
+        select(Task.id, Task.influencer_id, Task.status, Task.position)
+        .where(Task.id.in_(referenced_ids), Task.campaign_id == move_data.campaign_id)
+    )
+    cards = {
+        row.id: {"influencer_id": row.influencer_id, "status": row.status, "position": row.position}
+        for row in result
+    }
+    missing = referenced_ids - cards.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {min(missing)} not found on this board"
+        )
+    
+    if current_user.role.value == "influencer" and any(
+        cards[move.task_id]["influencer_id"] != influencer_id for move in move_data.moves
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only move your own tasks"
+        )
+    
+    column_ends = {}
+    pending = {}  # task id -> row for the next bulk UPDATE
+    moved_ids = []
+    compact = set()
+    for move in move_data.moves:
+        card = cards[move.task_id]
+        target = move.status or card["status"]
+        neighbours = []
+        for neighbour_id in (move.after_id, move.before_id):
+            if neighbour_id is None:
+                neighbours.append(None)
+                continue
+            if neighbour_id == move.task_id or cards[neighbour_id]["status"] != target:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Task {neighbour_id} is not a neighbour in the {target.value} column"
+                )
+            neighbours.append(cards[neighbour_id]["position"])
+        after, before = neighbours
+        # Cards are ordered by (position, id): after_id must sort above before_id
+        if after is not None and before is not None and (after, move.after_id) >= (before, move.before_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Task {move.after_id} is not above task {move.before_id} in the {target.value} column"
+            )
+        
+        if after is None and before is None:
+            if target not in column_ends:
+                result = await db.execute(select(next_position_query(move_data.campaign_id, target)))
+                column_ends[target] = result.scalar() - POSITION_STEP
+            after = column_ends[target]
+        elif gap_between(after, before) < RANK_MIN_GAP:
+            # No room left between the neighbours: write the moves so far,
+            # renumber the column, then re-read the neighbours' new ranks
+            await _write_moves(db, pending)
+            await rebalance_column(db, move_data.campaign_id, target)
+            result = await db.execute(select(Task.id, Task.position).where(Task.id.in_(cards.keys())))
+            for row in result:
+                cards[row.id]["position"] = row.position
+            after = cards[move.after_id]["position"]
+            before = cards[move.before_id]["position"]
+            column_ends.pop(target, None)
+        
+        position = position_between(after, before)
+        if gap_between(after, before) < RANK_REBALANCE_GAP:
+            compact.add(target)
+        card.update(status=target, position=position)
+        if target in column_ends:
+            column_ends[target] = max(column_ends[target], position)
+        pending[move.task_id] = {"id": move.task_id, "status": target, "position": position}
+        if move.task_id not in moved_ids:
+            moved_ids.append(move.task_id)
+    
+    await _write_moves(db, pending)
+    await db.commit()
+    
+    for target in compact:
+        background_tasks.add_task(rebalance_column_background, move_data.campaign_id, target)
+    
+    result = await db.execute(
+        select(Task).where(Task.id.in_(moved_ids)).execution_options(populate_existing=True)
+    )
+    tasks = {task.id: task for task in result.scalars().all()}
+    moved = [tasks[task_id] for task_id in moved_ids]
+    await publish_events(task_events("task.updated", moved, owner_id))
+    return moved
+
+
+async def _write_moves(db: AsyncSession, pending: dict):
+    """Persist pending moves as one executemany UPDATE by primary key"""
+    if pending:
+        await db.execute(update(Task), list(pending.values()))
+        pending.clear()
+
+
 @router.get("", response_model=List[TaskResponse])
 async def list_tasks(
+    response: Response,
     campaign_id: int = None,
-    skip: int = 0,
-    limit: int = 100,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    page: PageParams = Depends(get_page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List tasks (filtered by user role and campaign)"""
-    query = db.query(Task)
+    """List tasks (filtered by user role and campaign), cursor-paginated via X-Next-Cursor"""
+    query = select(Task)
     
     if campaign_id:
-        query = query.filter(Task.campaign_id == campaign_id)
+        query = query.where(Task.campaign_id == campaign_id)
     
     if current_user.role.value == "influencer":
-        influencer = db.query(Influencer).filter(Influencer.user_id == current_user.id).first()
-        if influencer:
-            query = query.filter(Task.influencer_id == influencer.id)
+        influencer_id = await resolve_influencer_id(current_user, db)
+        if influencer_id:
+            query = query.where(Task.influencer_id == influencer_id)
+    
+    query = paginate(query, Task.id, page)
     
-    tasks = query.offset(skip).limit(limit).all()
-    return tasks
+    if fast_serialization_enabled():
+        rows = await fetch_rows(db, query, Task, TaskResponse)
+        return fast_list_response(response, set_next_cursor(response, rows, page))
+    result = await db.execute(query)
+    tasks = result.scalars().all()
+    return set_next_cursor(response, tasks, page)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get a specific task by ID"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    """Get a specific task by ID (conditional GET via If-None-Match)"""
+    if request.headers.get("if-none-match"):
+        etag = await probe_etag(db, Task, task_id)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag, PRIVATE_CACHE_CONTROL)
+    
+    result = await db.execute(select(Task).where(Task.id == task_id))
+    task = result.scalars().first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    set_cache_headers(response, entity_etag(task), PRIVATE_CACHE_CONTROL)
     return task
 
 
@@ -100,40 +358,46 @@ async def get_task(
 async def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a task"""
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
+    # The campaign's brand comes along for the permission check and the push event
+    result = await db.execute(
+        select(Task, Campaign.brand_id).join(Campaign, Campaign.id == Task.campaign_id).where(Task.id == task_id)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    task, owner_id = row
     
     # Verify permissions
     if current_user.role.value == "brand":
-        brand = db.query(Brand).filter(Brand.user_id == current_user.id).first()
-        campaign = db.query(Campaign).filter(Campaign.id == task.campaign_id).first()
-        if campaign.brand_id != brand.id:
+        if owner_id != await resolve_brand_id(current_user, db):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to update this task"
             )
     elif current_user.role.value == "influencer":
-        influencer = db.query(Influencer).filter(Influencer.user_id == current_user.id).first()
-        if task.influencer_id != influencer.id:
+        influencer_id = await resolve_influencer_id(current_user, db)
+        if task.influencer_id != influencer_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to update this task"
             )
     
     update_data = task_data.dict(exclude_unset=True)
+    if update_data.get("status") not in (None, task.status) and "position" not in update_data:
+        # Changing column without a rank: drop the card at the bottom
+        update_data["position"] = next_position_query(task.campaign_id, update_data["status"])
     for field, value in update_data.items():
         setattr(task, field, value)
     
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await db.refresh(task)
     
+    await publish_events(task_events("task.updated", [task], owner_id))
     return task
-
@@ -0,0 +1,82 @@
+"""
+HTTP caching helpers: ETags, conditional GET and Cache-Control
+
+ETags are weak validators derived from the row id plus updated_at (or
+created_at for rows never updated). When a request carries If-None-Match,
+endpoints first run a cheap version probe (id and timestamps only); a match
+is answered with 304 Not Modified without loading or serializing the row.
+
+updated_at is set in Python (app.core.database.utcnow) with microseconds,
+so two edits within the same second still get different ETags; func.now()
+only has one-second resolution on SQLite.
+"""
+from datetime import datetime
+from typing import Optional
+from fastapi import Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+
+# Authenticated detail endpoints: clients may store but must revalidate
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def public_cache_control() -> str:
+    """Cache-Control for public discovery endpoints (CDN-cacheable)"""
+    return (
+        f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+
+
+def compute_etag(entity_id: int, updated_at: Optional[datetime], created_at: Optional[datetime]) -> str:
+    """Weak ETag for a row version"""
+    version = updated_at or created_at
+    stamp = version.strftime("%Y%m%d%H%M%S%f") if version else "0"
+    return f'W/"{entity_id}-{stamp}"'
+
+
+def entity_etag(entity) -> str:
+    """ETag for a loaded model instance"""
+    return compute_etag(entity.id, entity.updated_at, entity.created_at)
+
+
+async def probe_etag(db: AsyncSession, model, entity_id: int) -> Optional[str]:
+    """ETag for a row from its id and timestamps only, or None if the row doesn't exist"""
+    result = await db.execute(
+        select(model.id, model.updated_at, model.created_at).where(model.id == entity_id)
+    )
+    row = result.first()
+    return compute_etag(*row) if row else None
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match against an ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """304 response carrying the validator and caching policy"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
+
+
+def set_cache_headers(response: Response, etag: Optional[str], cache_control: str) -> None:
+    """Attach ETag (if any) and Cache-Control to a response"""
+    if etag:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
@@ -0,0 +1,141 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints
+
+Pages are ordered by a unique, indexed sort key (the primary key, which
+follows creation order). The next page starts after the last key seen, so
+the database seeks straight to it instead of scanning and discarding
+`skip` rows. Legacy skip/limit paging keeps working for compatibility.
+
+The cursor for the following page is returned in the X-Next-Cursor
+response header; it is absent on the last page.
+
+Feeds ordered by a non-unique score (deal discovery) page on (score, id),
+highest first, with both values in the cursor.
+
+Relevance-ranked results (search) have no stable keyset, so their cursors
+carry an offset instead; the token stays opaque to clients either way.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import tuple_
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class PageParams:
+    """Resolved paging parameters for a list request"""
+    limit: int
+    skip: int = 0
+    after: Optional[Any] = None  # Sort key of the last row on the previous page
+
+
+def encode_cursor(value: Any) -> str:
+    """Encode a sort key value as an opaque cursor token"""
+    raw = json.dumps({"k": value}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    """Decode a cursor token back into its sort key value"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))["k"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def get_page_params(
+    skip: int = Query(0, ge=0, description="Legacy offset paging (ignored when cursor is set)"),
+    limit: int = Query(100, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+) -> PageParams:
+    """Dependency resolving skip/limit/cursor query parameters"""
+    if cursor:
+        return PageParams(limit=limit, after=decode_cursor(cursor))
+    return PageParams(limit=limit, skip=skip)
+
+
+def paginate(query, sort_column, page: PageParams, descending: bool = False):
+    """
+    Apply keyset (or legacy offset) paging to a select() ordered by sort_column
+    (newest first when descending)
+    Fetches one extra row so set_next_cursor() can tell whether a next page exists
+    """
+    query = query.order_by(sort_column.desc() if descending else sort_column)
+    if page.after is not None:
+        query = query.where(sort_column < page.after if descending else sort_column > page.after)
+    elif page.skip:
+        query = query.offset(page.skip)
+    return query.limit(page.limit + 1)
+
+
+def set_next_cursor(response: Response, rows: List[Any], page: PageParams, key: str = "id") -> List[Any]:
+    """Trim the look-ahead row and set the X-Next-Cursor header when more rows exist"""
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        # Rows are ORM objects, or plain dicts on the fast serialization path
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last[key] if isinstance(last, dict) else getattr(last, key))
+    return rows
+
+
+def paginate_by_score(query, score_column, id_column, page: PageParams):
+    """
+    Keyset paging over a non-unique score, highest first, ties broken by id
+    Fetches one extra row so set_next_score_cursor() can tell whether a next page exists
+    """
+    query = query.order_by(score_column.desc(), id_column.desc())
+    if page.after is not None:
+        if not isinstance(page.after, list) or len(page.after) != 2:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        query = query.where(tuple_(score_column, id_column) < tuple(page.after))
+    elif page.skip:
+        query = query.offset(page.skip)
+    return query.limit(page.limit + 1)
+
+
+def set_next_score_cursor(response: Response, rows: List[Any], page: PageParams, score_key: str) -> List[Any]:
+    """Trim the look-ahead row and set a (score, id) X-Next-Cursor when more rows exist"""
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        if isinstance(last, dict):
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor([last[score_key], last["id"]])
+        else:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor([getattr(last, score_key), last.id])
+    return rows
+
+
+def _ranked_offset(page: PageParams) -> int:
+    if page.after is None:
+        return page.skip
+    if not isinstance(page.after, dict) or not isinstance(page.after.get("offset"), int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    return page.after["offset"]
+
+
+def paginate_ranked(query, page: PageParams):
+    """Offset paging for an already-ordered (e.g. relevance-ranked) select(), with one look-ahead row"""
+    return query.offset(_ranked_offset(page)).limit(page.limit + 1)
+
+
+def set_next_ranked_cursor(response: Response, rows: List[Any], page: PageParams) -> List[Any]:
+    """Trim the look-ahead row and set an offset-carrying X-Next-Cursor when more rows exist"""
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor({"offset": _ranked_offset(page) + page.limit})
+    return rows
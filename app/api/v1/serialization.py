@@ -0,0 +1,86 @@
+"""
+Fast Serialization Path for List Endpoints
+
+With response_model=List[...], FastAPI validates every ORM object through
+Pydantic (from_attributes) and then encodes the result with the stdlib
+json module, which dominates the cost of large list pages.
+
+When FAST_LIST_SERIALIZATION is on, list endpoints instead select only
+the response schema's columns as plain tuples, build dicts directly and
+encode them with orjson. The rows come from our own tables, so Pydantic
+validation is skipped; the response schema still documents the shape and
+drives which columns are selected.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic_core import PydanticUndefined
+from app.core.config import settings
+
+# Headers of the injected Response that describe its (empty) body
+_BODY_HEADERS = {"content-length", "content-type"}
+
+
+def fast_serialization_enabled() -> bool:
+    """Whether list endpoints should use the column-tuple + orjson path"""
+    return settings.FAST_LIST_SERIALIZATION
+
+
+class RowSerializer:
+    """Builds response dicts from column tuples for one (model, response schema) pair"""
+    
+    def __init__(self, model, schema):
+        self.names: List[str] = []
+        self.columns = []
+        # Non-nullable schema fields fall back to their default when the column is NULL,
+        # as the Pydantic path would fail instead
+        self.defaults: Dict[int, Any] = {}
+        for name, field in schema.model_fields.items():
+            self.names.append(name)
+            self.columns.append(getattr(model, name))
+            if field.default is not PydanticUndefined and field.default is not None:
+                self.defaults[len(self.names) - 1] = field.default
+    
+    def select(self, query):
+        """Same query, but selecting only the schema's columns"""
+        return query.with_only_columns(*self.columns)
+    
+    def to_dicts(self, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+        names = self.names
+        if not self.defaults:
+            return [dict(zip(names, row)) for row in rows]
+        defaults = self.defaults
+        result = []
+        for row in rows:
+            item = dict(zip(names, row))
+            for position, default in defaults.items():
+                if row[position] is None:
+                    item[names[position]] = default
+            result.append(item)
+        return result
+
+
+@lru_cache(maxsize=None)
+def row_serializer(model, schema) -> RowSerializer:
+    """Cached RowSerializer for a model/schema pair"""
+    return RowSerializer(model, schema)
+
+
+async def fetch_rows(db, query, model, schema) -> List[Dict[str, Any]]:
+    """Run a select(model) query as column tuples and return response dicts"""
+    serializer = row_serializer(model, schema)
+    result = await db.execute(serializer.select(query))
+    return serializer.to_dicts(result.all())
+
+
+def fast_list_response(response: Response, rows: List[Dict[str, Any]]) -> ORJSONResponse:
+    """
+    orjson response carrying the headers set on the injected Response
+    (FastAPI drops them when an endpoint returns a Response itself)
+    """
+    headers = {
+        key: value for key, value in response.headers.items()
+        if key.lower() not in _BODY_HEADERS
+    }
+    return ORJSONResponse(rows, headers=headers)
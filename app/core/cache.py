@@ -0,0 +1,145 @@
+"""
+Cache Backends
+
+Small key/value caches with TTL used for hot-path lookups (e.g. the
+authenticated principal). The in-memory backend is per worker; the Redis
+backend lets several workers share entries and invalidations.
+
+Code running on the event loop uses the *_async methods: the Redis backend
+serves them from a redis.asyncio client, so a slow or unreachable Redis
+delays only the requests waiting on it, never the whole worker. The
+in-memory backend answers them directly.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class CacheBackend:
+    """Base cache backend interface (values must be JSON-serializable)"""
+    
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+    
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+    
+    def clear(self) -> None:
+        raise NotImplementedError
+    
+    async def get_async(self, key: str) -> Optional[Any]:
+        return self.get(key)
+    
+    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.set(key, value, ttl)
+    
+    async def delete_async(self, key: str) -> None:
+        self.delete(key)
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Bounded in-process LRU cache with per-entry TTL"""
+    
+    def __init__(self, max_size: int = 10000, default_ttl: Optional[int] = None):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis-backed cache shared between workers (requires the `redis` package)"""
+    
+    def __init__(self, url: str, namespace: str = "brandfluence", default_ttl: Optional[int] = None):
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError as e:
+            raise RuntimeError("RedisCacheBackend requires the 'redis' package: pip install redis") from e
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self._async_client = redis.asyncio.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+    
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+    
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self._key(key))
+        return json.loads(raw) if raw is not None else None
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        self._client.set(self._key(key), json.dumps(value), ex=ttl or None)
+    
+    def delete(self, key: str) -> None:
+        self._client.delete(self._key(key))
+    
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=self._key("*")):
+            self._client.delete(key)
+    
+    async def get_async(self, key: str) -> Optional[Any]:
+        raw = await self._async_client.get(self._key(key))
+        return json.loads(raw) if raw is not None else None
+    
+    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        await self._async_client.set(self._key(key), json.dumps(value), ex=ttl or None)
+    
+    async def delete_async(self, key: str) -> None:
+        await self._async_client.delete(self._key(key))
+
+
+def create_cache_backend(
+    url: Optional[str],
+    namespace: str,
+    max_size: int = 10000,
+    default_ttl: Optional[int] = None
+) -> CacheBackend:
+    """
+    Build a cache backend from a URL
+    None or "memory://" gives a per-worker in-memory cache, "redis://..." a shared one
+    """
+    if not url or url.startswith("memory://"):
+        return MemoryCacheBackend(max_size=max_size, default_ttl=default_ttl)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheBackend(url, namespace=namespace, default_ttl=default_ttl)
+    raise ValueError(f"Unsupported cache backend URL: {url}")
@@ -2,7 +2,7 @@
 Application Configuration Settings
 """
 from pydantic_settings import BaseSettings
-from typing import List, Union
+from typing import List, Optional, Union
 
 
 class Settings(BaseSettings):
@@ -15,19 +15,102 @@ class Settings(BaseSettings):
     
     # Database Settings
     DATABASE_URL: str = "sqlite:///./brandfluence.db"
+    # Optional override for the async driver URL (derived from DATABASE_URL if unset)
+    ASYNC_DATABASE_URL: Optional[str] = None
+    
+    # Connection Pool Settings (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a connection before failing
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    
+    # SQLite tuning (applied on every new connection)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # Readers don't block the writer
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # Safe with WAL, far fewer fsyncs than FULL
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait for the write lock instead of "database is locked"
+    SQLITE_CACHE_SIZE_KB: int = 64000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    
+    # PostgreSQL tuning (applied on every new connection)
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
     
     # Security Settings
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password Hashing Pool (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # Waiting calls beyond the workers before 503
+    
+    # Cache Settings
+    CACHE_BACKEND_URL: Optional[str] = None  # None/"memory://" per worker, "redis://..." shared
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    
     # CORS Settings (can be comma-separated string or list)
     CORS_ORIGINS: Union[str, List[str]] = "http://localhost:3000,http://localhost:8000"
     
+    # Pagination Settings
+    MAX_PAGE_SIZE: int = 200  # Hard cap on `limit` for list endpoints
+    MAX_BULK_TASKS: int = 1000  # Items per POST /tasks/bulk request
+    FAST_LIST_SERIALIZATION: bool = False  # List endpoints: column tuples + orjson, no Pydantic validation
+    
+    # Real-time Events (Server-Sent Events)
+    EVENTS_BACKEND_URL: Optional[str] = None  # None/"memory://" per worker, "redis://..." shared pub/sub
+    EVENTS_QUEUE_SIZE: int = 100  # Undelivered events kept per stream before the oldest are dropped
+    EVENTS_KEEPALIVE_SECONDS: int = 15  # Comment frames on idle streams (keeps proxies from closing them)
+    
+    # Notifications
+    DEAL_FANOUT_CHUNK_SIZE: int = 5000  # Influencer id range per DEAL_POSTED insert batch
+    
+    # Deal Discovery Ranking
+    TRENDING_HALF_LIFE_HOURS: float = 48.0  # Engagement counts half as much per this much deal age
+    TRENDING_VIEW_WEIGHT: float = 1.0
+    TRENDING_APPLICATION_WEIGHT: float = 20.0
+    TRENDING_REFRESH_SECONDS: float = 30.0  # How often campaigns with new views/applications are rescored
+    
+    # Campaign Counters (views, impressions, clicks)
+    COUNTER_FLUSH_SECONDS: float = 5.0  # Batch interval; a crashed worker loses at most this much of its counts
+    COUNTER_FLUSH_MAX_CAMPAIGNS: int = 10000  # Flush early once this many campaigns have pending counts
+    
+    # Influencer-Campaign Matching (score weights, see app/services/matching.py)
+    MATCH_WEIGHT_NICHE: float = 3.0
+    MATCH_WEIGHT_LOCATION: float = 1.0
+    MATCH_WEIGHT_ENGAGEMENT: float = 2.0
+    MATCH_WEIGHT_REACH: float = 1.0
+    MATCH_WEIGHT_BUDGET: float = 1.5
+    MATCH_SNAPSHOT_MAX_AGE_SECONDS: float = 300.0  # Rebuild a worker's snapshot (in the background) after this long
+    MAX_MATCH_RESULTS: int = 100
+    
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched and encoded per chunk
+    MAX_CONCURRENT_EXPORTS: int = 4  # Exports running at once (each holds a connection)
+    
+    # HTTP Caching (public discovery endpoints)
+    PUBLIC_CACHE_MAX_AGE: int = 60
+    PUBLIC_CACHE_STALE_WHILE_REVALIDATE: int = 300
+    
     # File Upload Settings
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     UPLOAD_DIR: str = "uploads"
     
+    @property
+    def async_database_url(self) -> str:
+        """Get the async driver URL (aiosqlite for SQLite, asyncpg for PostgreSQL)"""
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+        url = self.DATABASE_URL
+        if url.startswith("sqlite:"):
+            return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+        if url.startswith("postgresql+psycopg2:"):
+            return url.replace("postgresql+psycopg2:", "postgresql+asyncpg:", 1)
+        if url.startswith("postgresql:"):
+            return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+        if url.startswith("postgres:"):
+            return url.replace("postgres:", "postgresql+asyncpg:", 1)
+        return url
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """Convert CORS_ORIGINS to list format"""
@@ -2,10 +2,14 @@
 Database Configuration and Session Management
 """
 import os
+from datetime import datetime, timezone
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.pool import configure_engine, pool_kwargs, pool_status
 
 # Create engine with appropriate connection args
 connect_args = {}
@@ -14,16 +18,46 @@ if settings.DATABASE_URL.startswith("sqlite"):
 
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args=connect_args
+    connect_args=connect_args,
+    **pool_kwargs(settings.DATABASE_URL, is_async=False)
 )
+configure_engine(engine)
+instrument_engine(engine)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine used by the API so queries don't block the event loop
+async_engine = create_async_engine(
+    settings.async_database_url,
+    connect_args=connect_args,
+    **pool_kwargs(settings.async_database_url, is_async=True)
+)
+configure_engine(async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine)
+
+# Create AsyncSessionLocal class
+# expire_on_commit=False keeps loaded attributes usable after commit without
+# an implicit (and in async, illegal) lazy reload
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create Base class for models
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """
+    Current UTC time, for Python-side column defaults
+    Keeps microseconds where func.now() on SQLite only has whole seconds
+    """
+    return datetime.now(timezone.utc)
+
+
 def get_db():
     """
     Dependency function to get database session
@@ -35,9 +69,29 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency function to get an async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_pool_status() -> dict:
+    """
+    Connection pool gauges (checked out, overflow) and counters (wait time,
+    timeouts) for the async API engine and the sync engine
+    """
+    return {
+        "async": pool_status(async_engine.sync_engine),
+        "sync": pool_status(engine),
+    }
+
+
 def init_db():
     """
-    Initialize database - create all tables if they don't exist
+    Initialize database - create all tables if they don't exist and apply
+    pending schema migrations
     This is idempotent and safe to call multiple times
     """
     # Import all models to ensure they're registered with Base.metadata
@@ -49,6 +103,10 @@ def init_db():
     
     # Create all tables (only creates if they don't exist)
     Base.metadata.create_all(bind=engine)
+    
+    # Bring existing tables up to date (indexes, new columns)
+    from app.core.migrations import run_migrations
+    run_migrations(engine)
 
 
 def check_db_exists():
@@ -0,0 +1,197 @@
+"""
+Event Broker
+
+In-process publish/subscribe for real-time pushes (task, content and
+notification updates streamed to clients over Server-Sent Events).
+Channels are plain strings ("user:12", "brand:3", "influencer:7"); events
+are JSON-serializable dicts.
+
+The in-memory broker delivers within one worker. The Redis broker
+publishes through Redis pub/sub so every worker sees every event, and fans
+each message out to its local subscribers over a single connection per
+worker.
+
+Each subscriber has a bounded queue; when a slow client falls behind, its
+oldest events are dropped rather than blocking publishers.
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+
+
+class Subscription:
+    """A subscriber's queue of events for a set of channels (async context manager)"""
+    
+    def __init__(self, broker: "EventBroker", channels: Iterable[str], max_queue: int):
+        self.broker = broker
+        self.channels = list(channels)
+        self.queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+    
+    def put(self, event: Optional[Event]) -> None:
+        """Enqueue without blocking, dropping the oldest event when full"""
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except asyncio.QueueFull:
+                self.queue.get_nowait()
+                self.dropped += 1
+    
+    async def get(self) -> Optional[Event]:
+        """Next event, or None once the broker is closing"""
+        return await self.queue.get()
+    
+    async def __aenter__(self) -> "Subscription":
+        await self.broker.attach(self)
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self.broker.detach(self)
+
+
+class EventBroker:
+    """Base broker: local subscriber bookkeeping and delivery"""
+    
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+    
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        return Subscription(self, channels, self.max_queue)
+    
+    async def attach(self, subscription: Subscription) -> None:
+        for channel in subscription.channels:
+            self._subscribers[channel].add(subscription)
+    
+    async def detach(self, subscription: Subscription) -> None:
+        for channel in subscription.channels:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+    
+    def deliver(self, channel: str, event: Event) -> None:
+        """Hand an event to this worker's subscribers of a channel"""
+        for subscription in list(self._subscribers.get(channel, ())):
+            subscription.put(event)
+    
+    def subscriber_count(self) -> int:
+        return len({s for subscribers in self._subscribers.values() for s in subscribers})
+    
+    async def publish(self, channel: str, event: Event) -> None:
+        await self.publish_many([(channel, event)])
+    
+    async def publish_many(self, messages: List[Tuple[str, Event]]) -> None:
+        raise NotImplementedError
+    
+    async def close(self) -> None:
+        """End every open subscription (their get() returns None)"""
+        for subscription in {s for subscribers in self._subscribers.values() for s in subscribers}:
+            subscription.put(None)
+
+
+class MemoryEventBroker(EventBroker):
+    """Per-worker broker: events reach subscribers connected to the same process"""
+    
+    async def publish_many(self, messages: List[Tuple[str, Event]]) -> None:
+        for channel, event in messages:
+            self.deliver(channel, event)
+
+
+class RedisEventBroker(EventBroker):
+    """Redis pub/sub broker shared between workers (requires the `redis` package)"""
+    
+    def __init__(self, url: str, namespace: str = "brandfluence:events", max_queue: int = 100):
+        super().__init__(max_queue=max_queue)
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RedisEventBroker requires the 'redis' package: pip install redis") from e
+        self._client = redis.Redis.from_url(url)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._reader: Optional[asyncio.Task] = None
+        self.namespace = namespace
+    
+    def _key(self, channel: str) -> str:
+        return f"{self.namespace}:{channel}"
+    
+    async def attach(self, subscription: Subscription) -> None:
+        new_channels = [c for c in subscription.channels if c not in self._subscribers]
+        await super().attach(subscription)
+        if new_channels:
+            await self._pubsub.subscribe(*(self._key(c) for c in new_channels))
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read())
+    
+    async def detach(self, subscription: Subscription) -> None:
+        await super().detach(subscription)
+        unused = [c for c in subscription.channels if c not in self._subscribers]
+        if unused:
+            await self._pubsub.unsubscribe(*(self._key(c) for c in unused))
+    
+    async def _read(self) -> None:
+        prefix = len(self.namespace) + 1
+        while self._subscribers:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except Exception:
+                logger.exception("Event broker lost its Redis subscription")
+                await asyncio.sleep(1.0)
+                continue
+            if message is None:
+                continue
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            self.deliver(channel[prefix:], json.loads(message["data"]))
+    
+    async def publish_many(self, messages: List[Tuple[str, Event]]) -> None:
+        async with self._client.pipeline(transaction=False) as pipe:
+            for channel, event in messages:
+                pipe.publish(self._key(channel), json.dumps(event, default=str))
+            await pipe.execute()
+    
+    async def close(self) -> None:
+        await super().close()
+        if self._reader is not None:
+            self._reader.cancel()
+        await self._pubsub.aclose()
+        await self._client.aclose()
+
+
+def create_event_broker(url: Optional[str], max_queue: int = 100) -> EventBroker:
+    """
+    Build an event broker from a URL
+    None or "memory://" gives a per-worker broker, "redis://..." a shared one
+    """
+    if not url or url.startswith("memory://"):
+        return MemoryEventBroker(max_queue=max_queue)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisEventBroker(url, max_queue=max_queue)
+    raise ValueError(f"Unsupported event broker URL: {url}")
+
+
+event_broker = create_event_broker(settings.EVENTS_BACKEND_URL, max_queue=settings.EVENTS_QUEUE_SIZE)
+
+
+async def publish_events(messages: List[Tuple[str, Event]]) -> None:
+    """
+    Publish events after the change they describe has committed
+    A broker failure is logged, never raised: pushes are best effort and
+    clients can always fall back to reading the API
+    """
+    if not messages:
+        return
+    try:
+        await event_broker.publish_many(messages)
+    except Exception:
+        logger.exception(f"Publishing {len(messages)} events failed")
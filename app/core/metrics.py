@@ -0,0 +1,303 @@
+"""
+Request and Database Instrumentation
+
+ASGI middleware that records per-route latency, SQL query count and time
+spent in the database, plus SQLAlchemy cursor hooks feeding the per-request
+counters. Everything is rendered in Prometheus text format by
+render_prometheus().
+
+Routes are labelled by their path template (/api/v1/brands/{brand_id}), not
+the raw URL, so label cardinality stays bounded.
+
+A request is observed when the last body chunk has been sent. Starlette runs
+BackgroundTasks after that but inside the same ASGI call, so their time and
+queries are not charged to the request (their queries count as outside
+requests).
+"""
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from app.core.config import settings
+
+# Upper bounds in seconds (Prometheus `le` labels); +Inf is implicit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestStats:
+    """Database work done while serving one request"""
+    
+    __slots__ = ("queries", "db_seconds", "closed")
+    
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        # Set once the response is sent; later work (background tasks) isn't counted
+        self.closed = False
+
+
+# Mutable per-request stats; set by the middleware, updated by cursor hooks
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Stats for the request being served, or None outside a request"""
+    return _request_stats.get()
+
+
+class Histogram:
+    """Cumulative-bucket histogram (not thread-safe; guarded by the registry lock)"""
+    
+    __slots__ = ("buckets", "counts", "sum", "count")
+    
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, n in zip(self.buckets, self.counts):
+            total += n
+            result.append((_format_value(bound), total))
+        result.append(("+Inf", total + self.counts[-1]))
+        return result
+
+
+class MetricsRegistry:
+    """Per-route request metrics"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.queries: Dict[Tuple[str, str], Histogram] = {}
+        self.db_seconds: Dict[Tuple[str, str], float] = {}
+        self.queries_outside_requests = 0
+    
+    def observe_request(self, method: str, route: str, status_code: int, seconds: float, stats: RequestStats):
+        key = (method, route)
+        with self._lock:
+            status_key = (method, route, str(status_code))
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            if key not in self.latency:
+                self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.queries[key] = Histogram(QUERY_COUNT_BUCKETS)
+                self.db_seconds[key] = 0.0
+            self.latency[key].observe(seconds)
+            self.queries[key].observe(stats.queries)
+            self.db_seconds[key] += stats.db_seconds
+    
+    def observe_background_query(self):
+        with self._lock:
+            self.queries_outside_requests += 1
+    
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.latency.clear()
+            self.queries.clear()
+            self.db_seconds.clear()
+            self.queries_outside_requests = 0
+
+
+metrics_registry = MetricsRegistry()
+
+
+def instrument_engine(sync_engine):
+    """Count queries and time spent in the database for the current request"""
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        stats = _request_stats.get()
+        if stats is None or stats.closed:
+            metrics_registry.observe_background_query()
+            return
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+    
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        # after_cursor_execute doesn't fire for failed statements
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    return scope.get("root_path", "") + path
+
+
+def _server_timing(total_seconds: float, stats: RequestStats) -> bytes:
+    return (
+        f'app;dur={total_seconds * 1000:.1f}, '
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+    ).encode("latin-1")
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware) so it doesn't buffer
+    streaming responses or break contextvar propagation
+    """
+    
+    def __init__(self, app, server_timing: Optional[bool] = None):
+        self.app = app
+        self.server_timing = settings.DEBUG if server_timing is None else server_timing
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started_at = time.perf_counter()
+        status_code = 500
+        
+        def observe():
+            if stats.closed:
+                return
+            stats.closed = True
+            metrics_registry.observe_request(
+                scope["method"],
+                _route_template(scope),
+                status_code,
+                time.perf_counter() - started_at,
+                stats,
+            )
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(time.perf_counter() - started_at, stats)))
+                    message = {**message, "headers": headers}
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                observe()
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            # No complete response was sent (e.g. an unhandled error)
+            observe()
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value)) if isinstance(value, int) else f"{value:.1f}"
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, histograms: Dict[Tuple[str, str], Histogram]) -> Iterable[str]:
+    for (method, route), histogram in sorted(histograms.items()):
+        for bound, count in histogram.cumulative():
+            yield f"{name}_bucket{_labels(method=method, route=route, le=bound)} {count}"
+        yield f"{name}_sum{_labels(method=method, route=route)} {histogram.sum}"
+        yield f"{name}_count{_labels(method=method, route=route)} {histogram.count}"
+
+
+def render_prometheus(pool_status: Optional[dict] = None, hashing_stats: Optional[dict] = None) -> str:
+    """Prometheus text exposition of request, database and hashing metrics"""
+    registry = metrics_registry
+    lines: List[str] = []
+    with registry._lock:
+        lines += [
+            "# HELP http_requests_total HTTP requests by route template and status",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, code), count in sorted(registry.requests.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=code)} {count}")
+        
+        lines += [
+            "# HELP http_request_duration_seconds Request latency by route template",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        lines += _histogram_lines("http_request_duration_seconds", registry.latency)
+        
+        lines += [
+            "# HELP http_request_db_queries SQL statements executed per request",
+            "# TYPE http_request_db_queries histogram",
+        ]
+        lines += _histogram_lines("http_request_db_queries", registry.queries)
+        
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent executing SQL while serving requests",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, route), seconds in sorted(registry.db_seconds.items()):
+            lines.append(f"http_request_db_seconds_total{_labels(method=method, route=route)} {seconds}")
+        
+        lines += [
+            "# HELP db_queries_outside_requests_total SQL statements executed outside a request (startup, background jobs)",
+            "# TYPE db_queries_outside_requests_total counter",
+            f"db_queries_outside_requests_total {registry.queries_outside_requests}",
+        ]
+    
+    if pool_status:
+        gauges = ("size", "checked_in", "checked_out", "overflow")
+        counters = ("checkouts", "connects", "invalidations", "timeouts", "wait_seconds_total")
+        for field in gauges:
+            lines.append(f"# TYPE db_pool_{field} gauge")
+            for engine_name, status in sorted(pool_status.items()):
+                if field in status:
+                    lines.append(f"db_pool_{field}{_labels(engine=engine_name)} {status[field]}")
+        for field in counters:
+            name = f"db_pool_{field}" if field.endswith("_total") else f"db_pool_{field}_total"
+            lines.append(f"# TYPE {name} counter")
+            for engine_name, status in sorted(pool_status.items()):
+                if field in status:
+                    lines.append(f"{name}{_labels(engine=engine_name)} {status[field]}")
+    
+    if hashing_stats:
+        lines += [
+            "# TYPE password_hash_in_flight gauge",
+            f"password_hash_in_flight {hashing_stats['in_flight']}",
+        ]
+        for field in ("submitted", "completed", "rejected"):
+            lines += [
+                f"# TYPE password_hash_{field}_total counter",
+                f"password_hash_{field}_total {hashing_stats[field]}",
+            ]
+        for field in ("queue_wait_seconds_total", "hash_seconds_total"):
+            lines += [
+                f"# TYPE password_hash_{field} counter",
+                f"password_hash_{field} {hashing_stats[field]}",
+            ]
+    
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,271 @@
+"""
+Versioned Schema Migrations
+
+Base.metadata.create_all only creates missing tables; it never adds
+indexes or columns to tables that already exist. Each migration here is
+applied once, in order, and recorded in the schema_migrations table, so
+existing databases pick up schema changes on the next startup.
+
+Migrations must be idempotent: on a fresh database create_all has already
+built the current schema, and the migration is only recorded.
+
+Each migration spells out the indexes it creates as they were at its
+version, rather than reading the models: model metadata describes the
+latest schema, whose indexes may cover columns a later migration adds.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Callable, List
+from sqlalchemy import (
+    Column, DateTime, Float, Integer, JSON, MetaData, String, Table, inspect, select, func, text, update
+)
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+_migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+@dataclass
+class Migration:
+    """A single schema migration step"""
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def create_index_if_missing(conn: Connection, name: str, table_name: str, *columns: str, unique: bool = False) -> None:
+    """CREATE [UNIQUE] INDEX IF NOT EXISTS (SQLite and PostgreSQL both support it)"""
+    conn.exec_driver_sql(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table_name} ({', '.join(columns)})"
+    )
+
+
+def add_column_if_missing(conn: Connection, table_name: str, column: Column) -> None:
+    """ALTER TABLE ... ADD COLUMN unless the column already exists"""
+    existing = {col["name"] for col in inspect(conn).get_columns(table_name)}
+    if column.name in existing:
+        return
+    column_type = column.type.compile(dialect=conn.dialect)
+    ddl = f"ALTER TABLE {table_name} ADD COLUMN {column.name} {column_type}"
+    if column.server_default is not None:
+        ddl += f" DEFAULT {column.server_default.arg}"
+    conn.exec_driver_sql(ddl)
+
+
+def _001_hot_filter_indexes(conn: Connection) -> None:
+    create_index_if_missing(conn, "ix_campaigns_brand_id_id", "campaigns", "brand_id", "id")
+    create_index_if_missing(conn, "ix_campaigns_influencer_id_id", "campaigns", "influencer_id", "id")
+    create_index_if_missing(conn, "ix_campaigns_status", "campaigns", "status")
+    create_index_if_missing(conn, "ix_tasks_campaign_id_id", "tasks", "campaign_id", "id")
+    create_index_if_missing(conn, "ix_tasks_influencer_id_id", "tasks", "influencer_id", "id")
+    # Replaced by a unique index in migration 8
+    create_index_if_missing(
+        conn, "ix_deal_applications_campaign_id_influencer_id", "deal_applications", "campaign_id", "influencer_id"
+    )
+    create_index_if_missing(
+        conn, "ix_notifications_user_id_is_read_created_at", "notifications", "user_id", "is_read", "created_at"
+    )
+    create_index_if_missing(conn, "ix_messages_recipient_id_created_at", "messages", "recipient_id", "created_at")
+    create_index_if_missing(conn, "ix_milestones_campaign_id_due_date", "milestones", "campaign_id", "due_date")
+
+
+def _002_influencer_search_index(conn: Connection) -> None:
+    from app.services.search import create_search_index
+    create_search_index(conn)
+
+
+def _003_task_fractional_position(conn: Connection) -> None:
+    # SQLite stores REAL values in an INTEGER-affinity column as-is; other
+    # databases need the column type changed
+    if conn.dialect.name != "sqlite":
+        column = next(col for col in inspect(conn).get_columns("tasks") if col["name"] == "position")
+        if isinstance(column["type"], Integer):
+            conn.exec_driver_sql(
+                "ALTER TABLE tasks ALTER COLUMN position TYPE DOUBLE PRECISION "
+                "USING position::double precision"
+            )
+    create_index_if_missing(conn, "ix_tasks_campaign_id_status_position", "tasks", "campaign_id", "status", "position")
+
+
+def _004_campaign_niches(conn: Connection) -> None:
+    # Existing rows get an empty list, as the model default gives new ones
+    add_column_if_missing(conn, "campaigns", Column("niches", JSON, server_default="'[]'"))
+
+
+def _005_unread_notification_counts(conn: Connection) -> None:
+    add_column_if_missing(
+        conn, "users", Column("unread_notification_count", Integer, nullable=False, server_default="0")
+    )
+    conn.exec_driver_sql(
+        "UPDATE users SET unread_notification_count = ("
+        "SELECT count(*) FROM notifications "
+        "WHERE notifications.user_id = users.id AND notifications.is_read = false)"
+    )
+    create_index_if_missing(conn, "ix_notifications_user_id_id", "notifications", "user_id", "id")
+    create_index_if_missing(conn, "ix_notifications_user_id_is_read_id", "notifications", "user_id", "is_read", "id")
+
+
+def _006_conversations(conn: Connection) -> None:
+    add_column_if_missing(conn, "messages", Column("conversation_id", Integer))
+    create_index_if_missing(conn, "ix_messages_conversation_id_id", "messages", "conversation_id", "id")
+    create_index_if_missing(
+        conn, "ix_conversation_participants_user_id_last_message_id",
+        "conversation_participants", "user_id", "last_message_id"
+    )
+    
+    # create_all has built the conversation tables; thread existing direct
+    # messages by campaign and user pair, as app/services/messaging.py does
+    low = "CASE WHEN sender_id < recipient_id THEN sender_id ELSE recipient_id END"
+    high = "CASE WHEN sender_id < recipient_id THEN recipient_id ELSE sender_id END"
+    threads = conn.exec_driver_sql(
+        f"SELECT coalesce(campaign_id, 0), {low}, {high}, max(id) FROM messages "
+        "WHERE recipient_id IS NOT NULL AND conversation_id IS NULL GROUP BY 1, 2, 3"
+    ).all()
+    for campaign_id, low_id, high_id, last_id in threads:
+        last = conn.execute(
+            text("SELECT sender_id, substr(content, 1, 140), created_at FROM messages WHERE id = :id"), {"id": last_id}
+        ).one()
+        conversation_id = conn.execute(
+            text(
+                "INSERT INTO conversations (key, campaign_id, last_message_id, last_message_sender_id, "
+                "last_message_preview, last_message_at) VALUES (:key, :campaign_id, :last_id, :sender_id, "
+                ":preview, :last_at) RETURNING id"
+            ),
+            {
+                "key": f"{campaign_id}:{low_id}:{high_id}", "campaign_id": campaign_id or None,
+                "last_id": last_id, "sender_id": last[0], "preview": last[1], "last_at": last[2],
+            }
+        ).scalar_one()
+        conn.execute(
+            text(
+                f"UPDATE messages SET conversation_id = :conversation_id WHERE recipient_id IS NOT NULL "
+                f"AND coalesce(campaign_id, 0) = :campaign_id AND {low} = :low_id AND {high} = :high_id"
+            ),
+            {"conversation_id": conversation_id, "campaign_id": campaign_id, "low_id": low_id, "high_id": high_id}
+        )
+        for user_id in (low_id, high_id):
+            conn.execute(
+                text(
+                    "INSERT INTO conversation_participants (conversation_id, user_id, unread_count, last_message_id) "
+                    "SELECT :conversation_id, :user_id, count(*), :last_id FROM messages "
+                    "WHERE conversation_id = :conversation_id AND recipient_id = :user_id AND is_read = false"
+                ),
+                {"conversation_id": conversation_id, "user_id": user_id, "last_id": last_id}
+            )
+
+
+def _007_campaign_trending_score(conn: Connection) -> None:
+    from app.core.database import Base
+    from app.services.ranking import REFRESH_BATCH_SIZE, trending_score
+    add_column_if_missing(conn, "campaigns", Column("trending_score", Float, nullable=False, server_default="0"))
+    create_index_if_missing(
+        conn, "ix_campaigns_status_trending_score", "campaigns", "status", "trending_score", "id"
+    )
+    
+    # Score existing campaigns in id order, one batch at a time
+    campaigns = Base.metadata.tables["campaigns"]
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(campaigns.c.id, campaigns.c.view_count, campaigns.c.application_count, campaigns.c.created_at)
+            .where(campaigns.c.id > last_id)
+            .order_by(campaigns.c.id)
+            .limit(REFRESH_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            text("UPDATE campaigns SET trending_score = :score WHERE id = :id"),
+            [{"id": campaign_id, "score": trending_score(views, applications, created_at)}
+             for campaign_id, views, applications, created_at in rows]
+        )
+        last_id = rows[-1][0]
+
+
+def _008_unique_deal_applications(conn: Connection) -> None:
+    # Keep each influencer's latest application per deal, repointing
+    # notifications about the duplicates to it
+    conn.exec_driver_sql(
+        "UPDATE notifications SET related_application_id = ("
+        "SELECT max(kept.id) FROM deal_applications AS duplicate JOIN deal_applications AS kept "
+        "ON kept.campaign_id = duplicate.campaign_id AND kept.influencer_id = duplicate.influencer_id "
+        "WHERE duplicate.id = notifications.related_application_id) "
+        "WHERE related_application_id IS NOT NULL"
+    )
+    conn.exec_driver_sql(
+        "DELETE FROM deal_applications WHERE id NOT IN ("
+        "SELECT max(id) FROM deal_applications GROUP BY campaign_id, influencer_id)"
+    )
+    # Superseded by the unique index on the same columns
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_deal_applications_campaign_id_influencer_id")
+    # Only now that the duplicates are gone
+    create_index_if_missing(
+        conn, "uq_deal_applications_campaign_id_influencer_id",
+        "deal_applications", "campaign_id", "influencer_id", unique=True
+    )
+    create_index_if_missing(conn, "ix_deal_applications_campaign_id_id", "deal_applications", "campaign_id", "id")
+    create_index_if_missing(conn, "ix_deal_applications_influencer_id_id", "deal_applications", "influencer_id", "id")
+
+
+def _009_campaign_deal_announced_at(conn: Connection) -> None:
+    from app.core.database import Base
+    from app.models.campaign import CampaignStatus
+    add_column_if_missing(conn, "campaigns", Column("deal_announced_at", DateTime(timezone=True)))
+    # Deals that have been past draft were announced by the code that
+    # preceded this column; don't announce them again when reactivated
+    campaigns = Base.metadata.tables["campaigns"]
+    conn.execute(
+        update(campaigns)
+        .where(campaigns.c.status != CampaignStatus.DRAFT, campaigns.c.deal_announced_at.is_(None))
+        .values(deal_announced_at=campaigns.c.created_at, updated_at=campaigns.c.updated_at)
+    )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Indexes on foreign-key and hot filter columns", _001_hot_filter_indexes),
+    Migration(2, "Influencer discovery full-text search index", _002_influencer_search_index),
+    Migration(3, "Fractional Kanban positions and board column index", _003_task_fractional_position),
+    Migration(4, "Targeted creator niches on campaigns", _004_campaign_niches),
+    Migration(5, "Unread notification counters and inbox indexes", _005_unread_notification_counts),
+    Migration(6, "Conversations for messages", _006_conversations),
+    Migration(7, "Trending scores for deal discovery", _007_campaign_trending_score),
+    Migration(8, "One application per influencer and deal", _008_unique_deal_applications),
+    Migration(9, "Announce each deal once", _009_campaign_deal_announced_at),
+]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    Apply pending migrations in version order, each in its own transaction
+    Returns the versions that were applied
+    """
+    _migration_metadata.create_all(bind=engine)
+    
+    with engine.connect() as conn:
+        applied = set(conn.execute(select(schema_migrations.c.version)).scalars())
+    
+    newly_applied = []
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version in applied:
+            continue
+        logger.info(f"Applying migration {migration.version}: {migration.description}")
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(
+                schema_migrations.insert().values(
+                    version=migration.version,
+                    description=migration.description
+                )
+            )
+        newly_applied.append(migration.version)
+    
+    return newly_applied
@@ -0,0 +1,177 @@
+"""
+Connection Pool Tuning and Telemetry
+
+Pool classes that record how long callers wait for a connection, plus
+per-dialect session settings (SQLite pragmas, PostgreSQL timeouts) applied
+to every new DBAPI connection.
+"""
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """Counters for a single engine's connection pool"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+    
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+    
+    def incr(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+
+class _TimedGetMixin:
+    """Times _do_get(), i.e. how long a caller waits for a pooled connection"""
+    
+    metrics: PoolMetrics
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+    
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - started_at, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - started_at)
+        return conn
+    
+    def recreate(self):
+        # Keep counters across dispose()/recreate() so telemetry stays cumulative
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+class InstrumentedQueuePool(_TimedGetMixin, QueuePool):
+    """QueuePool that records connection wait time"""
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedGetMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records connection wait time"""
+    pass
+
+
+def is_sqlite_memory_url(url: str) -> bool:
+    """In-memory SQLite uses a singleton/static pool that can't be sized"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return False
+    return parsed.database in (None, "", ":memory:") or "mode=memory" in url
+
+
+def pool_kwargs(url: str, is_async: bool) -> dict:
+    """create_engine() pool arguments from settings for the given URL"""
+    if is_sqlite_memory_url(url):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+        # Negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size = -{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE)}")
+    finally:
+        cursor.close()
+
+
+def _apply_postgres_settings(dbapi_connection):
+    if not settings.DB_STATEMENT_TIMEOUT_MS:
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SET statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}")
+    finally:
+        cursor.close()
+    # psycopg2 opens a transaction implicitly; don't leave SET inside it
+    dbapi_connection.commit()
+
+
+def configure_engine(sync_engine):
+    """Attach per-dialect connect tuning and pool counters to a (sync) Engine"""
+    dialect = sync_engine.dialect.name
+    
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        if dialect == "sqlite":
+            _apply_sqlite_pragmas(dbapi_connection)
+        elif dialect == "postgresql":
+            _apply_postgres_settings(dbapi_connection)
+        metrics = getattr(sync_engine.pool, "metrics", None)
+        if metrics is not None:
+            metrics.incr("connects")
+    
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics = getattr(sync_engine.pool, "metrics", None)
+        if metrics is not None:
+            metrics.incr("checkouts")
+    
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics = getattr(sync_engine.pool, "metrics", None)
+        if metrics is not None:
+            metrics.incr("invalidations")
+
+
+def pool_status(sync_engine) -> dict:
+    """Live pool gauges plus cumulative counters for an Engine"""
+    pool = sync_engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,121 @@
+"""
+Authenticated Principal and its cache
+
+get_current_user resolves a token to a Principal (the few user fields
+authorization needs) and caches it by user_id, so authenticated requests
+don't look up the users table every time. Entries expire after
+PRINCIPAL_CACHE_TTL_SECONDS and are invalidated as soon as a change to a
+user's email, role or active flag is committed.
+
+Lookups go through the cache's async methods, so a shared Redis cache never
+blocks the event loop.
+"""
+from dataclasses import dataclass
+from typing import Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+from app.core.cache import create_cache_backend
+from app.core.config import settings
+from app.models.user import User, UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated user state used for authorization
+    brand_id / influencer_id come from the access token claims, not the cache
+    """
+    id: int
+    email: str
+    role: UserRole
+    is_active: bool
+    brand_id: Optional[int] = None
+    influencer_id: Optional[int] = None
+    
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, role=user.role, is_active=bool(user.is_active))
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Principal":
+        return cls(
+            id=data["id"],
+            email=data["email"],
+            role=UserRole(data["role"]),
+            is_active=data["is_active"]
+        )
+    
+    def to_dict(self) -> dict:
+        return {"id": self.id, "email": self.email, "role": self.role.value, "is_active": self.is_active}
+
+
+principal_cache = create_cache_backend(
+    settings.CACHE_BACKEND_URL,
+    namespace="principal",
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    default_ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def _cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+async def get_cached_principal(user_id: int) -> Optional[Principal]:
+    """Get a cached principal, or None on a miss"""
+    data = await principal_cache.get_async(_cache_key(user_id))
+    return Principal.from_dict(data) if data is not None else None
+
+
+async def cache_principal(principal: Principal) -> None:
+    """Store a principal in the cache"""
+    await principal_cache.set_async(_cache_key(principal.id), principal.to_dict())
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop a user's cached principal (call after email/role/active changes)"""
+    if in_greenlet():
+        # Committing an AsyncSession: on the event loop, so await the async client
+        await_only(principal_cache.delete_async(_cache_key(user_id)))
+    else:
+        principal_cache.delete(_cache_key(user_id))
+
+
+# Automatic invalidation: remember users whose cached fields changed during a
+# flush and drop their cache entries once the transaction commits, so a
+# concurrent request can't re-cache the old state between flush and commit.
+
+_PENDING_KEY = "principal_invalidations"
+
+
+def _queue_invalidation(target: User) -> None:
+    session = object_session(target)
+    if session is not None and target.id is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+@event.listens_for(User, "after_update")
+def _user_after_update(mapper, connection, target):
+    state = inspect(target)
+    if any(
+        getattr(state.attrs, field).history.has_changes()
+        for field in ("email", "role", "is_active")
+    ):
+        _queue_invalidation(target)
+
+
+@event.listens_for(User, "after_delete")
+def _user_after_delete(mapper, connection, target):
+    _queue_invalidation(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _session_after_commit(session):
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _session_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
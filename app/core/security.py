@@ -1,6 +1,10 @@
 """
 Security utilities for authentication and authorization
 """
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -10,6 +14,104 @@ from app.core.config import settings
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+class PasswordHashPoolSaturated(Exception):
+    """Raised when the password hashing pool has no room for more work"""
+    pass
+
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for bcrypt hashing and verification
+    
+    bcrypt releases the GIL, so a small thread pool keeps the event loop free
+    while CPU-bound hashing runs. Work beyond max_workers + max_queue in-flight
+    calls is rejected immediately instead of piling up behind a login storm.
+    """
+    
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "rejected": 0,
+            "queue_wait_seconds_total": 0.0,
+            "queue_wait_seconds_max": 0.0,
+            "hash_seconds_total": 0.0,
+            "hash_seconds_max": 0.0,
+        }
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash"
+            )
+        return self._executor
+    
+    def _run(self, fn, submitted_at: float, *args):
+        started_at = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            finished_at = time.perf_counter()
+            queue_wait = started_at - submitted_at
+            hash_time = finished_at - started_at
+            with self._lock:
+                self._stats["completed"] += 1
+                self._stats["queue_wait_seconds_total"] += queue_wait
+                self._stats["queue_wait_seconds_max"] = max(self._stats["queue_wait_seconds_max"], queue_wait)
+                self._stats["hash_seconds_total"] += hash_time
+                self._stats["hash_seconds_max"] = max(self._stats["hash_seconds_max"], hash_time)
+    
+    async def run(self, fn, *args):
+        """Run fn(*args) on the pool, raising PasswordHashPoolSaturated when full"""
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._stats["rejected"] += 1
+                raise PasswordHashPoolSaturated()
+            self._in_flight += 1
+            self._stats["submitted"] += 1
+        try:
+            future = self._get_executor().submit(self._run, fn, time.perf_counter(), *args)
+        except BaseException:
+            self._release()
+            raise
+        # Released when the work finishes (or is cancelled before it starts),
+        # not when the caller stops waiting: a cancelled request leaves its
+        # hash running, and that still counts against the limit
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+    
+    def _release(self, future=None):
+        with self._lock:
+            self._in_flight -= 1
+    
+    def stats(self) -> dict:
+        """Snapshot of pool counters and timings"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = self._in_flight
+        stats["max_workers"] = self.max_workers
+        stats["max_queue"] = self.max_queue
+        return stats
+    
+    def shutdown(self):
+        """Stop worker threads (waits for running hashes to finish)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -20,9 +122,32 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create a JWT access token"""
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool (raises PasswordHashPoolSaturated when full)"""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing pool (raises PasswordHashPoolSaturated when full)"""
+    return await password_hash_pool.run(get_password_hash, password)
+
+
+def create_access_token(
+    data: dict,
+    expires_delta: Optional[timedelta] = None,
+    brand_id: Optional[int] = None,
+    influencer_id: Optional[int] = None
+) -> str:
+    """
+    Create a JWT access token
+    brand_id / influencer_id embed the caller's profile id so endpoints can
+    skip the per-request profile lookup
+    """
     to_encode = data.copy()
+    if brand_id is not None:
+        to_encode["brand_id"] = brand_id
+    if influencer_id is not None:
+        to_encode["influencer_id"] = influencer_id
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -33,6 +158,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def create_user_access_token(
+    user_id: int,
+    email: str,
+    role: str,
+    brand_id: Optional[int] = None,
+    influencer_id: Optional[int] = None
+) -> str:
+    """Create an access token for a user, including their profile id if they have one"""
+    return create_access_token(
+        data={"sub": email, "user_id": user_id, "role": role},
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        brand_id=brand_id,
+        influencer_id=influencer_id
+    )
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT token"""
     try:
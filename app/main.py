@@ -4,9 +4,15 @@ Main FastAPI Application Entry Point
 """
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.core.database import init_db, check_db_exists
+from app.core.database import init_db, check_db_exists, async_engine, get_pool_status
+from app.core.events import event_broker
+from app.core.metrics import MetricsMiddleware, render_prometheus
+from app.core.security import password_hash_pool
+from app.services.counters import counter_buffer
+from app.services.ranking import trending_refresher
 from app.api.v1.api import api_router
 import logging
 
@@ -27,8 +33,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Access-Token", "ETag", "Server-Timing"],
 )
 
+# Per-route latency, SQL query count and DB time (Server-Timing header in DEBUG)
+app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
@@ -38,6 +48,7 @@ async def startup_event():
     """
     Initialize database on server startup
     Creates all tables if they don't exist (works for both SQLite and PostgreSQL)
+    and starts the background counter flush and trending score refresh
     """
     try:
         logger.info("Initializing database...")
@@ -52,6 +63,23 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
         raise
+    
+    counter_buffer.start()
+    trending_refresher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    End open event streams, write buffered campaign counters, rescore
+    pending trending campaigns and release pooled database connections and
+    hashing workers on server shutdown
+    """
+    await event_broker.close()
+    await counter_buffer.stop()
+    await trending_refresher.stop()
+    await async_engine.dispose()
+    password_hash_pool.shutdown()
 
 
 @app.get("/")
@@ -64,6 +92,15 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics (scrape from the internal network only)"""
+    return PlainTextResponse(
+        render_prometheus(get_pool_status(), password_hash_pool.stats()),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
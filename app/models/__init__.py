@@ -9,6 +9,7 @@ from app.models.task import Task
 from app.models.content import Content
 from app.models.payment import Payment, Milestone
 from app.models.message import Message
+from app.models.conversation import Conversation, ConversationParticipant
 from app.models.deal_application import DealApplication
 from app.models.notification import Notification
 
@@ -22,6 +23,8 @@ __all__ = [
     "Payment",
     "Milestone",
     "Message",
+    "Conversation",
+    "ConversationParticipant",
     "DealApplication",
     "Notification",
 ]
@@ -4,7 +4,7 @@ Brand Model
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class Brand(Base):
@@ -23,7 +23,7 @@ class Brand(Base):
     contact_phone = Column(String)
     extra_data = Column(JSON, default={})  # For additional brand-specific data
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=utcnow)  # Sub-second: ETags are derived from it
     
     # Relationships
     user = relationship("User", back_populates="brand_profile")
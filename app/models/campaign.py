@@ -1,11 +1,11 @@
 """
 Campaign Model
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class CampaignStatus(str, enum.Enum):
@@ -20,6 +20,14 @@ class CampaignStatus(str, enum.Enum):
 class Campaign(Base):
     """Campaign/Deal model - Phase 1 MVP"""
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Role-filtered lists (brand/influencer) paged by id
+        Index("ix_campaigns_brand_id_id", "brand_id", "id"),
+        Index("ix_campaigns_influencer_id_id", "influencer_id", "id"),
+        Index("ix_campaigns_status", "status"),
+        # Discover feed: top open deals by trending score
+        Index("ix_campaigns_status_trending_score", "status", "trending_score", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     brand_id = Column(Integer, ForeignKey("brands.id"), nullable=False)
@@ -39,6 +47,7 @@ class Campaign(Base):
     
     # Platforms (Instagram, TikTok, YouTube, etc.)
     platforms = Column(JSON, default=[])  # ["instagram", "tiktok", "youtube"]
+    niches = Column(JSON, default=[])  # Creator niches the deal targets, e.g. ["fashion", "beauty"]
     
     # Deliverables
     deliverables = Column(JSON, default=[])  # List of deliverables required
@@ -66,10 +75,14 @@ class Campaign(Base):
     is_trending = Column(String, default="false")  # For trending deals
     view_count = Column(Integer, default=0)  # For discovery ranking
     application_count = Column(Integer, default=0)  # Number of applications
+    # Time-decayed ranking score, maintained by app/services/ranking.py
+    trending_score = Column(Float, nullable=False, default=0.0, server_default="0")
+    # Set when matching influencers were sent DEAL_POSTED; a deal is announced once
+    deal_announced_at = Column(DateTime(timezone=True), nullable=True)
     
     extra_data = Column(JSON, default={})
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=utcnow)  # Sub-second: ETags are derived from it
     
     # Relationships
     brand = relationship("Brand", back_populates="campaigns")
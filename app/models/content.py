@@ -5,7 +5,7 @@ from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class ContentStatus(str, enum.Enum):
@@ -54,7 +54,7 @@ class Content(Base):
     
     extra_data = Column(JSON, default={})
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=utcnow)  # Sub-second: ETags are derived from it
     
     # Relationships
     task = relationship("Task", back_populates="content")
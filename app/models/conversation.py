@@ -0,0 +1,53 @@
+"""
+Conversation Model - Message threads and their participants
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class Conversation(Base):
+    """
+    A message thread between two users, optionally about a campaign
+    Carries a copy of its latest message so inboxes never scan messages
+    """
+    __tablename__ = "conversations"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    # "<campaign_id or 0>:<lower user id>:<higher user id>"; one thread per pair and campaign
+    key = Column(String, nullable=False, unique=True)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=True)
+    
+    # Latest message (denormalized on every send)
+    last_message_id = Column(Integer, nullable=True)
+    last_message_sender_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    last_message_preview = Column(String, nullable=True)
+    last_message_at = Column(DateTime(timezone=True), nullable=True)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    campaign = relationship("Campaign", foreign_keys=[campaign_id])
+    participants = relationship("ConversationParticipant", back_populates="conversation", cascade="all, delete-orphan")
+
+
+class ConversationParticipant(Base):
+    """A user's membership in a conversation, with their unread count"""
+    __tablename__ = "conversation_participants"
+    __table_args__ = (
+        # Inbox pages, most recently active first
+        Index("ix_conversation_participants_user_id_last_message_id", "user_id", "last_message_id"),
+    )
+    
+    conversation_id = Column(Integer, ForeignKey("conversations.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    
+    unread_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Copy of Conversation.last_message_id, so the inbox is a range read on one index
+    last_message_id = Column(Integer, nullable=True)
+    last_read_message_id = Column(Integer, nullable=True)
+    
+    # Relationships
+    conversation = relationship("Conversation", back_populates="participants")
+    user = relationship("User", foreign_keys=[user_id])
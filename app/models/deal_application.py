@@ -1,7 +1,7 @@
 """
 Deal Application Model - For influencer applications to deals
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, JSON, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -20,6 +20,12 @@ class ApplicationStatus(str, enum.Enum):
 class DealApplication(Base):
     """Deal application model - Influencer applies to deal"""
     __tablename__ = "deal_applications"
+    __table_args__ = (
+        # One application per influencer and deal; applying relies on it instead of a pre-read
+        Index("uq_deal_applications_campaign_id_influencer_id", "campaign_id", "influencer_id", unique=True),
+        Index("ix_deal_applications_campaign_id_id", "campaign_id", "id"),
+        Index("ix_deal_applications_influencer_id_id", "influencer_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
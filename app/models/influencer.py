@@ -4,7 +4,7 @@ Influencer Model
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Float
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class Influencer(Base):
@@ -38,7 +38,7 @@ class Influencer(Base):
     base_rate = Column(Float)  # Base rate per post/campaign
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=utcnow)  # Sub-second: ETags are derived from it
     
     # Saved deals (Phase 1)
     saved_deals = Column(JSON, default=[])  # Array of campaign IDs that influencer saved
@@ -1,7 +1,7 @@
 """
 Message Model - For direct and group messaging
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -10,11 +10,17 @@ from app.core.database import Base
 class Message(Base):
     """Message model for communication between brands and influencers"""
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_recipient_id_created_at", "recipient_id", "created_at"),
+        # Conversation history, newest first
+        Index("ix_messages_conversation_id_id", "conversation_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     recipient_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Nullable for group messages
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=True)  # For campaign-specific chats
+    conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=True)
     
     subject = Column(String)
     content = Column(Text, nullable=False)
@@ -31,4 +37,5 @@ class Message(Base):
     # Relationships
     sender = relationship("User", foreign_keys=[sender_id])
     recipient = relationship("User", foreign_keys=[recipient_id])
+    conversation = relationship("Conversation", foreign_keys=[conversation_id])
 
@@ -1,7 +1,7 @@
 """
 Notification Model - For in-app and email notifications
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -24,6 +24,13 @@ class NotificationType(str, enum.Enum):
 class Notification(Base):
     """Notification model"""
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Inbox / unread lookups per user, newest first
+        Index("ix_notifications_user_id_is_read_created_at", "user_id", "is_read", "created_at"),
+        # Inbox pages, newest first (all / unread only)
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        Index("ix_notifications_user_id_is_read_id", "user_id", "is_read", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,7 +1,7 @@
 """
 Payment and Milestone Models - For smart contract-based payments
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -56,6 +56,9 @@ class Payment(Base):
 class Milestone(Base):
     """Milestone model for milestone-based payments - Phase 1"""
     __tablename__ = "milestones"
+    __table_args__ = (
+        Index("ix_milestones_campaign_id_due_date", "campaign_id", "due_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
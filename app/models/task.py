@@ -1,11 +1,11 @@
 """
 Task Model - For Kanban-style task management
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, JSON, Index, Float
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class TaskStatus(str, enum.Enum):
@@ -29,6 +29,13 @@ class TaskPriority(str, enum.Enum):
 class Task(Base):
     """Task model for campaign task management"""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Task lists filtered by campaign and/or influencer, paged by id
+        Index("ix_tasks_campaign_id_id", "campaign_id", "id"),
+        Index("ix_tasks_influencer_id_id", "influencer_id", "id"),
+        # Kanban board columns in rank order
+        Index("ix_tasks_campaign_id_status_position", "campaign_id", "status", "position"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
@@ -44,8 +51,9 @@ class Task(Base):
     deliverable_type = Column(String)  # e.g., "instagram_post", "youtube_video", "blog_post"
     requirements = Column(Text)
     
-    # Position for Kanban board
-    position = Column(Integer, default=0)  # For drag-and-drop ordering
+    # Position for Kanban board: fractional rank within a status column,
+    # ordered by (position, id); see app/services/kanban.py
+    position = Column(Float, default=0.0)
     
     # Review and Approval
     submitted_at = Column(DateTime(timezone=True))
@@ -55,7 +63,7 @@ class Task(Base):
     
     extra_data = Column(JSON, default={})
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=utcnow)  # Sub-second: ETags are derived from it
     
     # Relationships
     campaign = relationship("Campaign", back_populates="tasks")
@@ -0,0 +1,38 @@
+"""
+Deal Application Schemas
+"""
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from app.models.deal_application import ApplicationStatus
+
+
+class ApplicationCreate(BaseModel):
+    """Schema for applying to a deal"""
+    campaign_id: int
+    proposal_text: Optional[str] = Field(None, max_length=5000)
+    quoted_amount: Optional[float] = Field(None, ge=0)
+    rate_card_url: Optional[str] = None
+    portfolio_items: List[str] = []
+
+
+class ApplicationResponse(BaseModel):
+    """Schema for deal application response"""
+    id: int
+    campaign_id: int
+    influencer_id: int
+    status: ApplicationStatus
+    proposal_text: Optional[str] = None
+    quoted_amount: Optional[float] = None
+    rate_card_url: Optional[str] = None
+    portfolio_items: List[Any] = []
+    engagement_rate_at_application: Optional[float] = None
+    follower_count_at_application: Optional[int] = None
+    reviewed_at: Optional[datetime] = None
+    rejection_reason: Optional[str] = None
+    extra_data: Dict[str, Any] = {}
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -19,7 +19,12 @@ class CampaignBase(BaseModel):
 
 class CampaignCreate(CampaignBase):
     """Schema for campaign creation"""
+    budget: float
+    deadline: datetime  # Application deadline
     influencer_id: Optional[int] = None
+    platforms: Optional[List[str]] = None
+    niches: Optional[List[str]] = None
+    required_follower_count: Optional[int] = None
     required_deliverables: Optional[List[str]] = None
     target_audience: Optional[Dict[str, Any]] = None
     content_guidelines: Optional[str] = None
@@ -32,9 +37,13 @@ class CampaignUpdate(BaseModel):
     brief: Optional[str] = None
     status: Optional[CampaignStatus] = None
     budget: Optional[float] = None
+    deadline: Optional[datetime] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     influencer_id: Optional[int] = None
+    platforms: Optional[List[str]] = None
+    niches: Optional[List[str]] = None
+    required_follower_count: Optional[int] = None
     required_deliverables: Optional[List[str]] = None
     target_audience: Optional[Dict[str, Any]] = None
     content_guidelines: Optional[str] = None
@@ -47,6 +56,10 @@ class CampaignResponse(CampaignBase):
     brand_id: int
     influencer_id: Optional[int] = None
     status: CampaignStatus
+    deadline: Optional[datetime] = None
+    platforms: List[str] = []
+    niches: List[str] = []
+    required_follower_count: Optional[int] = None
     required_deliverables: List[str] = []
     target_audience: Dict[str, Any] = {}
     content_guidelines: Optional[str] = None
@@ -54,6 +67,9 @@ class CampaignResponse(CampaignBase):
     clicks: int = 0
     conversions: int = 0
     engagement_rate: float = 0.0
+    view_count: int = 0
+    application_count: int = 0
+    trending_score: float = 0.0
     extra_data: Dict[str, Any] = {}
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -61,3 +77,9 @@ class CampaignResponse(CampaignBase):
     class Config:
         from_attributes = True
 
+
+
+class CampaignMatch(BaseModel):
+    """An open deal ranked for an influencer"""
+    campaign: CampaignResponse
+    score: float
@@ -58,3 +58,9 @@ class InfluencerResponse(InfluencerBase):
     class Config:
         from_attributes = True
 
+
+
+class InfluencerMatch(BaseModel):
+    """An influencer ranked for a campaign"""
+    influencer: InfluencerResponse
+    score: float
@@ -0,0 +1,49 @@
+"""
+Message and Conversation Schemas
+"""
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, List
+
+
+class MessageCreate(BaseModel):
+    """Schema for sending a message"""
+    recipient_id: int
+    campaign_id: Optional[int] = None  # Thread the message under a campaign
+    subject: Optional[str] = None
+    content: str = Field(..., min_length=1, max_length=10000)
+    attachments: List[str] = []
+
+
+class MessageResponse(BaseModel):
+    """Schema for message response"""
+    id: int
+    conversation_id: int
+    sender_id: int
+    recipient_id: Optional[int] = None
+    campaign_id: Optional[int] = None
+    subject: Optional[str] = None
+    content: str
+    is_read: bool = False
+    attachments: List[str] = []
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class ConversationResponse(BaseModel):
+    """Schema for an inbox entry"""
+    id: int
+    campaign_id: Optional[int] = None
+    counterpart_id: int
+    last_message_id: int
+    last_message_sender_id: int
+    last_message_preview: str
+    last_message_at: datetime
+    unread_count: int
+
+
+class ConversationReadResponse(BaseModel):
+    """Schema for mark-conversation-read response"""
+    marked_read: int
@@ -0,0 +1,50 @@
+"""
+Notification Schemas
+"""
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from app.core.config import settings
+from app.models.notification import NotificationType
+
+
+class NotificationResponse(BaseModel):
+    """Schema for notification response"""
+    id: int
+    notification_type: NotificationType
+    title: str
+    message: str
+    related_campaign_id: Optional[int] = None
+    related_application_id: Optional[int] = None
+    related_milestone_id: Optional[int] = None
+    is_read: bool = False
+    read_at: Optional[datetime] = None
+    action_url: Optional[str] = None
+    extra_data: Dict[str, Any] = {}
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class UnreadCountResponse(BaseModel):
+    """Schema for the unread badge"""
+    unread: int
+
+
+class NotificationMarkRead(BaseModel):
+    """Schema for marking notifications read: given ids, or all of them"""
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=settings.MAX_PAGE_SIZE)
+    all: bool = False
+    
+    @model_validator(mode="after")
+    def check_target(self):
+        if self.all == (self.ids is not None):
+            raise ValueError("Provide either ids or all=true")
+        return self
+
+
+class NotificationMarkReadResponse(BaseModel):
+    """Schema for mark-read response"""
+    marked_read: int
+    unread: int
@@ -1,10 +1,12 @@
 """
 Task Schemas
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from app.core.config import settings
 from app.models.task import TaskStatus, TaskPriority
+from app.models.content import ContentStatus, ContentType
 
 
 class TaskBase(BaseModel):
@@ -32,7 +34,7 @@ class TaskUpdate(BaseModel):
     deliverable_type: Optional[str] = None
     requirements: Optional[str] = None
     due_date: Optional[datetime] = None
-    position: Optional[int] = None
+    position: Optional[float] = None
     review_notes: Optional[str] = None
     extra_data: Optional[Dict[str, Any]] = None
 
@@ -44,7 +46,7 @@ class TaskResponse(TaskBase):
     influencer_id: int
     status: TaskStatus
     priority: TaskPriority
-    position: int = 0
+    position: float = 0.0
     submitted_at: Optional[datetime] = None
     reviewed_at: Optional[datetime] = None
     review_notes: Optional[str] = None
@@ -56,3 +58,89 @@ class TaskResponse(TaskBase):
     class Config:
         from_attributes = True
 
+
+
+class TaskBulkItem(TaskBase):
+    """One task in a bulk create request (campaign is given once for the batch)"""
+    influencer_id: int
+    priority: TaskPriority = TaskPriority.MEDIUM
+
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating many tasks in one campaign"""
+    campaign_id: int
+    tasks: List[TaskBulkItem] = Field(..., min_length=1, max_length=settings.MAX_BULK_TASKS)
+
+
+class TaskBulkItemResult(BaseModel):
+    """Outcome for one item of a bulk create, in request order"""
+    index: int
+    created: bool
+    task: Optional[TaskResponse] = None
+    error: Optional[str] = None
+
+
+class TaskBulkResponse(BaseModel):
+    """Schema for bulk task creation response"""
+    campaign_id: int
+    created: int
+    failed: int
+    results: List[TaskBulkItemResult]
+
+
+class TaskMove(BaseModel):
+    """
+    Move one card: into `status` (its current column if omitted), between
+    the cards `after_id` (directly above) and `before_id` (directly below).
+    With neither neighbour the card goes to the bottom of the column.
+    """
+    task_id: int
+    status: Optional[TaskStatus] = None
+    after_id: Optional[int] = None
+    before_id: Optional[int] = None
+
+
+class TaskMoveRequest(BaseModel):
+    """Schema for moving one or more cards on a campaign board, applied in order"""
+    campaign_id: int
+    moves: List[TaskMove] = Field(..., min_length=1, max_length=settings.MAX_BULK_TASKS)
+
+
+class BoardContentSummary(BaseModel):
+    """Content submitted for a card, as shown on the board"""
+    id: int
+    title: Optional[str] = None
+    content_type: Optional[ContentType] = None
+    status: ContentStatus
+    thumbnail_url: Optional[str] = None
+    platform: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class BoardCard(BaseModel):
+    """A task card on the campaign board"""
+    id: int
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    position: float
+    due_date: Optional[datetime] = None
+    deliverable_type: Optional[str] = None
+    influencer_id: int
+    influencer_name: Optional[str] = None
+    content: Optional[BoardContentSummary] = None
+
+
+class BoardColumn(BaseModel):
+    """One Kanban column, cards in rank order"""
+    status: TaskStatus
+    tasks: List[BoardCard] = []
+
+
+class CampaignBoardResponse(BaseModel):
+    """Schema for a campaign's full Kanban board"""
+    campaign_id: int
+    columns: List[BoardColumn]
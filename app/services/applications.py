@@ -0,0 +1,140 @@
+"""
+Deal Applications
+
+An influencer applies to an open deal (active, no influencer assigned,
+deadline ahead) at most once. The unique index on (campaign_id,
+influencer_id) enforces that, so concurrent applies can't both succeed and
+applying needs no "already applied?" read first:
+
+- the application is one INSERT ... SELECT from the influencer's row, which
+  snapshots follower count and engagement rate without fetching them, and
+  only selects a row while the deal is open
+- ON CONFLICT on the unique index turns a repeat into a no-op, except that a
+  withdrawn application is revived with the new proposal
+- the deal's application_count is bumped by an UPDATE in the same
+  transaction, only when a row was actually written
+
+Withdrawing is one UPDATE guarded by status, plus the matching decrement, so
+application_count is the number of live (not withdrawn) applications.
+"""
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import JSON, Float, Integer, String, Text, func, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.deal_application import ApplicationStatus, DealApplication
+from app.models.influencer import Influencer
+from app.schemas.application import ApplicationCreate
+
+# Statuses an influencer can still withdraw from
+WITHDRAWABLE_STATUSES = (ApplicationStatus.PENDING, ApplicationStatus.NEGOTIATING)
+
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def application_insert(dialect: str, campaign_id: int, influencer_id: int, application_data: ApplicationCreate):
+    """
+    INSERT ... SELECT of an application snapshotting the influencer's metrics,
+    returning the new (or revived) row; no row when the deal isn't open or
+    the influencer already has a live application for it
+    """
+    applicant = (
+        select(
+            literal(campaign_id, Integer),
+            Influencer.id,
+            literal(ApplicationStatus.PENDING, DealApplication.status.type),
+            literal(application_data.proposal_text, Text),
+            literal(application_data.quoted_amount, Float),
+            literal(application_data.rate_card_url, String),
+            literal(application_data.portfolio_items, JSON),
+            Influencer.average_engagement_rate,
+            Influencer.total_followers,
+            literal({}, JSON),
+        )
+        .select_from(Influencer)
+        .join(Campaign, Campaign.id == campaign_id)
+        .where(
+            Influencer.id == influencer_id,
+            Campaign.status == CampaignStatus.ACTIVE,
+            Campaign.influencer_id.is_(None),
+            Campaign.deadline > datetime.now(timezone.utc),
+        )
+    )
+    statement = _UPSERT_INSERTS[dialect](DealApplication).from_select(
+        [
+            "campaign_id", "influencer_id", "status", "proposal_text", "quoted_amount", "rate_card_url",
+            "portfolio_items", "engagement_rate_at_application", "follower_count_at_application", "extra_data",
+        ],
+        applicant
+    )
+    revived = (
+        "status", "proposal_text", "quoted_amount", "rate_card_url", "portfolio_items",
+        "engagement_rate_at_application", "follower_count_at_application",
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[DealApplication.campaign_id, DealApplication.influencer_id],
+        set_={
+            **{column: statement.excluded[column] for column in revived},
+            "reviewed_at": None,
+            "reviewed_by": None,
+            "rejection_reason": None,
+            "updated_at": func.now(),
+        },
+        where=DealApplication.status == ApplicationStatus.WITHDRAWN,
+    ).returning(DealApplication)
+
+
+def _application_count_update(campaign_id: int, delta: int):
+    # A counter, not an edit of the deal: updated_at (and its ETag) stays
+    campaigns = Campaign.__table__
+    return (
+        update(campaigns)
+        .where(campaigns.c.id == campaign_id)
+        .values(
+            application_count=func.coalesce(campaigns.c.application_count, 0) + delta,
+            updated_at=campaigns.c.updated_at,
+        )
+    )
+
+
+async def apply_to_campaign(
+    db: AsyncSession, influencer_id: int, application_data: ApplicationCreate
+) -> Optional[DealApplication]:
+    """
+    Apply to a deal and count the application (the caller commits)
+    Returns None when nothing was written: the deal isn't open, or the
+    influencer already has a live application for it
+    """
+    campaign_id = application_data.campaign_id
+    result = await db.execute(
+        application_insert(db.bind.dialect.name, campaign_id, influencer_id, application_data),
+        # A revived application may already be in the session with its old values
+        execution_options={"populate_existing": True}
+    )
+    application = result.scalars().first()
+    if application is not None:
+        await db.execute(_application_count_update(campaign_id, 1))
+    return application
+
+
+async def withdraw_application(db: AsyncSession, application_id: int, influencer_id: int) -> Optional[DealApplication]:
+    """
+    Withdraw one of the influencer's pending or negotiating applications
+    and uncount it (the caller commits); None when there is no such application
+    """
+    result = await db.execute(
+        update(DealApplication)
+        .where(
+            DealApplication.id == application_id,
+            DealApplication.influencer_id == influencer_id,
+            DealApplication.status.in_(WITHDRAWABLE_STATUSES),
+        )
+        .values(status=ApplicationStatus.WITHDRAWN, updated_at=func.now())
+        .returning(DealApplication)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    application = result.scalars().first()
+    if application is not None:
+        await db.execute(_application_count_update(application.campaign_id, -1))
+    return application
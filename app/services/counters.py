@@ -0,0 +1,133 @@
+"""
+Campaign Counters
+
+Deal views, feed impressions and click-throughs bump counters on the
+campaign row. Writing each one as its own UPDATE would make popular
+deals lock hotspots (and on SQLite every write serializes behind one lock).
+
+Instead each worker adds increments to an in-memory CounterBuffer and
+writes them every COUNTER_FLUSH_SECONDS as one executemany of
+
+    UPDATE campaigns SET view_count = view_count + :view_count, ... WHERE id = :campaign_id
+
+with one parameter set per campaign, however many increments it received.
+The buffer also flushes early once COUNTER_FLUSH_MAX_CAMPAIGNS campaigns
+have pending counts, and on shutdown.
+
+Loss is bounded: a worker that crashes (or is killed without a graceful
+shutdown) loses the increments since its last flush, normally at most
+COUNTER_FLUSH_SECONDS' worth. A failed flush keeps its increments for the
+next attempt. These counters are
+for ranking and analytics, where this trade is acceptable; they must not
+be used for anything that needs exact counts. application_count is exact,
+so it isn't buffered: app/services/applications.py updates it in the
+application's own transaction.
+"""
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Optional
+from sqlalchemy import bindparam, func, update
+from app.core.config import settings
+from app.models.campaign import Campaign
+from app.services.ranking import trending_refresher
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = ("view_count", "impressions", "clicks")
+# Counters that feed the trending score
+RANKED_FIELDS = ("view_count",)
+
+
+def counter_update_statement():
+    """
+    UPDATE adding per-campaign deltas to every counter, for executemany
+    Leaves updated_at alone: counters aren't edits and mustn't change ETags
+    """
+    campaigns = Campaign.__table__
+    return (
+        update(campaigns)
+        .where(campaigns.c.id == bindparam("campaign_id"))
+        .values({
+            **{field: func.coalesce(campaigns.c[field], 0) + bindparam(field) for field in COUNTER_FIELDS},
+            "updated_at": campaigns.c.updated_at,
+        })
+    )
+
+
+class CounterBuffer:
+    """Per-worker campaign counter increments, written in periodic batches"""
+    
+    def __init__(self):
+        self._pending: Dict[int, Counter] = defaultdict(Counter)
+        self._task: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Task] = None
+    
+    def increment(self, campaign_id: int, field: str, amount: int = 1) -> None:
+        self._pending[campaign_id][field] += amount
+        if len(self._pending) >= settings.COUNTER_FLUSH_MAX_CAMPAIGNS:
+            self._flush_soon()
+    
+    def increment_many(self, campaign_ids: Iterable[int], field: str, amount: int = 1) -> None:
+        for campaign_id in campaign_ids:
+            self._pending[campaign_id][field] += amount
+        if len(self._pending) >= settings.COUNTER_FLUSH_MAX_CAMPAIGNS:
+            self._flush_soon()
+    
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+    
+    def _flush_soon(self) -> None:
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.create_task(self.flush())
+    
+    def _restore(self, pending: Dict[int, Counter]) -> None:
+        for campaign_id, deltas in pending.items():
+            self._pending[campaign_id].update(deltas)
+    
+    async def flush(self) -> int:
+        """Write pending increments; returns the number of campaigns updated"""
+        if not self._pending:
+            return 0
+        from app.core.database import AsyncSessionLocal
+        pending, self._pending = self._pending, defaultdict(Counter)
+        # Same row order in every worker, so concurrent flushes can't deadlock
+        params = [
+            {"campaign_id": campaign_id, **{field: deltas[field] for field in COUNTER_FIELDS}}
+            for campaign_id, deltas in sorted(pending.items())
+        ]
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(counter_update_statement(), params)
+                await db.commit()
+        except Exception:
+            self._restore(pending)
+            logger.exception(f"Flushing counters for {len(params)} campaigns failed")
+            return 0
+        trending_refresher.mark_dirty(
+            campaign_id for campaign_id, deltas in pending.items()
+            if any(deltas[field] for field in RANKED_FIELDS)
+        )
+        return len(params)
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.COUNTER_FLUSH_SECONDS)
+            await self.flush()
+    
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the periodic flush and write whatever is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._flushing is not None:
+            await self._flushing
+        await self.flush()
+
+
+counter_buffer = CounterBuffer()
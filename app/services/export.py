@@ -0,0 +1,174 @@
+"""
+Streaming Exports
+
+Export endpoints return a StreamingResponse whose body is produced from a
+streamed result: rows are fetched in batches of EXPORT_BATCH_SIZE
+(yield_per, a server-side cursor on PostgreSQL) and each batch is encoded
+to NDJSON or CSV and sent before the next one is fetched. Memory stays
+flat regardless of the row count, and the event loop is released between
+batches so other requests keep being served during a long export.
+
+A running export holds one pooled connection for its whole duration, in
+a session of its own (the request's session is not used once the
+response starts). At most MAX_CONCURRENT_EXPORTS run at once; further
+exports wait for a slot instead of draining the pool.
+"""
+import asyncio
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Sequence
+import orjson
+from sqlalchemy import case, distinct, func, select
+from app.core.config import settings
+from app.models.campaign import Campaign
+from app.models.content import Content
+from app.models.influencer import Influencer
+from app.models.task import Task, TaskStatus
+
+
+class ExportFormat(str, enum.Enum):
+    """Export body format"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+_export_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_EXPORTS)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+def encode_ndjson(columns: Sequence[str], rows: Sequence[Sequence]) -> bytes:
+    """One JSON object per line"""
+    return b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+
+def encode_csv(columns: Sequence[str], rows: Sequence[Sequence], header: bool = False) -> bytes:
+    """CSV lines, optionally preceded by the header row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_export(query, fmt: ExportFormat) -> AsyncIterator[bytes]:
+    """
+    Body iterator for a StreamingResponse: runs a select() of labelled
+    columns in its own session and yields one encoded chunk per batch
+    """
+    from app.core.database import AsyncSessionLocal
+    columns: List[str] = [column.key for column in query.selected_columns]
+    async with _export_slots:
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+            if fmt == ExportFormat.CSV:
+                # Header even for an empty export
+                yield encode_csv(columns, [], header=True)
+            async for rows in result.partitions():
+                if fmt == ExportFormat.CSV:
+                    yield encode_csv(columns, rows)
+                else:
+                    yield encode_ndjson(columns, rows)
+
+
+def campaigns_export_query(brand_id: int):
+    """A brand's campaigns"""
+    return (
+        select(
+            Campaign.id,
+            Campaign.title,
+            Campaign.status,
+            Campaign.budget,
+            Campaign.deadline,
+            Campaign.start_date,
+            Campaign.end_date,
+            Campaign.influencer_id,
+            Campaign.platforms,
+            Campaign.impressions,
+            Campaign.clicks,
+            Campaign.conversions,
+            Campaign.engagement_rate,
+            Campaign.application_count,
+            Campaign.created_at,
+            Campaign.updated_at,
+        )
+        .where(Campaign.brand_id == brand_id)
+        .order_by(Campaign.id)
+    )
+
+
+def tasks_export_query(brand_id: int, campaign_id: Optional[int] = None):
+    """A brand's tasks (optionally one campaign's) with their content status"""
+    query = (
+        select(
+            Task.id,
+            Task.campaign_id,
+            Campaign.title.label("campaign_title"),
+            Task.influencer_id,
+            Task.title,
+            Task.status,
+            Task.priority,
+            Task.deliverable_type,
+            Task.due_date,
+            Task.submitted_at,
+            Task.reviewed_at,
+            Content.id.label("content_id"),
+            Content.status.label("content_status"),
+            Content.platform.label("content_platform"),
+            Content.post_url.label("content_post_url"),
+            Task.created_at,
+            Task.updated_at,
+        )
+        .join(Campaign, Campaign.id == Task.campaign_id)
+        .outerjoin(Content, Content.task_id == Task.id)
+        .where(Campaign.brand_id == brand_id)
+        .order_by(Campaign.id, Task.id)
+    )
+    if campaign_id is not None:
+        query = query.where(Task.campaign_id == campaign_id)
+    return query
+
+
+def roster_export_query(brand_id: int):
+    """Influencers with tasks on a brand's campaigns, with per-influencer counts"""
+    return (
+        select(
+            Influencer.id,
+            Influencer.full_name,
+            Influencer.niche,
+            Influencer.location,
+            Influencer.total_followers,
+            Influencer.average_engagement_rate,
+            Influencer.instagram_handle,
+            Influencer.youtube_handle,
+            Influencer.tiktok_handle,
+            func.count(distinct(Task.campaign_id)).label("campaigns"),
+            func.count(Task.id).label("tasks"),
+            func.sum(case((Task.status == TaskStatus.COMPLETED, 1), else_=0)).label("tasks_completed"),
+            func.max(Task.updated_at).label("last_activity_at"),
+        )
+        .join(Task, Task.influencer_id == Influencer.id)
+        .join(Campaign, Campaign.id == Task.campaign_id)
+        .where(Campaign.brand_id == brand_id)
+        .group_by(Influencer.id)
+        .order_by(Influencer.id)
+    )
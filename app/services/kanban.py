@@ -0,0 +1,85 @@
+"""
+Kanban Board Ordering
+
+Tasks in a board column are ordered by (position, id), where position is a
+fractional rank. Moving a card sets its position to the midpoint of its new
+neighbours, so a move updates only the moved rows, never the cards below.
+
+Repeated inserts into the same gap halve it each time. Once the gap shrinks
+below RANK_MIN_GAP, the column is renumbered to evenly spaced ranks
+(POSITION_STEP apart). This is done inline when there is no room left, and
+otherwise in the background once the gap drops below RANK_REBALANCE_GAP.
+"""
+import logging
+from typing import Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.task import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+POSITION_STEP = 1024.0
+# Below this gap a midpoint may collapse onto a neighbour: rebalance first
+RANK_MIN_GAP = 1e-9
+# Below this gap schedule a background rebalance to keep ranks compact
+RANK_REBALANCE_GAP = 1e-3
+
+
+def position_between(after: Optional[float], before: Optional[float]) -> float:
+    """Rank strictly between the card above (after) and the card below (before)"""
+    if after is None and before is None:
+        return POSITION_STEP
+    if after is None:
+        return before - POSITION_STEP
+    if before is None:
+        return after + POSITION_STEP
+    return (after + before) / 2
+
+
+def gap_between(after: Optional[float], before: Optional[float]) -> float:
+    """Room left between two neighbours (infinite at either end of a column)"""
+    if after is None or before is None:
+        return float("inf")
+    return before - after
+
+
+def next_position_query(campaign_id: int, status: TaskStatus = TaskStatus.TODO):
+    """Scalar subquery for the rank after the last card in a column"""
+    return (
+        select(func.coalesce(func.max(Task.position), 0.0) + POSITION_STEP)
+        .where(Task.campaign_id == campaign_id, Task.status == status)
+        .scalar_subquery()
+    )
+
+
+async def rebalance_column(db: AsyncSession, campaign_id: int, status: TaskStatus) -> int:
+    """
+    Renumber a column to POSITION_STEP, 2*POSITION_STEP, ... keeping its order
+    Runs inside the caller's transaction; returns the number of cards
+    """
+    result = await db.execute(
+        select(Task.id)
+        .where(Task.campaign_id == campaign_id, Task.status == status)
+        .order_by(Task.position, Task.id)
+    )
+    task_ids = result.scalars().all()
+    if task_ids:
+        # ORM bulk UPDATE by primary key: one executemany
+        await db.execute(
+            update(Task),
+            [{"id": task_id, "position": (n + 1) * POSITION_STEP} for n, task_id in enumerate(task_ids)],
+            execution_options={"synchronize_session": False}
+        )
+    return len(task_ids)
+
+
+async def rebalance_column_background(campaign_id: int, status: TaskStatus) -> None:
+    """BackgroundTasks entry point: rebalance in a session of its own"""
+    from app.core.database import AsyncSessionLocal
+    try:
+        async with AsyncSessionLocal() as db:
+            count = await rebalance_column(db, campaign_id, status)
+            await db.commit()
+        logger.info(f"Rebalanced {count} cards in campaign {campaign_id} column {status.value}")
+    except Exception:
+        logger.exception(f"Rebalancing campaign {campaign_id} column {status.value} failed")
@@ -0,0 +1,400 @@
+"""
+Influencer-Campaign Matching
+
+Scores "best influencers for this campaign" and "best deals for this
+influencer" in one vectorized NumPy pass instead of a query per candidate.
+
+Each worker keeps a compact column snapshot of the features matching needs:
+
+- influencers: log reach, engagement rate, base rate, niche and location
+  (as vocabulary codes) and a platform bitmask, under 40 bytes a profile
+- open deals: follower minimum, platform bitmask, budget, deadline and up to
+  MAX_TARGETS niche / location codes each
+
+A match score is a weighted sum of niche match, location match, engagement,
+reach and budget fit (MATCH_WEIGHT_* settings), over candidates that meet
+the deal's hard requirements (follower minimum, one of its platforms). The
+top k come from np.argpartition, so only k candidates are ever sorted.
+
+Profile and deal changes in this worker update their snapshot row in place.
+Snapshots are rebuilt in the background once older than
+MATCH_SNAPSHOT_MAX_AGE_SECONDS, which picks up other workers' changes.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import select
+from app.core.config import settings
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.influencer import Influencer
+
+logger = logging.getLogger(__name__)
+
+PLATFORM_BITS = {"instagram": 1, "youtube": 2, "tiktok": 4, "twitter": 8}
+INFLUENCER_HANDLES = {
+    "instagram": "instagram_handle",
+    "youtube": "youtube_handle",
+    "tiktok": "tiktok_handle",
+    "twitter": "twitter_handle",
+}
+# Niches / target locations per deal kept in the snapshot
+MAX_TARGETS = 8
+# Follower count treated as full reach (log scale)
+FULL_REACH_FOLLOWERS = 10_000_000
+# Engagement rate (percent) treated as full engagement
+FULL_ENGAGEMENT_RATE = 10.0
+LOAD_BATCH_SIZE = 5000
+
+Match = Tuple[int, float]
+
+
+class Vocabulary:
+    """Maps normalized strings (niches, locations) to small integer codes; -1 for none"""
+    
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+    
+    def code(self, value: Optional[str]) -> int:
+        value = (value or "").strip().lower()
+        if not value:
+            return -1
+        return self._codes.setdefault(value, len(self._codes))
+    
+    def lookup(self, value: Optional[str]) -> int:
+        """Code of a value without adding it (-1 if unseen)"""
+        return self._codes.get((value or "").strip().lower(), -1)
+
+
+class ColumnStore:
+    """Growable set of NumPy columns with one row per entity id"""
+    
+    def __init__(self, columns: Dict[str, Tuple[np.dtype, object, tuple]], capacity: int = 1024):
+        self._spec = columns
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.columns = {
+            name: np.full((capacity, *shape), fill, dtype=dtype) for name, (dtype, fill, shape) in columns.items()
+        }
+        self.rows: Dict[int, int] = {}
+        self.size = 0
+    
+    def column(self, name: str) -> np.ndarray:
+        """View of a column's filled rows"""
+        return self.columns[name][:self.size]
+    
+    def _grow(self) -> None:
+        capacity = len(self.ids) * 2
+        self.ids = np.resize(self.ids, capacity)
+        for name, (dtype, fill, shape) in self._spec.items():
+            grown = np.full((capacity, *shape), fill, dtype=dtype)
+            grown[:self.size] = self.columns[name][:self.size]
+            self.columns[name] = grown
+    
+    def row(self, entity_id: int) -> int:
+        """Row index of an entity, appending a row for new ones"""
+        row = self.rows.get(entity_id)
+        if row is None:
+            if self.size == len(self.ids):
+                self._grow()
+            row = self.size
+            self.size += 1
+            self.ids[row] = entity_id
+            self.rows[entity_id] = row
+        return row
+    
+    def set(self, entity_id: int, **values) -> None:
+        row = self.row(entity_id)
+        for name, value in values.items():
+            self.columns[name][row] = value
+
+
+def _platform_mask(platforms: Iterable[str]) -> int:
+    mask = 0
+    for platform in platforms or ():
+        mask |= PLATFORM_BITS.get(str(platform).strip().lower(), 0)
+    return mask
+
+
+def _target_codes(vocabulary: Vocabulary, values: Iterable[Optional[str]]) -> np.ndarray:
+    codes = np.full(MAX_TARGETS, -1, dtype=np.int32)
+    distinct = [code for code in dict.fromkeys(vocabulary.code(value) for value in values) if code >= 0]
+    codes[:min(len(distinct), MAX_TARGETS)] = distinct[:MAX_TARGETS]
+    return codes
+
+
+def _target_locations(target_audience) -> List[str]:
+    """Locations a deal targets: target_audience["locations"] or ["location"]"""
+    if not isinstance(target_audience, dict):
+        return []
+    locations = target_audience.get("locations", target_audience.get("location"))
+    if isinstance(locations, str):
+        return [locations]
+    return [location for location in locations or () if isinstance(location, str)]
+
+
+def _reach(followers: int) -> float:
+    return min(np.log10(1 + followers) / np.log10(1 + FULL_REACH_FOLLOWERS), 1.0)
+
+
+def _influencer_platforms(influencer) -> int:
+    return _platform_mask(platform for platform, handle in INFLUENCER_HANDLES.items() if getattr(influencer, handle))
+
+
+def _epoch(value: Optional[datetime]) -> float:
+    if value is None:
+        return np.inf
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass
+class MatchWeights:
+    niche: float
+    location: float
+    engagement: float
+    reach: float
+    budget: float
+    
+    @classmethod
+    def from_settings(cls) -> "MatchWeights":
+        return cls(
+            niche=settings.MATCH_WEIGHT_NICHE,
+            location=settings.MATCH_WEIGHT_LOCATION,
+            engagement=settings.MATCH_WEIGHT_ENGAGEMENT,
+            reach=settings.MATCH_WEIGHT_REACH,
+            budget=settings.MATCH_WEIGHT_BUDGET,
+        )
+
+
+def match_scores(niche_match, location_match, engagement, reach, base_rate, budget, weights: MatchWeights):
+    """Weighted match score; arguments broadcast (arrays for candidates, scalars for the subject)"""
+    engagement = np.clip(engagement / FULL_ENGAGEMENT_RATE, 0.0, 1.0)
+    # Rates unknown: neutral fit; otherwise the share of the rate the budget covers
+    with np.errstate(divide="ignore", invalid="ignore"):
+        budget_fit = np.where(base_rate > 0, np.clip(budget / base_rate, 0.0, 1.0), 0.5)
+    return (
+        weights.niche * niche_match
+        + weights.location * location_match
+        + weights.engagement * engagement
+        + weights.reach * reach
+        + weights.budget * budget_fit
+    )
+
+
+def top_k(ids: np.ndarray, scores: np.ndarray, eligible: np.ndarray, k: int) -> List[Match]:
+    """Best k eligible (id, score) pairs, highest first, via argpartition"""
+    candidates = np.flatnonzero(eligible)
+    if k <= 0 or not len(candidates):
+        return []
+    candidate_scores = scores[candidates]
+    if len(candidates) > k:
+        best = np.argpartition(-candidate_scores, k - 1)[:k]
+        candidates, candidate_scores = candidates[best], candidate_scores[best]
+    order = np.lexsort((ids[candidates], -candidate_scores))
+    return [(int(ids[candidates[i]]), float(candidate_scores[i])) for i in order]
+
+
+class MatchingEngine:
+    """Per-worker feature snapshots of influencers and open deals"""
+    
+    def __init__(self):
+        self.niches = Vocabulary()
+        self.locations = Vocabulary()
+        self.influencers: Optional[ColumnStore] = None
+        self.campaigns: Optional[ColumnStore] = None
+        self.loaded_at = 0.0
+        self._load_lock = asyncio.Lock()
+        self._reload: Optional[asyncio.Task] = None
+        # Changes made while a rebuild is reading the database, replayed onto it
+        self._replay: Optional[list] = None
+    
+    @staticmethod
+    def _influencer_store() -> ColumnStore:
+        return ColumnStore({
+            "reach": (np.float32, 0.0, ()),
+            "engagement": (np.float32, 0.0, ()),
+            "base_rate": (np.float32, np.nan, ()),
+            "followers": (np.int64, 0, ()),
+            "niche": (np.int32, -1, ()),
+            "location": (np.int32, -1, ()),
+            "platforms": (np.uint8, 0, ()),
+        })
+    
+    @staticmethod
+    def _campaign_store() -> ColumnStore:
+        return ColumnStore({
+            "open": (np.bool_, False, ()),
+            "min_followers": (np.int64, 0, ()),
+            "platforms": (np.uint8, 0, ()),
+            "budget": (np.float64, 0.0, ()),
+            "deadline": (np.float64, np.inf, ()),
+            "niches": (np.int32, -1, (MAX_TARGETS,)),
+            "locations": (np.int32, -1, (MAX_TARGETS,)),
+        })
+    
+    def _set_influencer(self, store: ColumnStore, influencer) -> None:
+        followers = influencer.total_followers or 0
+        store.set(
+            influencer.id,
+            reach=_reach(followers),
+            engagement=influencer.average_engagement_rate or 0.0,
+            base_rate=influencer.base_rate if influencer.base_rate is not None else np.nan,
+            followers=followers,
+            niche=self.niches.code(influencer.niche),
+            location=self.locations.code(influencer.location),
+            platforms=_influencer_platforms(influencer),
+        )
+    
+    def _set_campaign(self, store: ColumnStore, campaign) -> None:
+        store.set(
+            campaign.id,
+            open=campaign.status == CampaignStatus.ACTIVE and campaign.influencer_id is None,
+            min_followers=campaign.required_follower_count or 0,
+            platforms=_platform_mask(campaign.platforms),
+            budget=campaign.budget or 0.0,
+            deadline=_epoch(campaign.deadline),
+            niches=_target_codes(self.niches, campaign.niches or ()),
+            locations=_target_codes(self.locations, _target_locations(campaign.target_audience)),
+        )
+    
+    async def _build(self) -> Tuple[ColumnStore, ColumnStore]:
+        from app.core.database import AsyncSessionLocal
+        influencers, campaigns = self._influencer_store(), self._campaign_store()
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(
+                select(
+                    Influencer.id, Influencer.total_followers, Influencer.average_engagement_rate,
+                    Influencer.base_rate, Influencer.niche, Influencer.location,
+                    *(getattr(Influencer, handle) for handle in INFLUENCER_HANDLES.values()),
+                ).execution_options(yield_per=LOAD_BATCH_SIZE)
+            )
+            async for rows in result.partitions():
+                for row in rows:
+                    self._set_influencer(influencers, row)
+            # Only deals that can still be matched; others join when updated to active
+            result = await db.stream(
+                select(
+                    Campaign.id, Campaign.status, Campaign.influencer_id, Campaign.required_follower_count,
+                    Campaign.platforms, Campaign.budget, Campaign.deadline, Campaign.niches,
+                    Campaign.target_audience,
+                )
+                .where(
+                    Campaign.status == CampaignStatus.ACTIVE,
+                    Campaign.influencer_id.is_(None),
+                    Campaign.deadline > datetime.now(timezone.utc),
+                )
+                .execution_options(yield_per=LOAD_BATCH_SIZE)
+            )
+            async for rows in result.partitions():
+                for row in rows:
+                    self._set_campaign(campaigns, row)
+        return influencers, campaigns
+    
+    async def _rebuild(self) -> None:
+        self._replay = []
+        try:
+            started = time.perf_counter()
+            influencers, campaigns = await self._build()
+            for kind, entity in self._replay:
+                if kind == "influencer":
+                    self._set_influencer(influencers, entity)
+                else:
+                    self._set_campaign(campaigns, entity)
+            self.influencers, self.campaigns = influencers, campaigns
+            self.loaded_at = time.monotonic()
+            logger.info(
+                f"Matching snapshot: {influencers.size} influencers, {campaigns.size} open deals "
+                f"in {time.perf_counter() - started:.2f}s"
+            )
+        finally:
+            self._replay = None
+    
+    async def _background_rebuild(self) -> None:
+        try:
+            await self._rebuild()
+        except Exception:
+            logger.exception("Rebuilding the matching snapshot failed")
+    
+    async def ensure_loaded(self) -> None:
+        """Build the snapshots on first use; refresh stale ones in the background"""
+        if self.influencers is None:
+            async with self._load_lock:
+                if self.influencers is None:
+                    await self._rebuild()
+        elif time.monotonic() - self.loaded_at > settings.MATCH_SNAPSHOT_MAX_AGE_SECONDS:
+            if self._reload is None or self._reload.done():
+                self._reload = asyncio.create_task(self._background_rebuild())
+    
+    def update_influencer(self, influencer: Influencer) -> None:
+        """Apply a profile change made in this worker"""
+        if self._replay is not None:
+            self._replay.append(("influencer", influencer))
+        if self.influencers is not None:
+            self._set_influencer(self.influencers, influencer)
+    
+    def update_campaign(self, campaign: Campaign) -> None:
+        """Apply a deal change made in this worker"""
+        if self._replay is not None:
+            self._replay.append(("campaign", campaign))
+        if self.campaigns is not None:
+            self._set_campaign(self.campaigns, campaign)
+    
+    async def influencers_for_campaign(self, campaign: Campaign, k: int, weights: Optional[MatchWeights] = None) -> List[Match]:
+        """Top k (influencer_id, score) for a deal"""
+        await self.ensure_loaded()
+        weights = weights or MatchWeights.from_settings()
+        store = self.influencers
+        niches = _target_codes(self.niches, campaign.niches or ())
+        locations = _target_codes(self.locations, _target_locations(campaign.target_audience))
+        niches, locations = niches[niches >= 0], locations[locations >= 0]
+        
+        eligible = store.column("followers") >= (campaign.required_follower_count or 0)
+        required_platforms = _platform_mask(campaign.platforms)
+        if required_platforms:
+            eligible &= (store.column("platforms") & required_platforms) != 0
+        scores = match_scores(
+            np.isin(store.column("niche"), niches),
+            np.isin(store.column("location"), locations),
+            store.column("engagement"),
+            store.column("reach"),
+            store.column("base_rate"),
+            campaign.budget or 0.0,
+            weights,
+        )
+        return top_k(store.ids[:store.size], scores, eligible, k)
+    
+    async def campaigns_for_influencer(self, influencer: Influencer, k: int, weights: Optional[MatchWeights] = None) -> List[Match]:
+        """Top k (campaign_id, score) open deals for an influencer"""
+        await self.ensure_loaded()
+        weights = weights or MatchWeights.from_settings()
+        store = self.campaigns
+        followers = influencer.total_followers or 0
+        platforms = _influencer_platforms(influencer)
+        niche = self.niches.lookup(influencer.niche)
+        location = self.locations.lookup(influencer.location)
+        deal_platforms = store.column("platforms")
+        
+        eligible = (
+            store.column("open")
+            & (store.column("deadline") > time.time())
+            & (store.column("min_followers") <= followers)
+            & ((deal_platforms == 0) | ((deal_platforms & platforms) != 0))
+        )
+        # An unknown niche/location (-1) would otherwise match the -1 padding slots
+        scores = match_scores(
+            (store.column("niches") == niche).any(axis=1) & (niche >= 0),
+            (store.column("locations") == location).any(axis=1) & (location >= 0),
+            influencer.average_engagement_rate or 0.0,
+            _reach(followers),
+            influencer.base_rate if influencer.base_rate is not None else np.nan,
+            store.column("budget"),
+            weights,
+        )
+        return top_k(store.ids[:store.size], scores, eligible, k)
+
+
+matching_engine = MatchingEngine()
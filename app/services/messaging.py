@@ -0,0 +1,153 @@
+"""
+Messaging
+
+Messages belong to a conversation: one thread per pair of users, or per pair
+and campaign for campaign chats. Inboxes and histories never aggregate over
+the messages table:
+
+- conversations carry a copy of their latest message (id, sender, preview,
+  time), so an inbox entry needs no "latest message per thread" GROUP BY
+- each participant row carries its own unread count and a copy of the
+  latest message id, so a user's inbox is a keyset range read on
+  (user_id, last_message_id) and history is one on (conversation_id, id)
+
+Sending a message writes the message and bumps both denormalized copies in
+the same transaction: four statements whatever the message volume.
+"""
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+from sqlalchemy import and_, case, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from app.models.conversation import Conversation, ConversationParticipant
+from app.models.message import Message
+from app.schemas.message import MessageCreate
+
+# Characters of the latest message kept on the conversation for inbox rows
+PREVIEW_LENGTH = 140
+
+
+def conversation_key(campaign_id: Optional[int], user_id: int, other_user_id: int) -> str:
+    """Unique key of the thread between two users (about a campaign, if given)"""
+    low, high = sorted((user_id, other_user_id))
+    return f"{campaign_id or 0}:{low}:{high}"
+
+
+async def find_conversation(db: AsyncSession, key: str) -> Optional[int]:
+    result = await db.execute(select(Conversation.id).where(Conversation.key == key))
+    return result.scalar()
+
+
+async def start_conversation(db: AsyncSession, key: str, campaign_id: Optional[int], user_ids: Iterable[int]) -> int:
+    """Create a conversation and its participants; returns its id"""
+    conversation = Conversation(key=key, campaign_id=campaign_id)
+    db.add(conversation)
+    try:
+        await db.flush()
+        db.add_all(ConversationParticipant(conversation_id=conversation.id, user_id=user_id) for user_id in user_ids)
+        await db.flush()
+    except IntegrityError:
+        # A concurrent first message created the same thread
+        await db.rollback()
+        return await find_conversation(db, key)
+    return conversation.id
+
+
+async def send_message(db: AsyncSession, conversation_id: int, sender_id: int, message_data: MessageCreate) -> Message:
+    """
+    Add a message to a conversation and update its latest-message copies
+    and the recipient's unread count (the caller commits)
+    """
+    now = datetime.now(timezone.utc)
+    message = Message(
+        conversation_id=conversation_id,
+        sender_id=sender_id,
+        recipient_id=message_data.recipient_id,
+        campaign_id=message_data.campaign_id,
+        subject=message_data.subject,
+        content=message_data.content,
+        attachments=message_data.attachments,
+        is_read=False,
+        is_group_message=False,
+        extra_data={},
+        created_at=now,
+    )
+    db.add(message)
+    await db.flush()
+    
+    await db.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(
+            last_message_id=message.id,
+            last_message_sender_id=sender_id,
+            last_message_preview=message_data.content[:PREVIEW_LENGTH],
+            last_message_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        update(ConversationParticipant)
+        .where(ConversationParticipant.conversation_id == conversation_id)
+        .values(
+            last_message_id=message.id,
+            unread_count=ConversationParticipant.unread_count + case(
+                (ConversationParticipant.user_id == message_data.recipient_id, 1), else_=0
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return message
+
+
+def inbox_query(user_id: int, unread_only: bool = False):
+    """A user's conversations with their counterpart and unread count (page by last_message_id)"""
+    me = ConversationParticipant
+    other = aliased(ConversationParticipant)
+    query = (
+        select(
+            Conversation.id,
+            Conversation.campaign_id,
+            other.user_id.label("counterpart_id"),
+            me.last_message_id,
+            Conversation.last_message_sender_id,
+            Conversation.last_message_preview,
+            Conversation.last_message_at,
+            me.unread_count,
+        )
+        .select_from(me)
+        .join(Conversation, Conversation.id == me.conversation_id)
+        .join(other, and_(other.conversation_id == me.conversation_id, other.user_id != me.user_id))
+        .where(me.user_id == user_id, me.last_message_id.is_not(None))
+    )
+    if unread_only:
+        query = query.where(me.unread_count > 0)
+    return query
+
+
+async def mark_conversation_read(db: AsyncSession, conversation_id: int, user_id: int) -> Optional[int]:
+    """
+    Mark the user's received messages in a conversation read and reset their
+    unread count; returns the count marked, or None if they aren't a participant
+    """
+    result = await db.execute(
+        update(ConversationParticipant)
+        .where(ConversationParticipant.conversation_id == conversation_id, ConversationParticipant.user_id == user_id)
+        .values(unread_count=0, last_read_message_id=ConversationParticipant.last_message_id)
+        .execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        return None
+    result = await db.execute(
+        update(Message)
+        .where(
+            Message.conversation_id == conversation_id,
+            Message.recipient_id == user_id,
+            Message.is_read == False,  # noqa: E712
+        )
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
@@ -0,0 +1,207 @@
+"""
+Notifications
+
+Every user row carries unread_notification_count, so the unread badge is a
+primary-key read instead of a COUNT over the inbox. Whatever inserts
+notifications or marks them read updates the counter in the same
+transaction, by the number of rows it actually changed.
+
+When a brand opens a deal (it becomes ACTIVE with no influencer assigned
+and a deadline ahead), every influencer matching its targeting gets a
+DEAL_POSTED notification. The fan-out runs after the response has
+been sent (BackgroundTasks), so posting a deal returns immediately however
+many influencers match. A deal is announced once: the fan-out first claims
+campaigns.deal_announced_at, so pausing and reactivating it (or a second
+queued fan-out) notifies nobody again.
+
+Notification rows are written with INSERT ... SELECT straight from the
+influencers table, one statement per DEAL_FANOUT_CHUNK_SIZE influencer id
+range, so matching rows never travel to Python. Each chunk commits on its
+own to keep write transactions (and SQLite's writer lock) short. The
+insert returns only (id, user_id) of the new rows: the counters of exactly
+those users are bumped in the same chunk transaction (the match filters
+aren't evaluated twice, so an influencer edited in between can't get one
+without the other), and each recipient gets a notification.created event
+once the chunk has committed.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import JSON, String, and_, bindparam, false, func, insert, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.events import publish_events
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.influencer import Influencer
+from app.models.notification import Notification, NotificationType
+from app.models.user import User
+from app.services.realtime import notification_created_events
+
+logger = logging.getLogger(__name__)
+
+# Campaign platform name -> influencer handle column
+PLATFORM_HANDLES = {
+    "instagram": Influencer.instagram_handle,
+    "youtube": Influencer.youtube_handle,
+    "tiktok": Influencer.tiktok_handle,
+    "twitter": Influencer.twitter_handle,
+    "x": Influencer.twitter_handle,
+}
+
+
+def deal_match_filters(campaign: Campaign) -> List:
+    """
+    WHERE clauses selecting the influencers a deal targets
+    Empty when the deal has no targeting (no follower minimum, platforms or niches)
+    """
+    filters = []
+    if campaign.required_follower_count:
+        filters.append(Influencer.total_followers >= campaign.required_follower_count)
+    handles = {
+        PLATFORM_HANDLES[platform.lower()]
+        for platform in campaign.platforms or []
+        if platform.lower() in PLATFORM_HANDLES
+    }
+    if handles:
+        # Active on at least one of the deal's platforms
+        filters.append(or_(*(and_(handle.isnot(None), handle != "") for handle in handles)))
+    niches = [niche.lower() for niche in campaign.niches or [] if niche]
+    if niches:
+        filters.append(func.lower(Influencer.niche).in_(niches))
+    return filters
+
+
+def announces_deal(campaign: Campaign) -> bool:
+    """Whether a deal is open (active, unassigned, deadline ahead), targets anyone and hasn't been announced yet"""
+    if campaign.deal_announced_at is not None:
+        return False
+    if campaign.status != CampaignStatus.ACTIVE or campaign.influencer_id is not None:
+        return False
+    deadline = campaign.deadline
+    if deadline is None:
+        return False
+    if deadline.tzinfo is None:
+        # SQLite hands back naive UTC datetimes
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return deadline > datetime.now(timezone.utc) and bool(deal_match_filters(campaign))
+
+
+def _chunk_matches(campaign: Campaign):
+    return (Influencer.id.between(bindparam("first_id"), bindparam("last_id")), *deal_match_filters(campaign))
+
+
+def deal_posted_insert(campaign: Campaign):
+    """
+    INSERT ... SELECT of DEAL_POSTED notifications for the deal's matching
+    influencers with ids in [:first_id, :last_id]
+    """
+    matches = (
+        select(
+            Influencer.user_id,
+            literal(NotificationType.DEAL_POSTED, Notification.notification_type.type),
+            literal("New deal matches your profile", String),
+            literal(f'"{campaign.title}" is looking for creators like you.', String),
+            literal(campaign.id),
+            false(),
+            false(),
+            literal(f"/campaigns/{campaign.id}", String),
+            literal({}, JSON),
+        )
+        .where(*_chunk_matches(campaign))
+    )
+    # Core insert on the table: with ORM insert() the chunk bounds would be read as rows
+    notifications = Notification.__table__
+    return insert(notifications).from_select(
+        [
+            "user_id", "notification_type", "title", "message", "related_campaign_id",
+            "is_read", "email_sent", "action_url", "extra_data",
+        ],
+        matches
+    ).returning(notifications.c.id, notifications.c.user_id)
+
+
+def deal_posted_unread_increment():
+    """UPDATE bumping the unread counters of :user_ids, the recipients deal_posted_insert() returned"""
+    return (
+        update(User.__table__)
+        .where(User.id.in_(bindparam("user_ids", expanding=True)))
+        .values(unread_notification_count=User.unread_notification_count + 1)
+    )
+
+
+async def fan_out_deal_posted(db: AsyncSession, campaign_id: int) -> int:
+    """Create DEAL_POSTED notifications for a deal's matching influencers; returns the count"""
+    campaign = await db.get(Campaign, campaign_id)
+    # Re-checked here: the deal may have changed since the fan-out was queued
+    if campaign is None or not announces_deal(campaign):
+        return 0
+    # Claim the announcement; a concurrent fan-out for the same deal matches no row
+    campaigns = Campaign.__table__
+    claimed = await db.execute(
+        update(campaigns)
+        .where(campaigns.c.id == campaign_id, campaigns.c.deal_announced_at.is_(None))
+        .values(deal_announced_at=func.now(), updated_at=campaigns.c.updated_at)
+    )
+    await db.commit()
+    if not claimed.rowcount:
+        return 0
+    
+    result = await db.execute(select(func.min(Influencer.id), func.max(Influencer.id)))
+    low, high = result.one()
+    if low is None:
+        return 0
+    
+    # Built once and executed per chunk with new bounds
+    insert_notifications = deal_posted_insert(campaign)
+    increment_unread = deal_posted_unread_increment()
+    created = 0
+    chunk = settings.DEAL_FANOUT_CHUNK_SIZE
+    for first_id in range(low, high + 1, chunk):
+        bounds = {"first_id": first_id, "last_id": first_id + chunk - 1}
+        inserted = (await db.execute(insert_notifications, bounds)).all()
+        if inserted:
+            await db.execute(increment_unread, {"user_ids": [user_id for _, user_id in inserted]})
+        await db.commit()
+        created += len(inserted)
+        await publish_events(notification_created_events(inserted, "deal_posted", campaign.id))
+    return created
+
+
+async def fan_out_deal_posted_background(campaign_id: int) -> None:
+    """BackgroundTasks entry point: fan out in a session of its own"""
+    from app.core.database import AsyncSessionLocal
+    try:
+        async with AsyncSessionLocal() as db:
+            count = await fan_out_deal_posted(db, campaign_id)
+        logger.info(f"Sent {count} DEAL_POSTED notifications for campaign {campaign_id}")
+    except Exception:
+        logger.exception(f"DEAL_POSTED fan-out for campaign {campaign_id} failed")
+
+
+async def mark_read(db: AsyncSession, user_id: int, ids: Optional[List[int]] = None) -> Tuple[int, int]:
+    """
+    Mark the user's unread notifications read (only the given ids, if any)
+    with a single UPDATE; returns (rows marked read, unread remaining)
+    """
+    statement = (
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.is_read == False)  # noqa: E712
+        .values(is_read=True, read_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+    if ids is not None:
+        statement = statement.where(Notification.id.in_(ids))
+    marked = (await db.execute(statement)).rowcount
+    
+    if not marked:
+        result = await db.execute(select(User.unread_notification_count).where(User.id == user_id))
+        return 0, result.scalar() or 0
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(unread_notification_count=User.unread_notification_count - marked)
+        .returning(User.unread_notification_count)
+    )
+    unread = result.scalar()
+    await db.commit()
+    return marked, unread
@@ -0,0 +1,130 @@
+"""
+Deal Discovery Ranking
+
+Each campaign stores a trending_score, indexed with its status, so the
+discover feed reads its top N straight off ix_campaigns_status_trending_score
+instead of sorting every open deal per request.
+
+The score is a time-decayed engagement measure in log space:
+
+    score = log2(1 + views * VIEW_WEIGHT + applications * APPLICATION_WEIGHT)
+            + (created_at - SCORE_EPOCH) / HALF_LIFE
+
+Ranking by it is the same as ranking by engagement * 2 ** (-age / HALF_LIFE),
+so a deal's pull halves every TRENDING_HALF_LIFE_HOURS relative to newer
+deals. Because decay is carried by the creation time instead of "now", scores
+never go stale with the clock: a campaign only needs rescoring when its view
+or application count changes.
+
+Whatever changes those counters marks the campaign dirty; trending_refresher
+rescores dirty campaigns every TRENDING_REFRESH_SECONDS with bulk UPDATEs.
+"""
+import asyncio
+import logging
+import math
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Set
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.campaign import Campaign
+
+logger = logging.getLogger(__name__)
+
+SCORE_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# Campaign ids rescored per SELECT/UPDATE round
+REFRESH_BATCH_SIZE = 500
+
+
+def trending_score(view_count: Optional[int], application_count: Optional[int], created_at: Optional[datetime]) -> float:
+    """Time-decayed ranking score (see module docstring)"""
+    engagement = (
+        (view_count or 0) * settings.TRENDING_VIEW_WEIGHT
+        + (application_count or 0) * settings.TRENDING_APPLICATION_WEIGHT
+    )
+    created_at = created_at or datetime.now(timezone.utc)
+    if created_at.tzinfo is None:
+        # SQLite hands back naive UTC datetimes
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    age_offset = (created_at - SCORE_EPOCH).total_seconds() / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+    return math.log2(1 + max(engagement, 0)) + age_offset
+
+
+def _score_update_statement():
+    # Core UPDATE so updated_at can be kept: a rescore isn't an edit
+    campaigns = Campaign.__table__
+    return (
+        update(campaigns)
+        .where(campaigns.c.id == bindparam("campaign_id"))
+        .values(trending_score=bindparam("score"), updated_at=campaigns.c.updated_at)
+    )
+
+
+async def rescore_campaigns(db: AsyncSession, campaign_ids: Iterable[int]) -> int:
+    """Recompute trending_score for the given campaigns (the caller commits)"""
+    campaign_ids = sorted(campaign_ids)
+    rescored = 0
+    for start in range(0, len(campaign_ids), REFRESH_BATCH_SIZE):
+        result = await db.execute(
+            select(Campaign.id, Campaign.view_count, Campaign.application_count, Campaign.created_at)
+            .where(Campaign.id.in_(campaign_ids[start:start + REFRESH_BATCH_SIZE]))
+        )
+        scores = [
+            {"campaign_id": campaign_id, "score": trending_score(views, applications, created_at)}
+            for campaign_id, views, applications, created_at in result.all()
+        ]
+        if scores:
+            # One executemany
+            await db.execute(_score_update_statement(), scores)
+        rescored += len(scores)
+    return rescored
+
+
+class TrendingRefresher:
+    """Per-worker set of campaigns awaiting a rescore, flushed periodically"""
+    
+    def __init__(self):
+        self._dirty: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+    
+    def mark_dirty(self, campaign_ids: Iterable[int]) -> None:
+        self._dirty.update(campaign_ids)
+    
+    @property
+    def pending(self) -> int:
+        return len(self._dirty)
+    
+    async def refresh(self) -> int:
+        """Rescore the campaigns marked so far; they stay marked if it fails"""
+        if not self._dirty:
+            return 0
+        from app.core.database import AsyncSessionLocal
+        campaign_ids, self._dirty = self._dirty, set()
+        try:
+            async with AsyncSessionLocal() as db:
+                count = await rescore_campaigns(db, campaign_ids)
+                await db.commit()
+        except Exception:
+            self._dirty.update(campaign_ids)
+            logger.exception(f"Rescoring {len(campaign_ids)} campaigns failed")
+            return 0
+        return count
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.TRENDING_REFRESH_SECONDS)
+            await self.refresh()
+    
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the periodic refresh and rescore whatever is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.refresh()
+
+
+trending_refresher = TrendingRefresher()
@@ -0,0 +1,87 @@
+"""
+Real-time Events
+
+Builds the (channel, event) messages pushed to clients over
+/api/v1/events/stream. Board changes go to the channels of both sides of a
+task (brand:<brand_id> and influencer:<influencer_id>); notifications and
+messages go to their users (user:<user_id>). Publishers already know these ids
+from their permission checks, so publishing costs no extra queries.
+
+Every event is {"type": ..., "data": ...}; data is the same JSON the REST
+endpoint returns for the resource, so clients can apply it directly.
+"""
+from typing import Iterable, List, Optional, Tuple
+from app.core.principal import Principal
+from app.schemas.content import ContentResponse
+from app.schemas.message import MessageResponse
+from app.schemas.task import TaskResponse
+
+Message = Tuple[str, dict]
+
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def brand_channel(brand_id: int) -> str:
+    return f"brand:{brand_id}"
+
+
+def influencer_channel(influencer_id: int) -> str:
+    return f"influencer:{influencer_id}"
+
+
+def subscriber_channels(principal: Principal) -> List[str]:
+    """Channels a user's stream listens on"""
+    channels = [user_channel(principal.id)]
+    if principal.brand_id is not None:
+        channels.append(brand_channel(principal.brand_id))
+    if principal.influencer_id is not None:
+        channels.append(influencer_channel(principal.influencer_id))
+    return channels
+
+
+def _board_channels(brand_id: Optional[int], influencer_id: Optional[int]) -> List[str]:
+    channels = []
+    if brand_id is not None:
+        channels.append(brand_channel(brand_id))
+    if influencer_id is not None:
+        channels.append(influencer_channel(influencer_id))
+    return channels
+
+
+def task_events(event_type: str, tasks: Iterable, brand_id: int) -> List[Message]:
+    """task.created / task.updated for each task, to its brand and influencer"""
+    messages = []
+    for task in tasks:
+        event = {"type": event_type, "data": TaskResponse.model_validate(task).model_dump(mode="json")}
+        messages.extend((channel, event) for channel in _board_channels(brand_id, task.influencer_id))
+    return messages
+
+
+def content_events(event_type: str, content, brand_id: Optional[int], influencer_id: Optional[int]) -> List[Message]:
+    """content.created / content.updated, to the task's brand and influencer"""
+    event = {"type": event_type, "data": ContentResponse.model_validate(content).model_dump(mode="json")}
+    return [(channel, event) for channel in _board_channels(brand_id, influencer_id)]
+
+
+def notification_created_events(rows: Iterable, notification_type: str, campaign_id: Optional[int]) -> List[Message]:
+    """notification.created for (id, user_id) rows of newly inserted notifications"""
+    return [
+        (user_channel(user_id), {
+            "type": "notification.created",
+            "data": {"id": notification_id, "notification_type": notification_type, "related_campaign_id": campaign_id},
+        })
+        for notification_id, user_id in rows
+    ]
+
+
+def unread_count_event(user_id: int, unread: int) -> List[Message]:
+    """notification.read with the new badge count, so the user's other tabs update too"""
+    return [(user_channel(user_id), {"type": "notification.read", "data": {"unread": unread}})]
+
+
+def message_events(message) -> List[Message]:
+    """message.created, to the recipient and to the sender's other sessions"""
+    event = {"type": "message.created", "data": MessageResponse.model_validate(message).model_dump(mode="json")}
+    return [(user_channel(user_id), event) for user_id in (message.recipient_id, message.sender_id)]
@@ -0,0 +1,202 @@
+"""
+Influencer Discovery Search
+
+Index-backed full-text search over influencer full_name, niche, location
+and bio, replacing leading-wildcard ILIKE scans.
+
+- SQLite: an external-content FTS5 table (influencers_fts) kept in sync by
+  triggers on influencers, so create/update/delete maintain the index
+  incrementally. Results are ranked with bm25 (name > niche > location > bio).
+- PostgreSQL: a GIN index on a tsvector expression for free-text queries,
+  plus pg_trgm GIN indexes so niche/location substring filters are
+  index-backed. Results are ranked with ts_rank.
+- Other dialects fall back to ILIKE filters.
+
+Terms match by prefix ("fash" finds "fashion"); multiple terms are ANDed.
+"""
+import logging
+import re
+from typing import List, Optional
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.influencer import Influencer
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "influencers_fts"
+FTS_COLUMNS = ("full_name", "niche", "location", "bio")
+# bm25 column weights, in FTS_COLUMNS order
+FTS_WEIGHTS = (10.0, 5.0, 3.0, 1.0)
+
+influencers_fts = table(FTS_TABLE, column("rowid"))
+
+# Must match the expression index exactly for PostgreSQL to use it
+PG_DOCUMENT_SQL = (
+    "to_tsvector('simple', coalesce(full_name, '') || ' ' || coalesce(niche, '') || ' ' "
+    "|| coalesce(location, '') || ' ' || coalesce(bio, ''))"
+)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Per-process flag: whether the SQLite FTS5 table exists (FTS5 may be missing from the build)
+_sqlite_fts_available: Optional[bool] = None
+
+
+def _tokens(value: Optional[str]) -> List[str]:
+    """Split user input into plain word tokens (drops FTS/tsquery syntax characters)"""
+    return _TOKEN_RE.findall(value or "")
+
+
+def build_fts_match(q: Optional[str], niche: Optional[str], location: Optional[str]) -> Optional[str]:
+    """Build an FTS5 MATCH expression: free text over all columns, niche/location column-scoped"""
+    groups = []
+    q_tokens = _tokens(q)
+    if q_tokens:
+        groups.append("(" + " AND ".join(f'"{t}"*' for t in q_tokens) + ")")
+    for column_name, value in (("niche", niche), ("location", location)):
+        column_tokens = _tokens(value)
+        if column_tokens:
+            groups.append(f"{column_name} : (" + " AND ".join(f'"{t}"*' for t in column_tokens) + ")")
+    return " AND ".join(groups) if groups else None
+
+
+def build_tsquery(q: Optional[str]) -> Optional[str]:
+    """Build a prefix-matching to_tsquery expression from free text"""
+    q_tokens = _tokens(q)
+    if not q_tokens:
+        return None
+    return " & ".join(f"{t}:*" for t in q_tokens)
+
+
+# -- Index maintenance (called from migrations) --
+
+def create_search_index(conn: Connection) -> None:
+    """Create the dialect's search index and backfill it from existing rows"""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        _create_sqlite_fts(conn)
+    elif dialect == "postgresql":
+        _create_postgres_indexes(conn)
+
+
+def _create_sqlite_fts(conn: Connection) -> None:
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+    try:
+        conn.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"{columns}, content='influencers', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+    except OperationalError as e:
+        logger.warning(f"SQLite FTS5 unavailable, influencer search will use ILIKE: {e}")
+        return
+    
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS influencers_fts_ai AFTER INSERT ON influencers BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS influencers_fts_ad AFTER DELETE ON influencers BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS influencers_fts_au AFTER UPDATE OF {columns} ON influencers BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+    )
+    conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def _create_postgres_indexes(conn: Connection) -> None:
+    conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    conn.exec_driver_sql(
+        f"CREATE INDEX IF NOT EXISTS ix_influencers_search_document ON influencers USING GIN ({PG_DOCUMENT_SQL})"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_influencers_niche_trgm ON influencers USING GIN (niche gin_trgm_ops)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_influencers_location_trgm ON influencers USING GIN (location gin_trgm_ops)"
+    )
+
+
+# -- Query building --
+
+async def _sqlite_fts_ready(db: AsyncSession) -> bool:
+    global _sqlite_fts_available
+    if _sqlite_fts_available is None:
+        result = await db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE}
+        )
+        _sqlite_fts_available = result.scalar() is not None
+    return _sqlite_fts_available
+
+
+def sqlite_fts_query(match: str):
+    """select() of influencers matching an FTS5 expression, best bm25 rank first"""
+    fts = literal_column(FTS_TABLE)
+    return (
+        select(Influencer)
+        .join(influencers_fts, influencers_fts.c.rowid == Influencer.id)
+        .where(fts.op("MATCH")(match))
+        .order_by(func.bm25(fts, *FTS_WEIGHTS), Influencer.id)
+    )
+
+
+async def build_influencer_search(
+    db: AsyncSession,
+    q: Optional[str] = None,
+    niche: Optional[str] = None,
+    location: Optional[str] = None,
+    min_followers: Optional[int] = None,
+):
+    """
+    Build a select() of influencers matching the filters, ordered by relevance
+    Returns None when there are no text filters (callers use the plain listing)
+    """
+    if not (_tokens(q) or _tokens(niche) or _tokens(location)):
+        return None
+    
+    dialect = db.bind.dialect.name
+    query = select(Influencer)
+    
+    if dialect == "sqlite" and await _sqlite_fts_ready(db):
+        query = sqlite_fts_query(build_fts_match(q, niche, location))
+    elif dialect == "postgresql":
+        tsquery = build_tsquery(q)
+        if tsquery:
+            document = literal_column(PG_DOCUMENT_SQL)
+            ts_query = func.to_tsquery("simple", tsquery)
+            query = query.where(document.op("@@")(ts_query)).order_by(
+                func.ts_rank(document, ts_query).desc(), Influencer.id
+            )
+        else:
+            query = query.order_by(Influencer.id)
+        if niche:
+            query = query.where(Influencer.niche.ilike(f"%{niche}%"))
+        if location:
+            query = query.where(Influencer.location.ilike(f"%{location}%"))
+    else:
+        if q:
+            pattern = f"%{q}%"
+            query = query.where(or_(
+                Influencer.full_name.ilike(pattern),
+                Influencer.niche.ilike(pattern),
+                Influencer.location.ilike(pattern),
+                Influencer.bio.ilike(pattern),
+            ))
+        if niche:
+            query = query.where(Influencer.niche.ilike(f"%{niche}%"))
+        if location:
+            query = query.where(Influencer.location.ilike(f"%{location}%"))
+        query = query.order_by(Influencer.id)
+    
+    if min_followers:
+        query = query.where(Influencer.total_followers >= min_followers)
+    
+    return query
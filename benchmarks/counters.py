@@ -0,0 +1,97 @@
+"""
+Campaign Counter Write Benchmark
+Compares two ways of recording deal views under concurrency:
+
+- direct: one UPDATE campaigns SET view_count = view_count + 1 per view,
+  each in its own transaction (what counting inline in the request would do)
+- buffered: CounterBuffer.increment() per view, then a single flush
+
+Views are spread over --campaigns hot campaigns, --concurrency at a time.
+Runs against the configured DATABASE_URL, which should be seeded first:
+     python benchmarks/generate_data.py --scale 0.01
+     python benchmarks/counters.py --views 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select, update
+from app.core.database import AsyncSessionLocal, async_engine
+from app.models import Campaign
+from app.services.counters import CounterBuffer
+
+
+async def total_views(campaign_ids) -> int:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(func.sum(Campaign.view_count)).where(Campaign.id.in_(campaign_ids)))
+        return result.scalar() or 0
+
+
+async def run_direct(campaign_ids, views: int, concurrency: int) -> float:
+    slots = asyncio.Semaphore(concurrency)
+    
+    async def view(campaign_id: int):
+        async with slots:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(Campaign)
+                    .where(Campaign.id == campaign_id)
+                    .values(view_count=Campaign.view_count + 1)
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(view(random.choice(campaign_ids)) for _ in range(views)))
+    return time.perf_counter() - started
+
+
+async def run_buffered(campaign_ids, views: int, concurrency: int) -> float:
+    buffer = CounterBuffer()
+    slots = asyncio.Semaphore(concurrency)
+    
+    async def view(campaign_id: int):
+        async with slots:
+            buffer.increment(campaign_id, "view_count")
+            await asyncio.sleep(0)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(view(random.choice(campaign_ids)) for _ in range(views)))
+    await buffer.flush()
+    return time.perf_counter() - started
+
+
+async def main_async(args) -> int:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Campaign.id).order_by(Campaign.id).limit(args.campaigns))
+        campaign_ids = result.scalars().all()
+    if not campaign_ids:
+        print("No campaigns; seed the database with benchmarks/generate_data.py first.")
+        return 1
+    
+    for name, run in (("direct", run_direct), ("buffered", run_buffered)):
+        before = await total_views(campaign_ids)
+        elapsed = await run(campaign_ids, args.views, args.concurrency)
+        written = await total_views(campaign_ids) - before
+        print(f"{name:<9} {args.views} views in {elapsed * 1000:9.1f}ms  "
+              f"({args.views / elapsed:10.0f} views/s, {written} counted)")
+    await async_engine.dispose()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Direct vs buffered campaign counter writes")
+    parser.add_argument("--views", type=int, default=2000)
+    parser.add_argument("--campaigns", type=int, default=10, help="hot campaigns the views are spread over")
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
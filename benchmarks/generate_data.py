@@ -0,0 +1,304 @@
+"""
+Synthetic Dataset Generator
+Fills the configured database (DATABASE_URL) with a realistic volume of
+users, brands, influencers, campaigns, tasks and content for load testing.
+
+Rows are written with Core executemany() inserts in batches, not one ORM
+object per row. Generation is deterministic for a given --seed, and every
+account shares the password BENCH_PASSWORD.
+
+Run: python benchmarks/generate_data.py --scale 0.01   # 1% of full volume
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, insert, select, text
+from app.core.database import engine, init_db
+from app.core.security import get_password_hash
+from app.models import User, Brand, Influencer, Campaign, Task, Content
+from app.models.user import UserRole
+from app.models.campaign import CampaignStatus
+from app.models.task import TaskStatus, TaskPriority
+from app.models.content import ContentStatus, ContentType
+from app.services.ranking import trending_score
+
+BENCH_PASSWORD = "benchmark-password"
+
+# Row counts at --scale 1.0
+FULL_VOLUME = {
+    "users": 1_000_000,
+    "brands": 50_000,
+    "influencers": 500_000,
+    "campaigns": 1_000_000,
+    "tasks": 1_000_000,
+    "content": 1_000_000,
+}
+
+NICHES = [
+    "fashion", "beauty", "fitness", "travel", "food", "tech", "gaming", "lifestyle",
+    "parenting", "finance", "music", "photography", "sports", "education", "pets",
+]
+LOCATIONS = [
+    "New York", "Los Angeles", "London", "Paris", "Berlin", "Toronto", "Sydney", "Mumbai",
+    "Lagos", "Sao Paulo", "Tokyo", "Seoul", "Dubai", "Mexico City", "Stockholm",
+]
+INDUSTRIES = ["apparel", "cosmetics", "consumer electronics", "food & beverage", "travel", "fintech", "gaming", "fitness"]
+FIRST_NAMES = ["Ava", "Liam", "Maya", "Noah", "Zoe", "Ethan", "Aria", "Leo", "Nina", "Omar", "Sara", "Kai", "Lena", "Ivan", "Yuki"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Okafor", "Muller", "Silva", "Kim", "Patel", "Rossi", "Dubois", "Nowak", "Tanaka"]
+PLATFORMS = ["instagram", "tiktok", "youtube", "twitter"]
+BIO_WORDS = [
+    "creator", "storyteller", "daily", "reviews", "tips", "vlogs", "style", "outfits", "workouts",
+    "recipes", "adventures", "unboxing", "tutorials", "sustainable", "budget", "luxury", "minimalist",
+]
+
+CAMPAIGN_STATUS_WEIGHTS = [
+    (CampaignStatus.DRAFT, 10),
+    (CampaignStatus.ACTIVE, 35),
+    (CampaignStatus.IN_PROGRESS, 30),
+    (CampaignStatus.COMPLETED, 20),
+    (CampaignStatus.CANCELLED, 5),
+]
+TASK_STATUS_WEIGHTS = [
+    (TaskStatus.TODO, 30),
+    (TaskStatus.IN_PROGRESS, 25),
+    (TaskStatus.IN_REVIEW, 15),
+    (TaskStatus.APPROVED, 10),
+    (TaskStatus.REJECTED, 5),
+    (TaskStatus.COMPLETED, 15),
+]
+
+
+def brand_email(n: int) -> str:
+    """Login email of the n-th (1-based) generated brand user"""
+    return f"brand{n}@bench.example.com"
+
+
+def influencer_email(n: int) -> str:
+    """Login email of the n-th (1-based) generated influencer user"""
+    return f"influencer{n}@bench.example.com"
+
+
+def campaign_influencer_id(campaign_id: int, influencers: int):
+    """Deterministic assigned influencer; every fifth campaign is an open deal"""
+    if campaign_id % 5 == 0:
+        return None
+    return (campaign_id * 7919) % influencers + 1
+
+
+def _weighted(rng: random.Random, weights):
+    values, cum = zip(*weights)
+    return rng.choices(values, weights=cum)[0]
+
+
+def _created_at(rng: random.Random, now: datetime) -> datetime:
+    return now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+
+
+def user_rows(counts, password_hash, rng, now):
+    brands, influencers = counts["brands"], counts["influencers"]
+    for n in range(1, counts["users"] + 1):
+        if n <= brands:
+            role, email, username = UserRole.BRAND, brand_email(n), f"brand{n}"
+        elif n <= brands + influencers:
+            k = n - brands
+            role, email, username = UserRole.INFLUENCER, influencer_email(k), f"influencer{k}"
+        else:
+            # Accounts that signed up but never created a profile
+            role = UserRole.BRAND if n % 4 == 0 else UserRole.INFLUENCER
+            email, username = f"user{n}@bench.example.com", f"user{n}"
+        yield {
+            "id": n,
+            "email": email,
+            "username": username,
+            "hashed_password": password_hash,
+            "role": role,
+            "is_active": True,
+            "is_verified": rng.random() < 0.7,
+            "created_at": _created_at(rng, now),
+        }
+
+
+def brand_rows(counts, rng, now):
+    for n in range(1, counts["brands"] + 1):
+        yield {
+            "id": n,
+            "user_id": n,
+            "company_name": f"{rng.choice(LAST_NAMES)} {rng.choice(['Labs', 'Co', 'Goods', 'Studio', 'Brands'])} {n}",
+            "industry": rng.choice(INDUSTRIES),
+            "description": "Benchmark brand",
+            "location": rng.choice(LOCATIONS),
+            "website": f"https://brand{n}.example.com",
+            "extra_data": {},
+            "created_at": _created_at(rng, now),
+        }
+
+
+def influencer_rows(counts, rng, now):
+    for n in range(1, counts["influencers"] + 1):
+        niche = rng.choice(NICHES)
+        # Long-tailed follower counts, like real audiences
+        followers = int(rng.paretovariate(1.2) * 800)
+        yield {
+            "id": n,
+            "user_id": counts["brands"] + n,
+            "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "bio": " ".join([niche] + rng.sample(BIO_WORDS, 5)),
+            "niche": niche,
+            "location": rng.choice(LOCATIONS),
+            "instagram_handle": f"@creator{n}",
+            "total_followers": min(followers, 50_000_000),
+            "average_engagement_rate": round(rng.uniform(0.5, 12.0), 2),
+            "base_rate": round(rng.uniform(50, 5000), 2),
+            "previous_campaigns": [],
+            "saved_deals": [],
+            "extra_data": {},
+            "created_at": _created_at(rng, now),
+        }
+
+
+def campaign_rows(counts, rng, now):
+    for n in range(1, counts["campaigns"] + 1):
+        niche = rng.choice(NICHES)
+        row = {
+            "id": n,
+            "brand_id": rng.randint(1, counts["brands"]),
+            "influencer_id": campaign_influencer_id(n, counts["influencers"]),
+            "title": f"{niche.title()} campaign {n}",
+            "description": f"Looking for {niche} creators",
+            "status": _weighted(rng, CAMPAIGN_STATUS_WEIGHTS),
+            "budget": round(rng.uniform(200, 50_000), 2),
+            "budget_negotiable": rng.choice(["fixed", "negotiable"]),
+            "deadline": now + timedelta(days=rng.randint(-60, 120)),
+            "required_follower_count": rng.choice([None, 1_000, 10_000, 100_000]),
+            "platforms": rng.sample(PLATFORMS, rng.randint(1, 3)),
+            "deliverables": [],
+            "milestones_template": [],
+            "required_deliverables": [],
+            "target_audience": {},
+            "impressions": rng.randint(0, 1_000_000),
+            "clicks": rng.randint(0, 50_000),
+            "conversions": rng.randint(0, 2_000),
+            "engagement_rate": round(rng.uniform(0, 10), 2),
+            "is_trending": "false",
+            "view_count": rng.randint(0, 20_000),
+            "application_count": rng.randint(0, 200),
+            "extra_data": {},
+            "created_at": _created_at(rng, now),
+        }
+        row["trending_score"] = trending_score(row["view_count"], row["application_count"], row["created_at"])
+        yield row
+
+
+def task_rows(counts, rng, now):
+    campaigns, influencers = counts["campaigns"], counts["influencers"]
+    for n in range(1, counts["tasks"] + 1):
+        # Spread tasks round-robin so every campaign gets a board
+        campaign_id = (n - 1) % campaigns + 1
+        influencer_id = campaign_influencer_id(campaign_id, influencers) or rng.randint(1, influencers)
+        yield {
+            "id": n,
+            "campaign_id": campaign_id,
+            "influencer_id": influencer_id,
+            "title": f"Deliverable {n}",
+            "status": _weighted(rng, TASK_STATUS_WEIGHTS),
+            "priority": rng.choice(list(TaskPriority)),
+            "deliverable_type": rng.choice(["instagram_post", "tiktok_video", "youtube_video", "story"]),
+            "due_date": now + timedelta(days=rng.randint(-30, 90)),
+            "position": (n - 1) // campaigns,
+            "extra_data": {},
+            "created_at": _created_at(rng, now),
+        }
+
+
+def content_rows(counts, rng, now):
+    for n in range(1, counts["content"] + 1):
+        yield {
+            "id": n,
+            "task_id": n,
+            "title": f"Submission {n}",
+            "content_type": rng.choice(list(ContentType)),
+            "status": rng.choice(list(ContentStatus)),
+            "file_url": f"https://cdn.example.com/content/{n}.jpg",
+            "platform": rng.choice(PLATFORMS),
+            "additional_files": [],
+            "extra_data": {},
+            "created_at": _created_at(rng, now),
+        }
+
+
+def bulk_insert(conn, table, rows, batch_size: int) -> int:
+    """executemany() in fixed-size batches; returns rows written"""
+    started = time.perf_counter()
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.execute(insert(table), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        conn.execute(insert(table), batch)
+        total += len(batch)
+    elapsed = time.perf_counter() - started
+    print(f"  {table.name:<12} {total:>10,} rows in {elapsed:7.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fill the database with synthetic benchmark data")
+    parser.add_argument("--scale", type=float, default=1.0, help="fraction of the full volume (1M users, 1M campaigns, ...)")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    counts = {name: max(1, int(n * args.scale)) for name, n in FULL_VOLUME.items()}
+    counts["users"] = max(counts["users"], counts["brands"] + counts["influencers"])
+    counts["tasks"] = max(counts["tasks"], counts["content"])
+    
+    init_db()
+    with engine.connect() as conn:
+        if conn.execute(select(func.count()).select_from(User.__table__)).scalar():
+            print(f"Refusing to generate into a non-empty database ({engine.url}); point DATABASE_URL at a fresh one.")
+            return 1
+    
+    print(f"Generating into {engine.url}:")
+    print("  " + ", ".join(f"{name}={n:,}" for name, n in counts.items()))
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc)
+    # One bcrypt hash shared by every account; hashing 1M passwords would take hours
+    password_hash = get_password_hash(BENCH_PASSWORD)
+    
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            # Bulk load only: a crash mid-load just means regenerating
+            conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        bulk_insert(conn, User.__table__, user_rows(counts, password_hash, rng, now), args.batch_size)
+        bulk_insert(conn, Brand.__table__, brand_rows(counts, rng, now), args.batch_size)
+        bulk_insert(conn, Influencer.__table__, influencer_rows(counts, rng, now), args.batch_size)
+        bulk_insert(conn, Campaign.__table__, campaign_rows(counts, rng, now), args.batch_size)
+        bulk_insert(conn, Task.__table__, task_rows(counts, rng, now), args.batch_size)
+        bulk_insert(conn, Content.__table__, content_rows(counts, rng, now), args.batch_size)
+    
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            # Explicit ids don't advance the serial sequences
+            for table in ("users", "brands", "influencers", "campaigns", "tasks", "content"):
+                conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))"
+                ))
+        conn.execute(text("ANALYZE"))
+    
+    print(f"Done in {time.perf_counter() - started:.1f}s. Every account's password is {BENCH_PASSWORD!r}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Scripted User Journeys
+Each journey is a short sequence of API calls a real brand or influencer
+makes, timed per endpoint through a Recorder. Endpoints are labelled by
+route template ("GET /api/v1/campaigns/{id}") so results aggregate across
+ids.
+"""
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+import httpx
+
+API = "/api/v1"
+
+SEARCH_TERMS = ["fashion", "fitness", "travel", "tech", "food", "beauty", "style", "reviews", "vlogs", "recipes"]
+NICHE_PREFIXES = ["fash", "fit", "trav", "tech", "food", "beau", "gam", "life"]
+LOCATIONS = ["Paris", "London", "New York", "Berlin", "Tokyo", "Toronto"]
+
+
+class JourneyError(Exception):
+    """An API call inside a journey returned an unexpected status"""
+    pass
+
+
+class Recorder:
+    """Per-endpoint latency samples and error counts"""
+    
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.status_codes: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.journeys: Dict[str, int] = defaultdict(int)
+        self.journey_errors: Dict[str, int] = defaultdict(int)
+        self.enabled = True
+    
+    def record(self, endpoint: str, status_code: Optional[int], seconds: float, ok: bool):
+        if not self.enabled:
+            return
+        self.samples[endpoint].append(seconds)
+        if status_code is not None:
+            self.status_codes[endpoint][status_code] += 1
+        if not ok:
+            self.errors[endpoint] += 1
+
+
+@dataclass
+class Actor:
+    """A logged-in user with a profile"""
+    email: str
+    headers: Dict[str, str]
+    profile_id: int
+    campaign_ids: List[int] = field(default_factory=list)
+    task_ids: List[int] = field(default_factory=list)
+
+
+async def call(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    endpoint: str,
+    method: str,
+    url: str,
+    expected=(200,),
+    **kwargs
+) -> httpx.Response:
+    """Issue one request, time it and fail the journey on an unexpected status"""
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as exc:
+        recorder.record(endpoint, None, time.perf_counter() - started, ok=False)
+        raise JourneyError(f"{endpoint}: {exc!r}") from exc
+    ok = response.status_code in expected
+    recorder.record(endpoint, response.status_code, time.perf_counter() - started, ok=ok)
+    if not ok:
+        raise JourneyError(f"{endpoint}: {response.status_code} {response.text[:200]}")
+    return response
+
+
+async def brand_discovery(client, recorder, rng: random.Random, brand: Actor, influencer: Actor):
+    """Brand searches for creators, opens a profile and browses other brands"""
+    response = await call(
+        client, recorder, "GET /api/v1/influencers?q", "GET", f"{API}/influencers",
+        params={"q": rng.choice(SEARCH_TERMS), "limit": 20}, headers=brand.headers
+    )
+    found = response.json()
+    await call(
+        client, recorder, "GET /api/v1/influencers?niche", "GET", f"{API}/influencers",
+        params={"niche": rng.choice(NICHE_PREFIXES), "location": rng.choice(LOCATIONS),
+                "min_followers": rng.choice([0, 1000, 10000]), "limit": 20},
+        headers=brand.headers
+    )
+    influencer_id = found[0]["id"] if found else influencer.profile_id
+    await call(client, recorder, "GET /api/v1/influencers/{id}", "GET", f"{API}/influencers/{influencer_id}")
+    await call(client, recorder, "GET /api/v1/brands", "GET", f"{API}/brands", params={"limit": 20})
+
+
+async def campaign_creation(client, recorder, rng: random.Random, brand: Actor, influencer: Actor):
+    """Brand posts a campaign, checks its list, opens and activates the campaign"""
+    deadline = datetime.now(timezone.utc) + timedelta(days=rng.randint(7, 60))
+    response = await call(
+        client, recorder, "POST /api/v1/campaigns", "POST", f"{API}/campaigns", expected=(201,),
+        json={
+            "title": f"Load test campaign {rng.randint(1, 10**9)}",
+            "description": "Created by the benchmark load driver",
+            "budget": round(rng.uniform(500, 20000), 2),
+            "deadline": deadline.isoformat(),
+            "influencer_id": influencer.profile_id,
+        },
+        headers=brand.headers
+    )
+    campaign_id = response.json()["id"]
+    brand.campaign_ids.append(campaign_id)
+    await call(client, recorder, "GET /api/v1/campaigns", "GET", f"{API}/campaigns", params={"limit": 20}, headers=brand.headers)
+    await call(client, recorder, "GET /api/v1/campaigns/{id}", "GET", f"{API}/campaigns/{campaign_id}", headers=brand.headers)
+    await call(
+        client, recorder, "PUT /api/v1/campaigns/{id}", "PUT", f"{API}/campaigns/{campaign_id}",
+        json={"status": "active"}, headers=brand.headers
+    )
+
+
+async def kanban_updates(client, recorder, rng: random.Random, brand: Actor, influencer: Actor):
+    """Brand adds a card to a campaign board; the influencer moves it across columns"""
+    if not brand.campaign_ids:
+        await campaign_creation(client, recorder, rng, brand, influencer)
+    campaign_id = rng.choice(brand.campaign_ids)
+    response = await call(
+        client, recorder, "POST /api/v1/tasks", "POST", f"{API}/tasks", expected=(201,),
+        json={"title": "Post a reel", "campaign_id": campaign_id, "influencer_id": influencer.profile_id,
+              "deliverable_type": "instagram_post"},
+        headers=brand.headers
+    )
+    task_id = response.json()["id"]
+    influencer.task_ids.append(task_id)
+    await call(
+        client, recorder, "GET /api/v1/tasks?campaign_id", "GET", f"{API}/tasks",
+        params={"campaign_id": campaign_id, "limit": 50}, headers=influencer.headers
+    )
+    for column in ("in_progress", "in_review"):
+        await call(
+            client, recorder, "PUT /api/v1/tasks/{id}", "PUT", f"{API}/tasks/{task_id}",
+            json={"status": column}, headers=influencer.headers
+        )
+    await call(client, recorder, "GET /api/v1/tasks/{id}", "GET", f"{API}/tasks/{task_id}", headers=brand.headers)
+    await call(
+        client, recorder, "GET /api/v1/campaigns/{id}/board", "GET", f"{API}/campaigns/{campaign_id}/board",
+        headers=brand.headers
+    )
+
+
+async def content_review(client, recorder, rng: random.Random, brand: Actor, influencer: Actor):
+    """Influencer submits content for a task; the brand reviews and approves it"""
+    await kanban_updates(client, recorder, rng, brand, influencer)
+    task_id = influencer.task_ids.pop()
+    response = await call(
+        client, recorder, "POST /api/v1/content/task/{task_id}", "POST", f"{API}/content/task/{task_id}",
+        expected=(201,),
+        json={"title": "Draft reel", "content_type": "video", "platform": "instagram",
+              "file_url": "https://cdn.example.com/draft.mp4"},
+        headers=influencer.headers
+    )
+    content_id = response.json()["id"]
+    await call(
+        client, recorder, "GET /api/v1/content/task/{task_id}", "GET", f"{API}/content/task/{task_id}",
+        headers=brand.headers
+    )
+    await call(
+        client, recorder, "PUT /api/v1/content/{id}", "PUT", f"{API}/content/{content_id}",
+        json={"status": "approved", "review_notes": "Looks great"}, headers=brand.headers
+    )
+
+
+# name -> (journey, default weight)
+JOURNEYS = {
+    "brand_discovery": (brand_discovery, 50),
+    "campaign_creation": (campaign_creation, 15),
+    "kanban_updates": (kanban_updates, 25),
+    "content_review": (content_review, 10),
+}
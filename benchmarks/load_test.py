@@ -0,0 +1,284 @@
+"""
+Concurrent Load Driver
+Starts app.main:app under uvicorn (or targets --base-url), signs up a pool of
+brand and influencer actors, then runs weighted user journeys from N
+concurrent workers for a fixed duration. Reports p50/p95/p99 latency and
+throughput per endpoint and writes the run as JSON so runs can be compared
+across commits.
+
+Run: python benchmarks/load_test.py --concurrency 32 --duration 60
+     python benchmarks/load_test.py --compare benchmarks/results/<baseline>.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from benchmarks.journeys import API, JOURNEYS, Actor, JourneyError, Recorder, call
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[rank]
+
+
+def summarize(samples: List[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(samples)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+    }
+
+
+def git_revision() -> Dict[str, Optional[str]]:
+    def run(*args):
+        try:
+            return subprocess.check_output(["git", *args], cwd=ROOT_DIR, stderr=subprocess.DEVNULL, text=True).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    return {
+        "commit": run("rev-parse", "HEAD"),
+        "branch": run("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(run("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    """Run app.main:app under uvicorn with the caller's environment (DATABASE_URL etc.)"""
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=ROOT_DIR
+    )
+
+
+async def wait_until_healthy(base_url: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"Server at {base_url} did not become healthy within {timeout:.0f}s")
+
+
+async def sign_up(client: httpx.AsyncClient, recorder: Recorder, role: str, run_id: str, n: int) -> Actor:
+    """Register, log in and create a profile; returns the actor with a token carrying its profile id"""
+    email = f"load-{run_id}-{role}{n}@bench.example.com"
+    password = "load-test-password"
+    await call(
+        client, recorder, "POST /api/v1/auth/register", "POST", f"{API}/auth/register", expected=(201,),
+        json={"email": email, "username": f"load-{run_id}-{role}{n}", "password": password, "role": role}
+    )
+    response = await call(
+        client, recorder, "POST /api/v1/auth/login", "POST", f"{API}/auth/login",
+        data={"username": email, "password": password}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    if role == "brand":
+        profile = {"company_name": f"Load Test Brand {n}", "industry": "apparel"}
+        path = f"{API}/brands"
+    else:
+        profile = {"full_name": f"Load Test Creator {n}", "niche": "fashion", "location": "Paris",
+                   "bio": "fashion style reviews", "total_followers": 1000 * n}
+        path = f"{API}/influencers"
+    response = await call(client, recorder, f"POST {path}", "POST", path, expected=(201,), json=profile, headers=headers)
+    token = response.headers.get("x-access-token")
+    if token:
+        headers = {"Authorization": f"Bearer {token}"}
+    return Actor(email=email, headers=headers, profile_id=response.json()["id"])
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    rng: random.Random,
+    pairs: List[Tuple[Actor, Actor]],
+    weights: Dict[str, int],
+    stop_at: float
+):
+    names = [name for name, weight in weights.items() if weight > 0]
+    cum = [weights[name] for name in names]
+    while time.monotonic() < stop_at:
+        name = rng.choices(names, weights=cum)[0]
+        brand, influencer = rng.choice(pairs)
+        journey = JOURNEYS[name][0]
+        try:
+            await journey(client, recorder, rng, brand, influencer)
+        except JourneyError:
+            recorder.journey_errors[name] += 1
+        recorder.journeys[name] += 1
+
+
+def print_report(report: dict, baseline: Optional[dict] = None):
+    base_endpoints = (baseline or {}).get("endpoints", {})
+    header = f"{'endpoint':<42} {'reqs':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}"
+    if baseline:
+        header += f" {'p95 vs base':>12}"
+    print(header)
+    print("-" * len(header))
+    rows = sorted(report["endpoints"].items()) + [("TOTAL", report["overall"])]
+    for endpoint, stats in rows:
+        line = (
+            f"{endpoint:<42} {stats['requests']:>7} {stats['errors']:>5} {stats['throughput_rps']:>8.1f} "
+            f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f}"
+        )
+        base = base_endpoints.get(endpoint) if endpoint != "TOTAL" else (baseline or {}).get("overall")
+        if base and base.get("p95_ms"):
+            line += f" {(stats['p95_ms'] - base['p95_ms']) / base['p95_ms'] * 100:>+11.1f}%"
+        print(line)
+
+
+async def run(args) -> dict:
+    weights = {name: default for name, (_, default) in JOURNEYS.items()}
+    for spec in args.journey or []:
+        name, _, weight = spec.partition("=")
+        if name not in weights:
+            raise SystemExit(f"Unknown journey {name!r}; choose from {', '.join(JOURNEYS)}")
+        weights[name] = int(weight or 1)
+    
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(port, args.workers)
+    try:
+        await wait_until_healthy(base_url)
+        run_id = uuid.uuid4().hex[:8]
+        rng = random.Random(args.seed)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+            setup = Recorder()
+            brands = [await sign_up(client, setup, "brand", run_id, n) for n in range(1, args.actors + 1)]
+            influencers = [await sign_up(client, setup, "influencer", run_id, n) for n in range(1, args.actors + 1)]
+            pairs = list(zip(brands, influencers))
+            
+            recorder = Recorder()
+            if args.warmup:
+                recorder.enabled = False
+                warmup_stop = time.monotonic() + args.warmup
+                await asyncio.gather(*(
+                    worker(client, recorder, random.Random(rng.random()), pairs, weights, warmup_stop)
+                    for _ in range(args.concurrency)
+                ))
+                recorder = Recorder()
+            
+            started = time.monotonic()
+            stop_at = started + args.duration
+            await asyncio.gather(*(
+                worker(client, recorder, random.Random(rng.random()), pairs, weights, stop_at)
+                for _ in range(args.concurrency)
+            ))
+            elapsed = time.monotonic() - started
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+    
+    all_samples = [s for samples in recorder.samples.values() for s in samples]
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database_url": os.environ.get("DATABASE_URL", "(default)") if server else None,
+            "base_url": base_url,
+            "server_workers": args.workers if server else None,
+        },
+        "config": {
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "actors": args.actors,
+            "seed": args.seed,
+            "journey_weights": weights,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "journeys": {
+            name: {"runs": recorder.journeys[name], "errors": recorder.journey_errors[name]}
+            for name in weights
+        },
+        "overall": summarize(all_samples, sum(recorder.errors.values()), elapsed),
+        "endpoints": {
+            endpoint: {
+                **summarize(samples, recorder.errors[endpoint], elapsed),
+                "status_codes": {str(code): n for code, n in sorted(recorder.status_codes[endpoint].items())},
+            }
+            for endpoint, samples in sorted(recorder.samples.items())
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drive concurrent user journeys against the API")
+    parser.add_argument("--base-url", help="target a running server instead of starting app.main:app")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes for the started server")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="unmeasured seconds before the run")
+    parser.add_argument("--actors", type=int, default=8, help="brand/influencer pairs to sign up")
+    parser.add_argument("--journey", action="append", metavar="NAME=WEIGHT",
+                        help=f"override a journey weight (repeatable): {', '.join(JOURNEYS)}")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="result JSON path (default: benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--compare", help="previous result JSON to diff p95 latency against")
+    args = parser.parse_args()
+    
+    report = asyncio.run(run(args))
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        commit = (report["git"]["commit"] or "nogit")[:10]
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{commit}.json")
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {output}")
+    return 1 if report["overall"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
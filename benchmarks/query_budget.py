@@ -0,0 +1,390 @@
+"""
+Query Budget and Endpoint Timing Regression Check
+Calls every route under /api/v1 in-process (TestClient against a scratch
+SQLite database) and counts the SQL statements each request issues.
+
+Fails when:
+- a request issues more statements than its budget in query_budgets.json
+  (catches N+1 patterns and extra round-trips)
+- a request's median latency regresses beyond --tolerance against the
+  stored baseline in baselines/endpoint_timings.json
+- a route has no case here, so new endpoints can't skip the budget
+
+Run: python benchmarks/query_budget.py
+     python benchmarks/query_budget.py --update-baseline   # after an intended change
+"""
+import argparse
+import atexit
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.join(ROOT_DIR, "benchmarks")
+BUDGETS_PATH = os.path.join(BENCH_DIR, "query_budgets.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baselines", "endpoint_timings.json")
+
+sys.path.insert(0, ROOT_DIR)
+
+# Scratch database; must be configured before the app is imported
+_scratch_dir = tempfile.mkdtemp(prefix="query-budget-")
+atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_scratch_dir, 'budget.db')}"
+os.environ.setdefault("DEBUG", "false")
+# Periodic counter flushes and rescoring would land in whichever case is running
+os.environ.setdefault("COUNTER_FLUSH_SECONDS", "3600")
+os.environ.setdefault("TRENDING_REFRESH_SECONDS", "3600")
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.core.database import async_engine, engine
+from app.core.security import create_access_token, decode_access_token
+from app.main import app
+
+API = "/api/v1"
+
+
+class StatementCounter:
+    """Counts statements on both engines between reset() calls"""
+    
+    def __init__(self):
+        self.count = 0
+        self.statements: List[str] = []
+        for sync_engine in (engine, async_engine.sync_engine):
+            event.listen(sync_engine, "after_cursor_execute", self._on_execute)
+    
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement.split("\n", 1)[0][:120])
+    
+    def reset(self):
+        self.count = 0
+        self.statements = []
+
+
+@dataclass
+class Case:
+    """
+    One request against a route. `send` gets the shared state dict, whose
+    "n" changes on every call so repeated updates still write a row
+    """
+    endpoint: str  # "METHOD /api/v1/route/{template}"
+    send: Callable[[TestClient, dict], object]
+    status: int = 200
+    repeatable: bool = True  # safe to call again for timing samples
+    after: Optional[Callable[[dict, object], None]] = None  # store ids from the response
+
+
+def _auth(state: dict, role: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {state['tokens'][role]}"}
+
+
+def _store(key: str, field: str = "id"):
+    def after(state, response):
+        state[key] = response.json()[field]
+    return after
+
+
+def _store_token(role: str, key: str):
+    def after(state, response):
+        state[key] = response.json()["id"]
+        state["tokens"][role] = response.headers["x-access-token"]
+    return after
+
+
+def _store_login(role: str):
+    def after(state, response):
+        state["tokens"][role] = response.json()["access_token"]
+    return after
+
+
+def _short_lived_token(state: dict, role: str) -> str:
+    """Copy of a role's token that expires in a second, so an event stream ends on its own"""
+    claims = {k: v for k, v in decode_access_token(state["tokens"][role]).items() if k != "exp"}
+    return create_access_token(claims, expires_delta=timedelta(seconds=1))
+
+
+def _register(role: str):
+    return lambda c, s: c.post(f"{API}/auth/register", json={
+        "email": f"{role}@budget.example.com", "username": f"budget-{role}", "password": "pw", "role": role
+    })
+
+
+def _login(role: str):
+    return lambda c, s: c.post(f"{API}/auth/login", data={"username": f"{role}@budget.example.com", "password": "pw"})
+
+
+# In execution order; later cases use ids stored by earlier ones
+CASES: List[Case] = [
+    Case("POST /api/v1/auth/register", _register("brand"), status=201, repeatable=False),
+    Case("POST /api/v1/auth/login", _login("brand"), after=_store_login("brand")),
+    Case("GET /api/v1/auth/me", lambda c, s: c.get(f"{API}/auth/me", headers=_auth(s, "brand"))),
+    Case("POST /api/v1/brands", lambda c, s: c.post(
+        f"{API}/brands", json={"company_name": "Budget Co", "industry": "apparel"}, headers=_auth(s, "brand")
+    ), status=201, repeatable=False, after=_store_token("brand", "brand_id")),
+    Case("POST /api/v1/auth/refresh", lambda c, s: c.post(f"{API}/auth/refresh", headers=_auth(s, "brand"))),
+    Case("GET /api/v1/brands/me", lambda c, s: c.get(f"{API}/brands/me", headers=_auth(s, "brand"))),
+    Case("PUT /api/v1/brands/me", lambda c, s: c.put(
+        f"{API}/brands/me", json={"description": f"Budgeted {s['n']}"}, headers=_auth(s, "brand")
+    )),
+    Case("GET /api/v1/brands", lambda c, s: c.get(f"{API}/brands", params={"limit": 20})),
+    Case("GET /api/v1/brands/{brand_id}", lambda c, s: c.get(f"{API}/brands/{s['brand_id']}")),
+    
+    Case("POST /api/v1/auth/register", _register("influencer"), status=201, repeatable=False,
+         after=_store("influencer_user_id")),
+    Case("POST /api/v1/auth/login", _login("influencer"), after=_store_login("influencer")),
+    Case("POST /api/v1/influencers", lambda c, s: c.post(
+        f"{API}/influencers",
+        json={"full_name": "Budget Creator", "niche": "fashion", "location": "Paris", "total_followers": 5000},
+        headers=_auth(s, "influencer")
+    ), status=201, repeatable=False, after=_store_token("influencer", "influencer_id")),
+    Case("GET /api/v1/influencers/me", lambda c, s: c.get(f"{API}/influencers/me", headers=_auth(s, "influencer"))),
+    Case("PUT /api/v1/influencers/me", lambda c, s: c.put(
+        f"{API}/influencers/me", json={"bio": f"fashion reviews {s['n']}"}, headers=_auth(s, "influencer")
+    )),
+    Case("GET /api/v1/influencers", lambda c, s: c.get(
+        f"{API}/influencers", params={"q": "fashion", "location": "par", "limit": 20}
+    )),
+    Case("GET /api/v1/influencers/{influencer_id}", lambda c, s: c.get(f"{API}/influencers/{s['influencer_id']}")),
+    
+    Case("POST /api/v1/campaigns", lambda c, s: c.post(f"{API}/campaigns", json={
+        "title": "Budget campaign", "budget": 1000, "deadline": "2030-01-01T00:00:00Z",
+        "influencer_id": s["influencer_id"]
+    }, headers=_auth(s, "brand")), status=201, after=_store("campaign_id")),
+    Case("GET /api/v1/campaigns", lambda c, s: c.get(f"{API}/campaigns", headers=_auth(s, "brand"))),
+    Case("GET /api/v1/campaigns/discover", lambda c, s: c.get(f"{API}/campaigns/discover", params={"limit": 20})),
+    Case("GET /api/v1/campaigns/{campaign_id}", lambda c, s: c.get(
+        f"{API}/campaigns/{s['campaign_id']}", headers=_auth(s, "brand")
+    )),
+    Case("PUT /api/v1/campaigns/{campaign_id}", lambda c, s: c.put(
+        f"{API}/campaigns/{s['campaign_id']}", json={"status": "active", "brief": f"Brief {s['n']}"}, headers=_auth(s, "brand")
+    )),
+    Case("POST /api/v1/campaigns", lambda c, s: c.post(f"{API}/campaigns", json={
+        "title": "Budget open deal", "budget": 500, "deadline": "2030-01-01T00:00:00Z"
+    }, headers=_auth(s, "brand")), status=201, repeatable=False, after=_store("open_campaign_id")),
+    Case("PUT /api/v1/campaigns/{campaign_id}", lambda c, s: c.put(
+        f"{API}/campaigns/{s['open_campaign_id']}", json={"status": "active"}, headers=_auth(s, "brand")
+    ), repeatable=False),
+    Case("GET /api/v1/campaigns/{campaign_id}/matches", lambda c, s: c.get(
+        f"{API}/campaigns/{s['campaign_id']}/matches", params={"limit": 20}, headers=_auth(s, "brand")
+    )),
+    Case("GET /api/v1/influencers/me/matches", lambda c, s: c.get(
+        f"{API}/influencers/me/matches", params={"limit": 20}, headers=_auth(s, "influencer")
+    )),
+    Case("POST /api/v1/applications", lambda c, s: c.post(f"{API}/applications", json={
+        "campaign_id": s["open_campaign_id"], "proposal_text": "Budget proposal"
+    }, headers=_auth(s, "influencer")), status=201, repeatable=False, after=_store("application_id")),
+    Case("GET /api/v1/applications", lambda c, s: c.get(
+        f"{API}/applications", params={"campaign_id": s["open_campaign_id"]}, headers=_auth(s, "brand")
+    )),
+    Case("GET /api/v1/applications", lambda c, s: c.get(f"{API}/applications", headers=_auth(s, "influencer"))),
+    Case("POST /api/v1/applications/{application_id}/withdraw", lambda c, s: c.post(
+        f"{API}/applications/{s['application_id']}/withdraw", headers=_auth(s, "influencer")
+    ), repeatable=False),
+    
+    Case("POST /api/v1/tasks", lambda c, s: c.post(f"{API}/tasks", json={
+        "title": "Budget task", "campaign_id": s["campaign_id"], "influencer_id": s["influencer_id"]
+    }, headers=_auth(s, "brand")), status=201, after=_store("task_id")),
+    Case("POST /api/v1/tasks/bulk", lambda c, s: c.post(f"{API}/tasks/bulk", json={
+        "campaign_id": s["campaign_id"],
+        "tasks": [{"title": f"Bulk task {i}", "influencer_id": s["influencer_id"]} for i in range(25)]
+    }, headers=_auth(s, "brand")), status=201),
+    Case("POST /api/v1/tasks/move", lambda c, s: c.post(f"{API}/tasks/move", json={
+        "campaign_id": s["campaign_id"],
+        "moves": [
+            {"task_id": s["task_id"], "status": "in_progress"},
+            {"task_id": s["task_id"] + 1, "status": "in_progress", "after_id": s["task_id"]},
+        ]
+    }, headers=_auth(s, "brand"))),
+    Case("GET /api/v1/tasks", lambda c, s: c.get(
+        f"{API}/tasks", params={"campaign_id": s["campaign_id"]}, headers=_auth(s, "influencer")
+    )),
+    Case("GET /api/v1/tasks/{task_id}", lambda c, s: c.get(f"{API}/tasks/{s['task_id']}", headers=_auth(s, "brand"))),
+    Case("PUT /api/v1/tasks/{task_id}", lambda c, s: c.put(
+        f"{API}/tasks/{s['task_id']}", json={"status": "in_review", "review_notes": f"Note {s['n']}"}, headers=_auth(s, "brand")
+    )),
+    
+    Case("POST /api/v1/content/task/{task_id}", lambda c, s: c.post(
+        f"{API}/content/task/{s['task_id']}", json={"title": "Draft", "content_type": "video"},
+        headers=_auth(s, "influencer")
+    ), status=201, repeatable=False, after=_store("content_id")),
+    Case("GET /api/v1/content/task/{task_id}", lambda c, s: c.get(
+        f"{API}/content/task/{s['task_id']}", headers=_auth(s, "brand")
+    )),
+    Case("GET /api/v1/content/{content_id}", lambda c, s: c.get(
+        f"{API}/content/{s['content_id']}", headers=_auth(s, "brand")
+    )),
+    Case("PUT /api/v1/content/{content_id}", lambda c, s: c.put(
+        f"{API}/content/{s['content_id']}", json={"status": "approved", "review_notes": f"Note {s['n']}"}, headers=_auth(s, "brand")
+    )),
+    
+    Case("GET /api/v1/campaigns/{campaign_id}/board", lambda c, s: c.get(
+        f"{API}/campaigns/{s['campaign_id']}/board", headers=_auth(s, "brand")
+    )),
+    
+    Case("GET /api/v1/exports/campaigns", lambda c, s: c.get(
+        f"{API}/exports/campaigns", params={"format": "csv"}, headers=_auth(s, "brand")
+    )),
+    Case("GET /api/v1/exports/tasks", lambda c, s: c.get(
+        f"{API}/exports/tasks", params={"campaign_id": s["campaign_id"]}, headers=_auth(s, "brand")
+    )),
+    Case("GET /api/v1/exports/roster", lambda c, s: c.get(f"{API}/exports/roster", headers=_auth(s, "brand"))),
+    
+    Case("GET /api/v1/notifications", lambda c, s: c.get(
+        f"{API}/notifications", params={"unread_only": True}, headers=_auth(s, "influencer")
+    )),
+    Case("GET /api/v1/notifications/unread-count", lambda c, s: c.get(
+        f"{API}/notifications/unread-count", headers=_auth(s, "influencer")
+    )),
+    Case("POST /api/v1/notifications/read", lambda c, s: c.post(
+        f"{API}/notifications/read", json={"all": True}, headers=_auth(s, "influencer")
+    )),
+    
+    Case("POST /api/v1/messages", lambda c, s: c.post(f"{API}/messages", json={
+        "recipient_id": s["influencer_user_id"], "content": f"Hello {s['n']}"
+    }, headers=_auth(s, "brand")), status=201, after=_store("conversation_id", "conversation_id")),
+    Case("GET /api/v1/messages/conversations", lambda c, s: c.get(
+        f"{API}/messages/conversations", headers=_auth(s, "influencer")
+    )),
+    Case("GET /api/v1/messages/conversations/{conversation_id}", lambda c, s: c.get(
+        f"{API}/messages/conversations/{s['conversation_id']}", params={"limit": 50}, headers=_auth(s, "influencer")
+    )),
+    Case("POST /api/v1/messages/conversations/{conversation_id}/read", lambda c, s: c.post(
+        f"{API}/messages/conversations/{s['conversation_id']}/read", headers=_auth(s, "influencer")
+    )),
+    
+    Case("GET /api/v1/events/stream", lambda c, s: c.get(
+        f"{API}/events/stream", params={"access_token": _short_lived_token(s, "influencer")}
+    ), repeatable=False),
+    
+    Case("POST /api/v1/auth/register", _register("admin"), status=201, repeatable=False),
+    Case("POST /api/v1/auth/login", _login("admin"), after=_store_login("admin")),
+    Case("GET /api/v1/internal/password-hashing", lambda c, s: c.get(
+        f"{API}/internal/password-hashing", headers=_auth(s, "admin")
+    )),
+    Case("GET /api/v1/internal/db-pool", lambda c, s: c.get(f"{API}/internal/db-pool", headers=_auth(s, "admin"))),
+]
+
+
+def api_endpoints() -> List[str]:
+    """Every METHOD + route template mounted under the API prefix"""
+    endpoints = []
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path.startswith(API):
+            endpoints += [f"{method} {route.path}" for method in sorted(route.methods)]
+    return endpoints
+
+
+def _load(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def run_cases(client: TestClient, counter: StatementCounter, repeat: int):
+    """Returns {endpoint: {"queries": n, "timings_ms": [...], "statements": [...]}}"""
+    state = {"tokens": {}, "n": 0}
+    results: Dict[str, dict] = {}
+    
+    def send(case: Case):
+        state["n"] += 1
+        return case.send(client, state)
+    
+    for case in CASES:
+        counter.reset()
+        response = send(case)
+        if response.status_code != case.status:
+            raise SystemExit(f"{case.endpoint}: expected {case.status}, got {response.status_code} {response.text[:300]}")
+        if case.after:
+            case.after(state, response)
+        # Steady state: principal cache warm, pool connections open
+        if case.repeatable:
+            counter.reset()
+            send(case)
+        result = results.setdefault(case.endpoint, {"queries": 0, "timings_ms": [], "statements": []})
+        if counter.count >= result["queries"]:
+            result["queries"] = counter.count
+            result["statements"] = list(counter.statements)
+        for _ in range(repeat if case.repeatable else 0):
+            started = time.perf_counter()
+            send(case)
+            result["timings_ms"].append((time.perf_counter() - started) * 1000)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-endpoint SQL statement budgets and timing regressions")
+    parser.add_argument("--repeat", type=int, default=20, help="timed samples per repeatable endpoint")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed median slowdown factor vs baseline")
+    parser.add_argument("--slack-ms", type=float, default=2.0, help="absolute slack added to the tolerance")
+    parser.add_argument("--update-baseline", action="store_true", help="rewrite the timing baseline from this run")
+    parser.add_argument("--no-timing", action="store_true", help="only check query budgets (e.g. on noisy CI)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print the statements of over-budget endpoints")
+    args = parser.parse_args()
+    
+    budgets = _load(BUDGETS_PATH)
+    baseline = _load(BASELINE_PATH)
+    counter = StatementCounter()
+    
+    with TestClient(app) as client:
+        results = run_cases(client, counter, 0 if args.no_timing else args.repeat)
+    
+    failures = []
+    uncovered = sorted(set(api_endpoints()) - set(results))
+    for endpoint in uncovered:
+        failures.append(f"{endpoint}: no case in benchmarks/query_budget.py")
+    
+    print(f"{'endpoint':<46} {'queries':>7} {'budget':>6} {'median':>9} {'baseline':>9}")
+    for endpoint, result in sorted(results.items()):
+        budget = budgets.get(endpoint)
+        median = statistics.median(result["timings_ms"]) if result["timings_ms"] else None
+        base = baseline.get(endpoint)
+        flag = ""
+        if budget is None:
+            failures.append(f"{endpoint}: no budget in query_budgets.json ({result['queries']} statements)")
+            flag = " <- no budget"
+        elif result["queries"] > budget:
+            failures.append(f"{endpoint}: {result['queries']} statements, budget {budget}")
+            flag = " <- over budget"
+            if args.verbose:
+                flag += "".join(f"\n      {statement}" for statement in result["statements"])
+        if median is not None and base is not None and not args.update_baseline:
+            if median > base * args.tolerance + args.slack_ms:
+                failures.append(f"{endpoint}: median {median:.2f}ms vs baseline {base:.2f}ms")
+                flag += " <- slower"
+        print(
+            f"{endpoint:<46} {result['queries']:>7} {budget if budget is not None else '-':>6} "
+            f"{f'{median:.2f}ms' if median is not None else '-':>9} {f'{base:.2f}ms' if base is not None else '-':>9}{flag}"
+        )
+    
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        timings = {
+            endpoint: round(statistics.median(result["timings_ms"]), 3)
+            for endpoint, result in sorted(results.items()) if result["timings_ms"]
+        }
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(timings, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote {os.path.relpath(BASELINE_PATH, ROOT_DIR)}")
+    
+    if failures:
+        print(f"\n{len(failures)} failure(s):")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\nAll endpoints within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+List Serialization Benchmark
+Compares the two ways list endpoints can build a response body:
+
+- default: ORM objects -> Pydantic validation (from_attributes) -> json.dumps,
+  as FastAPI does for response_model=List[...]
+- fast: column tuples -> dicts -> orjson (FAST_LIST_SERIALIZATION=true)
+
+The "serialize" section times only body construction for rows already
+loaded from the database; the "endpoint" section times full in-process
+GET requests (TestClient) with the flag off and on.
+
+Runs against the configured DATABASE_URL, which should be seeded first:
+     python benchmarks/generate_data.py --scale 0.01
+     python benchmarks/serialization.py --limit 200 --repeat 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models import Brand, Campaign, Influencer, Task
+from app.schemas.brand import BrandResponse
+from app.schemas.campaign import CampaignResponse
+from app.schemas.influencer import InfluencerResponse
+from app.schemas.task import TaskResponse
+from app.api.v1.serialization import row_serializer
+from benchmarks.generate_data import BENCH_PASSWORD, brand_email
+
+API = "/api/v1"
+
+RESOURCES = [
+    ("brands", Brand, BrandResponse),
+    ("influencers", Influencer, InfluencerResponse),
+    ("campaigns", Campaign, CampaignResponse),
+    ("tasks", Task, TaskResponse),
+]
+
+
+def median_ms(fn: Callable[[], object], repeat: int) -> float:
+    fn()  # warm up
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+async def load_rows(model, schema, limit: int):
+    """The same page as ORM objects and as column tuples"""
+    query = select(model).order_by(model.id).limit(limit)
+    async with AsyncSessionLocal() as db:
+        objects = (await db.execute(query)).scalars().all()
+        tuples = (await db.execute(row_serializer(model, schema).select(query))).all()
+    return objects, tuples
+
+
+def bench_serialize(limit: int, repeat: int) -> List[tuple]:
+    results = []
+    for name, model, schema in RESOURCES:
+        objects, tuples = asyncio.run(load_rows(model, schema, limit))
+        if not objects:
+            continue
+        adapter = TypeAdapter(List[schema])
+        serializer = row_serializer(model, schema)
+        
+        def default_body():
+            data = adapter.dump_python(adapter.validate_python(objects, from_attributes=True), mode="json")
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        
+        def fast_body():
+            return orjson.dumps(serializer.to_dicts(tuples))
+        
+        results.append((name, len(objects), median_ms(default_body, repeat), median_ms(fast_body, repeat)))
+    return results
+
+
+def bench_endpoints(limit: int, repeat: int) -> List[tuple]:
+    results = []
+    with TestClient(app) as client:
+        response = client.post(
+            f"{API}/auth/login", data={"username": brand_email(1), "password": BENCH_PASSWORD}
+        )
+        headers = {}
+        if response.status_code == 200:
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        for name, _, _ in RESOURCES:
+            if name in ("campaigns", "tasks") and not headers:
+                continue
+            
+            def get():
+                r = client.get(f"{API}/{name}", params={"limit": limit}, headers=headers)
+                r.raise_for_status()
+                return r
+            
+            timings = []
+            for fast in (False, True):
+                settings.FAST_LIST_SERIALIZATION = fast
+                timings.append(median_ms(get, repeat))
+            results.append((f"GET /{name}", len(get().json()), *timings))
+    settings.FAST_LIST_SERIALIZATION = False
+    return results
+
+
+def print_table(title: str, rows: List[tuple]):
+    print(f"\n{title}")
+    header = f"{'':<18} {'rows':>6} {'default ms':>11} {'fast ms':>9} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, count, default, fast in rows:
+        print(f"{name:<18} {count:>6} {default:>11.2f} {fast:>9.2f} {default / fast:>7.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare default and fast list serialization")
+    parser.add_argument("--limit", type=int, default=settings.MAX_PAGE_SIZE, help="rows per page")
+    parser.add_argument("--repeat", type=int, default=30, help="timed runs per measurement")
+    args = parser.parse_args()
+    
+    serialize = bench_serialize(args.limit, args.repeat)
+    if not serialize:
+        print("No rows found; seed the database with benchmarks/generate_data.py first")
+        return 1
+    print_table("serialize (body only)", serialize)
+    print_table("endpoint (in-process request)", bench_endpoints(args.limit, args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
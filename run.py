@@ -9,6 +9,8 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        # Event streams stay open indefinitely; don't let them block reloads
+        timeout_graceful_shutdown=5
     )
 
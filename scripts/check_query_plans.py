@@ -0,0 +1,120 @@
+"""
+Query Plan Regression Check
+Runs EXPLAIN QUERY PLAN (SQLite) on the hot queries issued by the list and
+lookup endpoints against a scratch database built from the models, and exits
+non-zero if any of them falls back to a full table scan.
+
+Run: python scripts/check_query_plans.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select, text, tuple_
+from app.core.database import Base
+from app.core.migrations import run_migrations
+from app.models import (
+    User, Brand, Influencer, Campaign, Task, Content,
+    Milestone, Message, DealApplication, Notification, Conversation, ConversationParticipant
+)
+from app.models.campaign import CampaignStatus
+from app.models.task import TaskStatus
+from app.services.export import campaigns_export_query, roster_export_query, tasks_export_query
+from app.services.kanban import next_position_query
+from app.services.messaging import inbox_query
+from app.services.search import build_fts_match, sqlite_fts_query
+
+# (name, statement) pairs mirroring the queries issued by the API
+HOT_QUERIES = [
+    ("login by email", select(User).where(User.email == "a@example.com")),
+    ("brand profile by user", select(Brand.id).where(Brand.user_id == 1)),
+    ("influencer profile by user", select(Influencer.id).where(Influencer.user_id == 1)),
+    ("influencer discovery search", sqlite_fts_query(build_fts_match("style", "fash", "paris"))
+        .where(Influencer.total_followers >= 1000).limit(101)),
+    ("campaigns by brand", select(Campaign).where(Campaign.brand_id == 1, Campaign.id > 0).order_by(Campaign.id).limit(101)),
+    ("discover feed page", select(Campaign).where(
+        Campaign.status == CampaignStatus.ACTIVE, Campaign.influencer_id.is_(None),
+        Campaign.deadline > "2025-01-01", tuple_(Campaign.trending_score, Campaign.id) < (10.0, 1000)
+    ).order_by(Campaign.trending_score.desc(), Campaign.id.desc()).limit(21)),
+    ("campaigns by influencer", select(Campaign).where(Campaign.influencer_id == 1, Campaign.id > 0).order_by(Campaign.id).limit(101)),
+    ("campaigns by status", select(Campaign).where(Campaign.status == CampaignStatus.ACTIVE)),
+    ("tasks by campaign", select(Task).where(Task.campaign_id == 1, Task.id > 0).order_by(Task.id).limit(101)),
+    ("tasks by influencer", select(Task).where(Task.influencer_id == 1, Task.id > 0).order_by(Task.id).limit(101)),
+    ("board column in rank order", select(Task).where(Task.campaign_id == 1, Task.status == TaskStatus.TODO)
+        .order_by(Task.position, Task.id)),
+    ("bottom of board column", select(next_position_query(1, TaskStatus.TODO))),
+    ("content by task", select(Content).where(Content.task_id == 1)),
+    ("campaigns export", campaigns_export_query(1)),
+    ("tasks export", tasks_export_query(1)),
+    ("campaign tasks export", tasks_export_query(1, campaign_id=1)),
+    ("influencer roster export", roster_export_query(1)),
+    ("application by campaign and influencer", select(DealApplication).where(
+        DealApplication.campaign_id == 1, DealApplication.influencer_id == 1)),
+    ("applications by campaign", select(DealApplication).where(
+        DealApplication.campaign_id == 1, DealApplication.id > 0
+    ).order_by(DealApplication.id).limit(101)),
+    ("applications by influencer", select(DealApplication).where(
+        DealApplication.influencer_id == 1, DealApplication.id > 0
+    ).order_by(DealApplication.id).limit(101)),
+    ("unread notifications", select(Notification).where(
+        Notification.user_id == 1, Notification.is_read == False  # noqa: E712
+    ).order_by(Notification.created_at.desc()).limit(20)),
+    ("notification inbox page", select(Notification).where(
+        Notification.user_id == 1, Notification.id < 1000
+    ).order_by(Notification.id.desc()).limit(21)),
+    ("unread inbox page", select(Notification).where(
+        Notification.user_id == 1, Notification.is_read == False  # noqa: E712
+    ).order_by(Notification.id.desc()).limit(21)),
+    ("conversation by key", select(Conversation.id).where(Conversation.key == "0:1:2")),
+    ("conversation inbox page", inbox_query(1).where(ConversationParticipant.last_message_id < 1000)
+        .order_by(ConversationParticipant.last_message_id.desc()).limit(21)),
+    ("conversation history page", select(Message).where(
+        Message.conversation_id == 1, Message.id < 1000
+    ).order_by(Message.id.desc()).limit(21)),
+    ("unread badge", select(User.unread_notification_count).where(User.id == 1)),
+    ("messages by recipient", select(Message).where(Message.recipient_id == 1).order_by(Message.created_at.desc()).limit(20)),
+    ("milestones by campaign", select(Milestone).where(Milestone.campaign_id == 1).order_by(Milestone.due_date)),
+]
+
+
+def is_full_scan(detail: str) -> bool:
+    """A plan step that reads a whole table without an index"""
+    detail = detail.upper()
+    if not detail.startswith("SCAN ") or detail == "SCAN CONSTANT ROW":
+        return False
+    return not any(
+        marker in detail
+        for marker in ("USING INDEX", "USING COVERING INDEX", "USING INTEGER PRIMARY KEY", "VIRTUAL TABLE INDEX")
+    )
+
+
+def main() -> int:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    
+    failures = []
+    with engine.connect() as conn:
+        conn.execute(text("ANALYZE"))
+        for name, statement in HOT_QUERIES:
+            compiled = statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+            details = [row[-1] for row in plan]
+            scans = [detail for detail in details if is_full_scan(detail)]
+            status = "SCAN" if scans else "ok"
+            print(f"[{status:>4}] {name}: {' | '.join(details)}")
+            if scans:
+                failures.append(name)
+    
+    if failures:
+        print(f"\n{len(failures)} hot quer{'y' if len(failures) == 1 else 'ies'} regressed to a full table scan:")
+        for name in failures:
+            print(f"  - {name}")
+        return 1
+    print("\nAll hot queries use an index.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())